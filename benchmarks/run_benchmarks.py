@@ -0,0 +1,197 @@
+"""
+Offline benchmarks for representative HubSpot tools.
+
+Runs each scenario against ``MockHubspot`` served on a local socket, so the
+full client stack (connection pool, rate limiter, retries, JSON handling) is
+exercised without network access. Prints throughput and p50/p99 latency per
+tool and can fail when results regress against a saved baseline:
+
+    python benchmarks/run_benchmarks.py --calls 200 --concurrency 8 --latency 0.02
+    python benchmarks/run_benchmarks.py --json baseline.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+from unittest.mock import MagicMock
+
+from universal_mcp_hubspot.app import HubspotApp
+from universal_mcp_hubspot.rate_limit import RateLimiter
+from universal_mcp_hubspot.retry import RetryPolicy
+
+# The mock server is test-only code and lives with the tests, outside the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+from mock_server import MockHubspot  # noqa: E402
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def scenarios(app: HubspotApp) -> dict[str, Callable[[int], Awaitable[Any]]]:
+    """One coroutine factory per benchmarked tool, taking the call number."""
+
+    async def get_contacts(call: int) -> Any:
+        return await app.crm.aget_contacts(limit=100, after=str((call * 100) % 900), properties=["email"])
+
+    async def search_deals(call: int) -> Any:
+        return await app.crm.asearch_deals(
+            100,
+            str((call * 100) % 500),
+            [{"propertyName": "amount", "direction": "DESCENDING"}],
+            ["dealname", "amount", "dealstage"],
+            [{"filters": [{"propertyName": "amount", "operator": "GT", "value": "5000"}]}],
+        )
+
+    async def create_contacts_batch(call: int) -> Any:
+        inputs = [
+            {"properties": {"email": f"bench{call}-{index}@example.com"}} for index in range(100)
+        ]
+        return await app.crm.acreate_contacts_batch(inputs)
+
+    async def fetch_list_memberships(call: int) -> Any:
+        return await app.afetch_list_memberships("1", after=str((call * 250) % 750), limit=250)
+
+    return {
+        "get_contacts": get_contacts,
+        "search_deals": search_deals,
+        "create_contacts_batch": create_contacts_batch,
+        "fetch_list_memberships": fetch_list_memberships,
+    }
+
+
+async def run_scenario(
+    name: str, factory: Callable[[int], Awaitable[Any]], calls: int, concurrency: int
+) -> dict[str, Any]:
+    """Run ``calls`` invocations with at most ``concurrency`` in flight and summarize latencies."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(calls))
+
+    async def worker() -> None:
+        nonlocal errors
+        for call in counter:
+            started = time.perf_counter()
+            try:
+                await factory(call)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "tool": name,
+        "calls": calls,
+        "errors": errors,
+        "throughput": calls / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> List[dict[str, Any]]:
+    mock = MockHubspot(
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "benchmark"}
+    results = []
+    with mock.serve() as base_url:
+        app = HubspotApp(
+            integration=integration,
+            rate_limiter=RateLimiter(enabled=args.rate_limit),
+            retry_policy=RetryPolicy(backoff_base=args.backoff, max_attempts=args.max_attempts),
+        )
+        app.base_url = base_url
+        selected = scenarios(app)
+        for name in args.tools or list(selected):
+            # Warm up the connection pool so the first calls do not skew p99
+            await selected[name](0)
+            served = sum(mock.requests.values())
+            throttled = mock.throttled
+            result = await run_scenario(name, selected[name], args.calls, args.concurrency)
+            result["requests"] = sum(mock.requests.values()) - served
+            result["throttled"] = mock.throttled - throttled
+            results.append(result)
+        await app.aclose()
+    return results
+
+
+def report(results: List[dict[str, Any]]) -> str:
+    header = f"{'tool':<24}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'requests':>10}{'429s':>7}{'errors':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['tool']:<24}{result['throughput']:>10.1f}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['requests']:>10}{result['throttled']:>7}{result['errors']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def regressions(
+    results: List[dict[str, Any]], baseline: List[dict[str, Any]], tolerance: float
+) -> List[str]:
+    """Tools whose throughput dropped or p99 latency grew by more than ``tolerance``."""
+    previous = {result["tool"]: result for result in baseline}
+    found = []
+    for result in results:
+        before = previous.get(result["tool"])
+        if before is None:
+            continue
+        if result["throughput"] < before["throughput"] * (1 - tolerance):
+            found.append(f"{result['tool']}: throughput {before['throughput']:.1f} -> {result['throughput']:.1f} calls/s")
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            found.append(f"{result['tool']}: p99 {before['p99_ms']:.2f} -> {result['p99_ms']:.2f} ms")
+    return found
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", nargs="*", help="Subset of tools to benchmark")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight at once")
+    parser.add_argument("--latency", type=float, default=0.005, help="Server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra server latency in seconds")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--backoff", type=float, default=0.05, help="Client retry backoff base in seconds")
+    parser.add_argument("--max-attempts", type=int, default=4, help="Client attempts per call")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the client-side rate limiter enabled")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Compare against results saved with --json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    print(report(results))
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+    if args.baseline:
+        with open(args.baseline) as handle:
+            found = regressions(results, json.load(handle), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -57,8 +57,12 @@ echo "Version bumped from $CURRENT_VERSION to $NEW_VERSION"
 echo "Generating tools README for src/universal_mcp_hubspot/app.py..."
 universal_mcp readme src/universal_mcp_hubspot/app.py
 
+# Precompute tool descriptions and schemas so the server starts without introspecting every tool
+echo "Generating tool manifest..."
+python -m universal_mcp_hubspot.manifest
+
 # Stage the changed file
-git add pyproject.toml src/universal_mcp_hubspot/README.md
+git add pyproject.toml src/universal_mcp_hubspot/README.md src/universal_mcp_hubspot/tool_manifest.json
 
 # Commit the change
 git commit -m "bump: version $CURRENT_VERSION → $NEW_VERSION"
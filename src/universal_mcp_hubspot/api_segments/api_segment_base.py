@@ -1,10 +1,35 @@
-
 from typing import Any
 
-class APISegmentBase:
+from universal_mcp_hubspot.instrumentation import RequestHook
+from universal_mcp_hubspot.transport import AsyncTwinsMixin, no_async_twin
+
+
+class APISegmentBase(AsyncTwinsMixin):
     def __init__(self, main_app_client: Any):
         self.main_app_client = main_app_client
 
+    @property
+    def _transport_app(self) -> Any:
+        return self.main_app_client
+
+    @property
+    def request_hooks(self) -> list:
+        """Instrumentation hooks of the owning app, shared by every segment."""
+        return self.main_app_client.request_hooks
+
+    @no_async_twin
+    def add_request_hook(self, hook: RequestHook) -> RequestHook:
+        """
+        Register instrumentation on the owning app; see ``HubspotApp.add_request_hook``.
+
+        Args:
+            hook (RequestHook): Hook receiving ``on_request``, ``on_response`` and ``on_error`` events
+
+        Returns:
+            RequestHook: The hook, for chaining
+        """
+        return self.main_app_client.add_request_hook(hook)
+
     def _get(self, url: str, params: dict = None, **kwargs):
         return self.main_app_client._get(url, params=params, **kwargs)
 
@@ -7147,6 +7147,48 @@ class CrmApi(APISegmentBase):
         response = self._get(url, params=query_params)
         return self._handle_response(response)
 
+    def batch_read_associations(
+        self, fromObjectType: str, toObjectType: str, inputs: List[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+
+        Reads the associations of up to 1,000 records of one object type to another object type in a single request, returning the associated record IDs with their association types.
+
+        Args:
+            fromObjectType (string): fromObjectType
+            toObjectType (string): toObjectType
+            inputs (array): Records to read associations for, as objects with an "id" key.
+
+        Returns:
+            dict[str, Any]: successful operation
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+        Tags:
+            Batch
+        """
+        if fromObjectType is None:
+            raise ValueError("Missing required parameter 'fromObjectType'.")
+        if toObjectType is None:
+            raise ValueError("Missing required parameter 'toObjectType'.")
+        request_body_data = None
+        request_body_data = {
+            "inputs": inputs,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
+        }
+        url = f"{self.main_app_client.base_url}/crm/v4/associations/{fromObjectType}/{toObjectType}/batch/read"
+        query_params = {}
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
+        return self._handle_response(response)
+
     def list_tools(self):
         return [
             self.batch_read_emails,
@@ -7334,4 +7376,5 @@ class CrmApi(APISegmentBase):
             self.create_crm_import,
             self.get_owners_list,
             self.get_association_types_by_object_types,
+            self.batch_read_associations,
         ]
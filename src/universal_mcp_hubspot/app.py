@@ -2,16 +2,275 @@ from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 from universal_mcp_hubspot.api_segments.crm_api import CrmApi
 from universal_mcp_hubspot.api_segments.marketing_api import MarketingApi
-from typing import List, Optional, Any
+from universal_mcp_hubspot.associations import AssociationGraph
+from universal_mcp_hubspot.caching import MetadataCache
+from universal_mcp_hubspot.coalescing import ReadCoalescer
+from universal_mcp_hubspot.instrumentation import RequestHook, fail_request, finish_request, start_request
+from universal_mcp_hubspot.mirror import CrmMirror
+from universal_mcp_hubspot.owners import OwnerDirectory
+from universal_mcp_hubspot.pipelines import PipelineIndex
+from universal_mcp_hubspot.pool import PoolConfig, pool_stats
+from universal_mcp_hubspot.rate_limit import RateLimiter
+from universal_mcp_hubspot.retry import READ_ONLY_POST_SUFFIXES, RetryPolicy
+from universal_mcp_hubspot.timeline import TimelineTemplates
+from universal_mcp_hubspot.tool_filter import APP_SEGMENT, ToolFilter
+from universal_mcp_hubspot.transport import AsyncTwinsMixin, PendingRequest, capture_request, current_tool_call, no_async_twin
+from typing import Callable, List, Optional, Any
 from datetime import datetime, timezone
+import asyncio
+import time
 
-class HubspotApp(APIApplication):
+import httpx
 
-    def __init__(self, integration: Integration=None, **kwargs) -> None:
+
+class HubspotApp(AsyncTwinsMixin, APIApplication):
+
+    def __init__(self, integration: Integration=None, async_tools: bool = False, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None, coalesce_reads: bool = False, metadata_cache: Optional[MetadataCache] = None, pool: Optional[PoolConfig] = None, request_hooks: Optional[List[RequestHook]] = None, tool_filter: Optional[ToolFilter] = None, mirror: Optional[CrmMirror] = None, **kwargs) -> None:
         super().__init__(name='hubspot', integration=integration, **kwargs)
         self.base_url = 'https://api.hubapi.com'
+        self.pool_config = pool or PoolConfig(timeout=self.default_timeout)
+        self.pool_timeouts = 0
+        self.async_tools = async_tools
+        # Restricts the tools returned by list_tools, e.g. ToolFilter(tags=["Search"])
+        self.tool_filter = tool_filter
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metadata_cache = metadata_cache or MetadataCache()
+        # Called with the URL path of every successful write, to invalidate derived state
+        self.mutation_listeners: List[Callable[[str], Any]] = [self.metadata_cache.invalidate]
+        # Instrumentation, e.g. PrometheusExporter or OpenTelemetryHook
+        self.request_hooks: List[RequestHook] = list(request_hooks or [])
+        # Called with every successful request and its response, e.g. by CrmMirror
+        self.response_listeners: List[Callable[[httpx.Request, httpx.Response], Any]] = []
+        self._async_client: Optional[httpx.AsyncClient] = None
         self.crm = CrmApi(self)
         self.marketing = MarketingApi(self)
+        self.coalescer: Optional[ReadCoalescer] = None
+        if coalesce_reads:
+            self.coalescer = ReadCoalescer(self.crm)
+            self.coalescer.install()
+        self.pipelines = PipelineIndex(self)
+        self.mutation_listeners.append(self.pipelines.invalidate_path)
+        self.owners = OwnerDirectory(self)
+        self.associations = AssociationGraph(self)
+        self.mutation_listeners.append(self.associations.invalidate_path)
+        self.timeline_templates = TimelineTemplates(self)
+        self.mutation_listeners.append(self.timeline_templates.invalidate_path)
+        self.mirror: Optional[CrmMirror] = None
+        if mirror is not None:
+            mirror.attach(self)
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Shared keep-alive ``httpx.Client`` configured from ``pool_config``.
+        """
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                **self.pool_config.client_kwargs(),
+            )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Shared keep-alive ``httpx.AsyncClient`` used by every ``a``-prefixed async tool twin.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                **self.pool_config.client_kwargs(),
+            )
+        return self._async_client
+
+    @property
+    def pool_stats(self) -> dict[str, Any]:
+        """
+        Connection-pool snapshot of both clients, for sizing ``PoolConfig`` under load.
+        """
+        return {
+            "sync": pool_stats(self._client),
+            "async": pool_stats(self._async_client),
+            "pool_timeouts": self.pool_timeouts,
+        }
+
+    @no_async_twin
+    def add_request_hook(self, hook: RequestHook) -> RequestHook:
+        """
+        Register instrumentation called around every request of every segment.
+
+        Args:
+            hook (RequestHook): Hook receiving ``on_request``, ``on_response`` and ``on_error`` events
+
+        Returns:
+            RequestHook: The hook, for chaining
+        """
+        self.request_hooks.append(hook)
+        return hook
+
+    def close(self) -> None:
+        """Close the synchronous HTTP client and release its pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close both HTTP clients and release their pooled connections."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        content_type: Optional[str] = None,
+        files: Any = None,
+    ) -> httpx.Request:
+        kwargs: dict[str, Any] = {"params": params, "timeout": self.pool_config.timeout_for(method)}
+        if method in ("POST", "PUT"):
+            content_type = content_type or "application/json"
+            headers = self._get_headers().copy()
+            if content_type == "multipart/form-data":
+                # httpx sets the multipart Content-Type together with its boundary
+                headers.pop("Content-Type", None)
+                kwargs.update(data=data, files=files)
+            else:
+                headers["Content-Type"] = content_type
+                if content_type == "application/json":
+                    kwargs["json"] = data
+                elif content_type == "application/x-www-form-urlencoded":
+                    kwargs["data"] = data
+                else:
+                    kwargs["content"] = data
+            kwargs["headers"] = headers
+        elif method == "PATCH":
+            kwargs["json"] = data
+        call = current_tool_call()
+        if call is not None:
+            kwargs["extensions"] = {"hubspot_tool_call": call}
+        request = self.client.build_request(method, url, **kwargs)
+        if content_type == "multipart/form-data" and hasattr(request.stream, "get_headers"):
+            # The client's default JSON Content-Type would otherwise hide the multipart boundary
+            request.headers.update(request.stream.get_headers())
+        return request
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        request = self._build_request(method, url, **kwargs)
+        pending = capture_request(request)
+        if pending is not None:
+            return pending
+        return self._send(request)
+
+    def _lookup(self, request: httpx.Request) -> Optional[httpx.Response]:
+        cached = self.metadata_cache.lookup(request)
+        if cached is None and self.mirror is not None:
+            cached = self.mirror.lookup(request)
+        return cached
+
+    def _observe(self, request: httpx.Request, response: httpx.Response) -> None:
+        if not response.is_success:
+            return
+        for response_listener in self.response_listeners:
+            response_listener(request, response)
+        if request.method == "GET":
+            self.metadata_cache.store(request, response)
+        elif not request.url.path.rstrip("/").endswith(READ_ONLY_POST_SUFFIXES):
+            for listener in self.mutation_listeners:
+                listener(request.url.path)
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        hooks = self.request_hooks
+        event = start_request(hooks, request) if hooks else None
+        cached = self._lookup(request)
+        if cached is not None:
+            if event is not None:
+                finish_request(hooks, event, cached, 0, cached=True)
+            return cached
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(request.url.path)
+            try:
+                response = self.client.send(request)
+            except httpx.TransportError as exc:
+                if isinstance(exc, httpx.PoolTimeout):
+                    self.pool_timeouts += 1
+                delay = self.retry_policy.delay_for_error(request, exc, attempt)
+                if delay is None:
+                    if event is not None:
+                        fail_request(hooks, event, exc, attempt)
+                    raise
+            else:
+                self.rate_limiter.update(response.status_code, response.headers)
+                delay = self.retry_policy.delay_for_response(request, response, attempt)
+                if delay is None:
+                    self._observe(request, response)
+                    if event is not None:
+                        finish_request(hooks, event, response, attempt)
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    async def _asend(self, request: httpx.Request) -> httpx.Response:
+        hooks = self.request_hooks
+        event = start_request(hooks, request) if hooks else None
+        cached = self._lookup(request)
+        if cached is not None:
+            if event is not None:
+                finish_request(hooks, event, cached, 0, cached=True)
+            return cached
+        attempt = 0
+        while True:
+            await self.rate_limiter.aacquire(request.url.path)
+            try:
+                response = await self.async_client.send(request)
+            except httpx.TransportError as exc:
+                if isinstance(exc, httpx.PoolTimeout):
+                    self.pool_timeouts += 1
+                delay = self.retry_policy.delay_for_error(request, exc, attempt)
+                if delay is None:
+                    if event is not None:
+                        fail_request(hooks, event, exc, attempt)
+                    raise
+            else:
+                self.rate_limiter.update(response.status_code, response.headers)
+                delay = self.retry_policy.delay_for_response(request, response, attempt)
+                if delay is None:
+                    self._observe(request, response)
+                    if event is not None:
+                        finish_request(hooks, event, response, attempt)
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _get(self, url: str, params: Optional[dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return self._request("GET", url, params=params)
+
+    def _post(self, url: str, data: Any = None, params: Optional[dict[str, Any]] = None, content_type: Optional[str] = None, files: Any = None, **kwargs: Any) -> Any:
+        return self._request("POST", url, data=data, params=params, content_type=content_type, files=files)
+
+    def _put(self, url: str, data: Any = None, params: Optional[dict[str, Any]] = None, content_type: Optional[str] = None, files: Any = None, **kwargs: Any) -> Any:
+        return self._request("PUT", url, data=data, params=params, content_type=content_type, files=files)
+
+    def _patch(self, url: str, data: Any = None, params: Optional[dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return self._request("PATCH", url, data=data, params=params)
+
+    def _delete(self, url: str, params: Optional[dict[str, Any]] = None, **kwargs: Any) -> Any:
+        return self._request("DELETE", url, params=params)
+
+    def _handle_response(self, response: Any) -> Any:
+        if isinstance(response, PendingRequest):
+            # Async twins send the captured request themselves
+            return response
+        return super()._handle_response(response)
     
     def add_a_note(
         self,
@@ -342,7 +601,7 @@ class HubspotApp(APIApplication):
 
 
     def list_tools(self):
-        all_tools = [
+        app_tools = [
          self.add_a_note,
          self.fetch_multiple_lists,
          self.fetch_list_memberships,
@@ -353,6 +612,10 @@ class HubspotApp(APIApplication):
          self.remove_records_from_list,
          self.search_lists, 
          self.fetch_list_by_name]
-        all_tools.extend(self.crm.list_tools())
-        all_tools.extend(self.marketing.list_tools())
+        segments = [(APP_SEGMENT, app_tools), ("crm", self.crm.list_tools()), ("marketing", self.marketing.list_tools())]
+        all_tools = []
+        for segment, tools in segments:
+            all_tools.extend(self.tool_filter.filter(segment, tools) if self.tool_filter else tools)
+        if self.async_tools:
+            all_tools = [getattr(tool.__self__, f"a{tool.__name__}") for tool in all_tools]
         return all_tools
\ No newline at end of file
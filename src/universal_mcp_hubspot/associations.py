@@ -0,0 +1,403 @@
+import threading
+import time
+from typing import Any, Iterable, List, Optional, Union
+
+from universal_mcp_hubspot.batching import DEFAULT_CONCURRENCY, arun_batch, run_batch
+
+DEFAULT_ASSOCIATION_TTL_SECONDS = 300.0
+
+AssociationTypes = Optional[Iterable[Union[int, str]]]
+
+
+class Hop:
+    """
+    One step of an association traversal.
+
+    Attributes:
+        object_type (str): Object type reached by this hop, e.g. ``companies``
+        edges (dict[str, List[str]]): Record IDs of the previous hop mapped to the associated IDs of ``object_type``
+        records (dict[str, dict[str, Any]]): Records of ``object_type`` by ID, when they were read
+    """
+
+    def __init__(
+        self,
+        object_type: str,
+        edges: dict[str, List[str]],
+        records: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> None:
+        self.object_type = object_type
+        self.edges = edges
+        self.records = records or {}
+
+    @property
+    def ids(self) -> List[str]:
+        """Distinct IDs reached by this hop, in first-seen order."""
+        return list(dict.fromkeys(record_id for targets in self.edges.values() for record_id in targets))
+
+
+class AssociationGraph:
+    """
+    Cached adjacency of CRM associations with batched multi-hop traversal.
+
+    Resolving the ``associations`` of N records with single-record getters
+    costs N requests per hop. The graph instead reads the associations of a
+    whole frontier with ``batch_read_associations`` (1,000 records per
+    request) and the associated records with ``read_batch_objects`` (100 per
+    request), so deal -> companies -> contacts costs one batched round per
+    hop. Records with more than 500 associations of one type are paged by
+    HubSpot; the remaining pages are read in further batches. Edges are cached per ``(fromObjectType, toObjectType)`` pair and
+    record for ``ttl`` seconds; writes that touch either object type drop the
+    pair. Association types come from ``get_association_types_by_object_types``
+    (cached in ``app.metadata_cache``) and can filter edges by label or ID.
+
+    Args:
+        app (Any): The ``HubspotApp`` whose CRM segment is used
+        ttl (float): Seconds cached edges stay valid. 0 disables caching.
+        max_concurrency (int): Batch requests in flight per hop
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        ttl: float = DEFAULT_ASSOCIATION_TTL_SECONDS,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        # (fromObjectType, toObjectType) -> from ID -> (expiry, [(to ID, association type IDs)])
+        self._edges: dict[tuple[str, str], dict[str, tuple[float, List[tuple[str, frozenset[int]]]]]] = {}
+
+    # Association types
+
+    @staticmethod
+    def _type_ids(response: dict[str, Any], from_type: str, to_type: str, wanted: AssociationTypes) -> Optional[frozenset[int]]:
+        types = response.get("results") or []
+        if not types:
+            raise ValueError(f"{from_type} cannot be associated with {to_type}.")
+        if wanted is None:
+            return None
+        by_name = {}
+        for association_type in types:
+            for key in ("name", "label"):
+                if association_type.get(key):
+                    by_name[str(association_type[key]).lower()] = int(association_type.get("id", association_type.get("typeId")))
+        ids = set()
+        for value in wanted:
+            if isinstance(value, int) or str(value).isdigit():
+                ids.add(int(value))
+            elif str(value).lower() in by_name:
+                ids.add(by_name[str(value).lower()])
+            else:
+                raise ValueError(f"Unknown association type {value!r} from {from_type} to {to_type}.")
+        return frozenset(ids)
+
+    def association_types(self, from_type: str, to_type: str, wanted: AssociationTypes = None) -> Optional[frozenset[int]]:
+        """
+        Validate an association hop and resolve association type names to IDs.
+
+        Args:
+            from_type (str): Object type the hop starts from
+            to_type (str): Object type the hop leads to
+            wanted (Optional[Iterable[Union[int, str]]]): Association type IDs, names or labels to keep, or None for all
+
+        Returns:
+            Optional[frozenset[int]]: Type IDs to keep, or None for every type
+
+        Raises:
+            ValueError: Raised when the object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        response = self.app.crm.get_association_types_by_object_types(from_type, to_type)
+        return self._type_ids(response, from_type, to_type, wanted)
+
+    async def aassociation_types(self, from_type: str, to_type: str, wanted: AssociationTypes = None) -> Optional[frozenset[int]]:
+        """
+        Async counterpart of ``association_types``.
+
+        Args:
+            from_type (str): Object type the hop starts from
+            to_type (str): Object type the hop leads to
+            wanted (Optional[Iterable[Union[int, str]]]): Association type IDs, names or labels to keep, or None for all
+
+        Returns:
+            Optional[frozenset[int]]: Type IDs to keep, or None for every type
+
+        Raises:
+            ValueError: Raised when the object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        response = await self.app.crm.aget_association_types_by_object_types(from_type, to_type)
+        return self._type_ids(response, from_type, to_type, wanted)
+
+    # Edges
+
+    def _cached(self, pair: tuple[str, str], ids: List[str]) -> tuple[dict[str, List[tuple[str, frozenset[int]]]], List[str]]:
+        now = time.monotonic()
+        found, missing = {}, []
+        with self._lock:
+            adjacency = self._edges.get(pair, {})
+            for record_id in ids:
+                entry = adjacency.get(record_id)
+                if entry is not None and entry[0] > now:
+                    found[record_id] = entry[1]
+                else:
+                    missing.append(record_id)
+        return found, missing
+
+    @staticmethod
+    def _next_pages(response: dict[str, Any]) -> List[dict[str, Any]]:
+        # Each record's associations are paged on their own (500 per page)
+        return [
+            {"id": str(result["from"]["id"]), "after": result["paging"]["next"]["after"]}
+            for result in response.get("results") or []
+            if ((result.get("paging") or {}).get("next") or {}).get("after")
+        ]
+
+    def _store(self, pair: tuple[str, str], ids: List[str], results: List[dict[str, Any]]) -> dict[str, List[tuple[str, frozenset[int]]]]:
+        edges: dict[str, List[tuple[str, frozenset[int]]]] = {record_id: [] for record_id in ids}
+        for result in results:
+            targets = edges.setdefault(str(result["from"]["id"]), [])
+            for target in result.get("to") or []:
+                type_ids = frozenset(int(item["typeId"]) for item in target.get("associationTypes") or [])
+                targets.append((str(target["toObjectId"]), type_ids))
+        if self.ttl > 0:
+            expiry = time.monotonic() + self.ttl
+            with self._lock:
+                adjacency = self._edges.setdefault(pair, {})
+                for record_id, targets in edges.items():
+                    adjacency[record_id] = (expiry, targets)
+        return edges
+
+    @staticmethod
+    def _select(edges: dict[str, List[tuple[str, frozenset[int]]]], ids: List[str], type_ids: Optional[frozenset[int]]) -> dict[str, List[str]]:
+        return {
+            record_id: list(dict.fromkeys(
+                target for target, types in edges.get(record_id, []) if type_ids is None or types & type_ids
+            ))
+            for record_id in ids
+        }
+
+    def neighbors(
+        self,
+        from_type: str,
+        ids: Iterable[Any],
+        to_type: str,
+        association_types: AssociationTypes = None,
+    ) -> dict[str, List[str]]:
+        """
+        Associated record IDs of many records, reading only uncached ones in batches.
+
+        Args:
+            from_type (str): Object type of ``ids``, e.g. ``deals``
+            ids (Iterable[Any]): Record IDs
+            to_type (str): Associated object type, e.g. ``companies``
+            association_types (Optional[Iterable[Union[int, str]]]): Keep only these association type IDs, names or labels
+
+        Returns:
+            dict[str, List[str]]: Every requested ID mapped to its associated IDs (empty when there are none)
+
+        Raises:
+            ValueError: Raised when the object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        ids = list(dict.fromkeys(str(record_id) for record_id in ids))
+        type_ids = self.association_types(from_type, to_type, association_types)
+        pair = (from_type, to_type)
+        edges, missing = self._cached(pair, ids)
+        if missing:
+            results: List[dict[str, Any]] = []
+            inputs = [{"id": record_id} for record_id in missing]
+            while inputs:
+                response = run_batch(
+                    self.app.crm.batch_read_associations,
+                    inputs,
+                    max_concurrency=self.max_concurrency,
+                    raise_on_error=True,
+                    fromObjectType=from_type,
+                    toObjectType=to_type,
+                )
+                results.extend(response.get("results") or [])
+                inputs = self._next_pages(response)
+            edges.update(self._store(pair, missing, results))
+        return self._select(edges, ids, type_ids)
+
+    async def aneighbors(
+        self,
+        from_type: str,
+        ids: Iterable[Any],
+        to_type: str,
+        association_types: AssociationTypes = None,
+    ) -> dict[str, List[str]]:
+        """
+        Async counterpart of ``neighbors``.
+
+        Args:
+            from_type (str): Object type of ``ids``, e.g. ``deals``
+            ids (Iterable[Any]): Record IDs
+            to_type (str): Associated object type, e.g. ``companies``
+            association_types (Optional[Iterable[Union[int, str]]]): Keep only these association type IDs, names or labels
+
+        Returns:
+            dict[str, List[str]]: Every requested ID mapped to its associated IDs (empty when there are none)
+
+        Raises:
+            ValueError: Raised when the object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        ids = list(dict.fromkeys(str(record_id) for record_id in ids))
+        type_ids = await self.aassociation_types(from_type, to_type, association_types)
+        pair = (from_type, to_type)
+        edges, missing = self._cached(pair, ids)
+        if missing:
+            results: List[dict[str, Any]] = []
+            inputs = [{"id": record_id} for record_id in missing]
+            while inputs:
+                response = await arun_batch(
+                    self.app.crm.batch_read_associations,
+                    inputs,
+                    max_concurrency=self.max_concurrency,
+                    raise_on_error=True,
+                    fromObjectType=from_type,
+                    toObjectType=to_type,
+                )
+                results.extend(response.get("results") or [])
+                inputs = self._next_pages(response)
+            edges.update(self._store(pair, missing, results))
+        return self._select(edges, ids, type_ids)
+
+    # Traversal
+
+    @staticmethod
+    def _hop_options(path: List[str], association_types: Optional[dict[str, AssociationTypes]]) -> List[AssociationTypes]:
+        return [(association_types or {}).get(object_type) for object_type in path]
+
+    def _records_kwargs(self, object_type: str, properties: Optional[dict[str, List[str]]]) -> dict[str, Any]:
+        return {"objectType": object_type, "properties": (properties or {}).get(object_type) or [], "propertiesWithHistory": []}
+
+    def traverse(
+        self,
+        start_type: str,
+        ids: Iterable[Any],
+        path: List[str],
+        properties: Optional[dict[str, List[str]]] = None,
+        association_types: Optional[dict[str, AssociationTypes]] = None,
+        read_records: bool = True,
+    ) -> List[Hop]:
+        """
+        Follow associations along ``path`` with one batched round per hop.
+
+        Args:
+            start_type (str): Object type of ``ids``, e.g. ``deals``
+            ids (Iterable[Any]): Record IDs to start from
+            path (List[str]): Object types to visit in order, e.g. ``["companies", "contacts"]``
+            properties (Optional[dict[str, List[str]]]): Properties to read per object type. HubSpot's defaults when missing.
+            association_types (Optional[dict[str, Iterable[Union[int, str]]]]): Association types to follow per target object type, e.g. ``{"contacts": ["Decision maker"]}``
+            read_records (bool): Read the records reached by each hop through ``read_batch_objects``
+
+        Returns:
+            List[Hop]: One hop per entry of ``path``
+
+        Raises:
+            ValueError: Raised when two consecutive object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+        Example:
+            >>> hops = app.associations.traverse("deals", ["101"], ["companies", "contacts"], properties={"contacts": ["email"]})
+            >>> [contact["properties"]["email"] for contact in hops[-1].records.values()]
+        """
+        hops: List[Hop] = []
+        frontier, current = [str(record_id) for record_id in ids], start_type
+        for object_type, types in zip(path, self._hop_options(path, association_types)):
+            hop = Hop(object_type, self.neighbors(current, frontier, object_type, types))
+            if read_records and hop.ids:
+                response = run_batch(
+                    self.app.crm.read_batch_objects,
+                    ({"id": record_id} for record_id in hop.ids),
+                    max_concurrency=self.max_concurrency,
+                    raise_on_error=True,
+                    **self._records_kwargs(object_type, properties),
+                )
+                hop.records = {str(record["id"]): record for record in response.get("results") or []}
+            hops.append(hop)
+            frontier, current = hop.ids, object_type
+        return hops
+
+    async def atraverse(
+        self,
+        start_type: str,
+        ids: Iterable[Any],
+        path: List[str],
+        properties: Optional[dict[str, List[str]]] = None,
+        association_types: Optional[dict[str, AssociationTypes]] = None,
+        read_records: bool = True,
+    ) -> List[Hop]:
+        """
+        Async counterpart of ``traverse``.
+
+        Args:
+            start_type (str): Object type of ``ids``, e.g. ``deals``
+            ids (Iterable[Any]): Record IDs to start from
+            path (List[str]): Object types to visit in order, e.g. ``["companies", "contacts"]``
+            properties (Optional[dict[str, List[str]]]): Properties to read per object type. HubSpot's defaults when missing.
+            association_types (Optional[dict[str, Iterable[Union[int, str]]]]): Association types to follow per target object type
+            read_records (bool): Read the records reached by each hop through ``read_batch_objects``
+
+        Returns:
+            List[Hop]: One hop per entry of ``path``
+
+        Raises:
+            ValueError: Raised when two consecutive object types cannot be associated or a type name is unknown.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        hops: List[Hop] = []
+        frontier, current = [str(record_id) for record_id in ids], start_type
+        for object_type, types in zip(path, self._hop_options(path, association_types)):
+            hop = Hop(object_type, await self.aneighbors(current, frontier, object_type, types))
+            if read_records and hop.ids:
+                response = await arun_batch(
+                    self.app.crm.read_batch_objects,
+                    ({"id": record_id} for record_id in hop.ids),
+                    max_concurrency=self.max_concurrency,
+                    raise_on_error=True,
+                    **self._records_kwargs(object_type, properties),
+                )
+                hop.records = {str(record["id"]): record for record in response.get("results") or []}
+            hops.append(hop)
+            frontier, current = hop.ids, object_type
+        return hops
+
+    # Invalidation
+
+    def invalidate(self, object_type: Optional[str] = None) -> None:
+        """
+        Forget cached edges from or to ``object_type``, or every edge when None.
+
+        Args:
+            object_type (Optional[str]): Object type whose edges are dropped
+        """
+        with self._lock:
+            if object_type is None:
+                self._edges.clear()
+                return
+            for pair in [pair for pair in self._edges if object_type in pair]:
+                del self._edges[pair]
+
+    def invalidate_path(self, path: str) -> None:
+        """Mutation listener: drop the edges of object types written under ``/crm/*/objects`` or ``/crm/*/associations``."""
+        parts = path.strip("/").split("/")
+        if len(parts) < 4 or parts[0] != "crm":
+            return
+        if parts[2] == "objects":
+            # Creating a record may associate it with others, e.g. POST /crm/v3/objects/deals with "associations"
+            touched = {parts[3]}
+            if "associations" in parts[:-1]:
+                touched.add(parts[parts.index("associations") + 1])
+        elif parts[2] == "associations" and len(parts) >= 5:
+            touched = {parts[3], parts[4]}
+        else:
+            return
+        with self._lock:
+            for pair in [pair for pair in self._edges if touched & set(pair)]:
+                del self._edges[pair]
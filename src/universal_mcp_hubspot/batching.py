@@ -0,0 +1,370 @@
+import asyncio
+import inspect
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+import httpx
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CONCURRENCY = 4
+
+# Endpoints whose input limit differs from the CRM default of 100
+BATCH_LIMITS = {
+    "batch_read_associations": 1000,
+    "batch_create_timeline_events": 500,
+    "batch_read_campaigns_post": 50,
+    "update_campaigns_batch": 50,
+    "archive_campaigns_batch": 50,
+    "create_campaigns_batch": 50,
+}
+# Status codes of a batch rejected because of its content; splitting it isolates the invalid inputs
+SPLITTABLE_STATUS_CODES = frozenset({400, 409, 422})
+
+# (input index, input) pairs, so results and errors can be reported against the caller's positions
+Chunk = List[tuple[int, Any]]
+# Final outcome of one request: the chunk it carried, and its response or error
+ChunkOutcome = tuple[Chunk, Any, Optional[httpx.HTTPError]]
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split ``iterable`` into lists of at most ``size`` items without materialising it.
+
+    Args:
+        iterable (Iterable[Any]): Any iterable, including generators
+        size (int): Maximum chunk length
+
+    Returns:
+        Iterator[List[Any]]: Consecutive chunks
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def batch_limit(method: Callable) -> int:
+    """Maximum number of ``inputs`` the endpoint behind ``method`` accepts per request."""
+    return BATCH_LIMITS.get(method.__name__, DEFAULT_BATCH_SIZE)
+
+
+def chunk_error(index: int, size: int, error: Exception) -> dict[str, Any]:
+    """
+    HubSpot-shaped batch error entry for a chunk whose request failed as a whole.
+
+    Args:
+        index (int): Position of the chunk
+        size (int): Number of inputs in the chunk
+        error (Exception): Error the chunk request raised
+
+    Returns:
+        dict[str, Any]: Error entry for the ``errors`` of a merged batch response
+    """
+    status_code = (
+        error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+    )
+    return {
+        "status": "error",
+        "category": "CHUNK_FAILED",
+        "message": str(error),
+        "context": {"chunk": [str(index)], "size": [str(size)]},
+        "statusCode": status_code,
+    }
+
+
+def batch_error(error: Exception, category: str) -> dict[str, Any]:
+    """
+    HubSpot-shaped error entry for inputs whose request failed.
+
+    Args:
+        error (Exception): Error the request raised
+        category (str): Error category, e.g. ``VALIDATION_ERROR`` or ``CHUNK_FAILED``
+
+    Returns:
+        dict[str, Any]: Error with ``status``, ``category``, ``message`` (the response body when there is one) and ``statusCode``
+    """
+    response = error.response if isinstance(error, httpx.HTTPStatusError) else None
+    return {
+        "status": "error",
+        "category": category,
+        "message": response.text if response is not None else str(error),
+        "statusCode": response.status_code if response is not None else None,
+    }
+
+
+def splittable(chunk: Chunk, error: Exception) -> bool:
+    """Whether ``chunk`` was rejected for its content and holds more than one input, so halving it can isolate the invalid ones."""
+    return (
+        len(chunk) > 1
+        and isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in SPLITTABLE_STATUS_CODES
+    )
+
+
+def send_splitting(send: Callable[[List[Any]], Any], chunk: Chunk) -> tuple[List[ChunkOutcome], int]:
+    """
+    Send one chunk, splitting it in halves while HubSpot rejects it for its content.
+
+    One invalid input fails its whole batch with 400, 409 or 422; resending
+    the halves isolates it, so the valid inputs are still written and every
+    failure can be reported against its own index. Other errors end the
+    chunk without splitting.
+
+    Args:
+        send (Callable[[List[Any]], Any]): Sends one batch request for a list of inputs and returns the parsed response
+        chunk (List[tuple[int, Any]]): (input index, input) pairs
+
+    Returns:
+        tuple[List[tuple[List[tuple[int, Any]], Any, Optional[httpx.HTTPError]]], int]: The final ``(chunk, response, error)`` outcomes in input order, and the number of requests sent
+    """
+    try:
+        return [(chunk, send([item for _, item in chunk]), None)], 1
+    except httpx.HTTPError as exc:
+        if not splittable(chunk, exc):
+            return [(chunk, None, exc)], 1
+    middle = len(chunk) // 2
+    head, head_requests = send_splitting(send, chunk[:middle])
+    tail, tail_requests = send_splitting(send, chunk[middle:])
+    return head + tail, 1 + head_requests + tail_requests
+
+
+async def asend_splitting(send: Callable[[List[Any]], Awaitable[Any]], chunk: Chunk) -> tuple[List[ChunkOutcome], int]:
+    """
+    Async counterpart of ``send_splitting``.
+
+    Args:
+        send (Callable[[List[Any]], Awaitable[Any]]): Coroutine function sending one batch request for a list of inputs
+        chunk (List[tuple[int, Any]]): (input index, input) pairs
+
+    Returns:
+        tuple[List[tuple[List[tuple[int, Any]], Any, Optional[httpx.HTTPError]]], int]: The final ``(chunk, response, error)`` outcomes in input order, and the number of requests sent
+    """
+    try:
+        return [(chunk, await send([item for _, item in chunk]), None)], 1
+    except httpx.HTTPError as exc:
+        if not splittable(chunk, exc):
+            return [(chunk, None, exc)], 1
+    middle = len(chunk) // 2
+    head, head_requests = await asend_splitting(send, chunk[:middle])
+    tail, tail_requests = await asend_splitting(send, chunk[middle:])
+    return head + tail, 1 + head_requests + tail_requests
+
+
+def imap_bounded(func: Callable[[Any], Any], items: Iterable[Any], max_concurrency: int = DEFAULT_CONCURRENCY) -> Iterator[Any]:
+    """
+    Apply ``func`` to ``items`` on worker threads with up to ``max_concurrency`` calls in flight.
+
+    ``items`` is consumed lazily and a new call starts as soon as any call
+    finishes, so one slow request does not hold back the others. Results are
+    yielded on the calling thread in completion order, so callers can
+    aggregate them without locking.
+
+    Args:
+        func (Callable[[Any], Any]): Function run on a worker thread per item
+        items (Iterable[Any]): Items, of any length
+        max_concurrency (int): Maximum number of calls in flight
+
+    Returns:
+        Iterator[Any]: Return values of ``func``, in completion order
+
+    Raises:
+        Exception: The first exception raised by ``func``; calls that have not started are cancelled.
+    """
+    iterator = iter(items)
+    pending: set[Future] = set()
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+        def submit_next() -> bool:
+            for item in iterator:
+                pending.add(executor.submit(func, item))
+                return True
+            return False
+
+        try:
+            while len(pending) < max_concurrency and submit_next():
+                pass
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    value = future.result()
+                    submit_next()
+                    yield value
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aimap_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of ``imap_bounded``: run ``func`` as tasks with up to ``max_concurrency`` in flight.
+
+    Args:
+        func (Callable[[Any], Awaitable[Any]]): Coroutine function run per item
+        items (Iterable[Any]): Items, of any length
+        max_concurrency (int): Maximum number of calls in flight
+
+    Returns:
+        AsyncIterator[Any]: Return values of ``func``, in completion order
+
+    Raises:
+        Exception: The first exception raised by ``func``; the other calls are cancelled.
+    """
+    iterator = iter(items)
+    pending: set[asyncio.Future] = set()
+
+    def submit_next() -> bool:
+        for item in iterator:
+            pending.add(asyncio.ensure_future(func(item)))
+            return True
+        return False
+
+    try:
+        while len(pending) < max_concurrency and submit_next():
+            pass
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                value = task.result()
+                submit_next()
+                yield value
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def merge_batch_responses(responses: Iterable[Any]) -> dict[str, Any]:
+    """
+    Merge per-chunk batch responses into a single HubSpot-shaped batch response.
+
+    Args:
+        responses (Iterable[Any]): Parsed chunk responses in chunk order
+
+    Returns:
+        dict[str, Any]: ``results`` and ``errors`` concatenated, ``numErrors`` summed and the time range widened
+    """
+    merged: dict[str, Any] = {"status": "COMPLETE", "results": [], "errors": [], "numErrors": 0}
+    started, completed = [], []
+    for response in responses:
+        if not isinstance(response, dict):
+            continue
+        merged["results"].extend(response.get("results") or [])
+        errors = response.get("errors") or []
+        merged["errors"].extend(errors)
+        merged["numErrors"] += response.get("numErrors", len(errors))
+        if response.get("startedAt"):
+            started.append(response["startedAt"])
+        if response.get("completedAt"):
+            completed.append(response["completedAt"])
+        if response.get("status") not in (None, "COMPLETE", "success"):
+            merged["status"] = response["status"]
+    if started:
+        merged["startedAt"] = min(started)
+    if completed:
+        merged["completedAt"] = max(completed)
+    return merged
+
+
+def run_batch(
+    method: Callable[..., Any],
+    inputs: Iterable[Any],
+    batch_size: Optional[int] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    raise_on_error: bool = False,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Run a batch tool over any number of inputs.
+
+    ``inputs`` is consumed lazily and split into chunks of the endpoint limit;
+    up to ``max_concurrency`` chunks are in flight at once on worker threads,
+    all paced by the application's shared rate limiter.
+
+    Args:
+        method (Callable): A bound batch tool such as ``app.crm.create_contacts_batch``
+        inputs (Iterable[Any]): Items for the ``inputs`` argument, of any length
+        batch_size (Optional[int]): Chunk size. Defaults to the endpoint limit.
+        max_concurrency (int): Maximum number of chunk requests in flight
+        raise_on_error (bool): Re-raise the first failed chunk instead of reporting it in ``errors``
+        **kwargs: Other arguments forwarded to ``method`` with every chunk, e.g. ``properties``
+
+    Returns:
+        dict[str, Any]: The merged batch response
+
+    Raises:
+        HTTPStatusError: Raised when a chunk fails and ``raise_on_error`` is set.
+
+    Example:
+        >>> run_batch(app.crm.create_contacts_batch, ({"properties": p} for p in rows))
+    """
+
+    def send(item: tuple[int, List[Any]]) -> tuple[int, Any]:
+        index, chunk = item
+        try:
+            return index, method(inputs=chunk, **kwargs)
+        except httpx.HTTPError as exc:
+            if raise_on_error:
+                raise
+            return index, {"errors": [chunk_error(index, len(chunk), exc)]}
+
+    chunks = enumerate(chunked(inputs, batch_size or batch_limit(method)))
+    responses = dict(imap_bounded(send, chunks, max_concurrency))
+    return merge_batch_responses(responses[index] for index in sorted(responses))
+
+
+async def arun_batch(
+    method: Callable[..., Any],
+    inputs: Iterable[Any],
+    batch_size: Optional[int] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    raise_on_error: bool = False,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Async counterpart of ``run_batch`` built on the async tool twins.
+
+    Args:
+        method (Callable): A bound batch tool or its async twin
+        inputs (Iterable[Any]): Items for the ``inputs`` argument, of any length
+        batch_size (Optional[int]): Chunk size. Defaults to the endpoint limit.
+        max_concurrency (int): Maximum number of chunk requests in flight
+        raise_on_error (bool): Re-raise the first failed chunk instead of reporting it in ``errors``
+        **kwargs: Other arguments forwarded to ``method`` with every chunk
+
+    Returns:
+        dict[str, Any]: The merged batch response
+
+    Raises:
+        HTTPStatusError: Raised when a chunk fails and ``raise_on_error`` is set.
+    """
+    if not inspect.iscoroutinefunction(method):
+        method = getattr(method.__self__, f"a{method.__name__}")
+
+    async def send(item: tuple[int, List[Any]]) -> tuple[int, Any]:
+        index, chunk = item
+        try:
+            return index, await method(inputs=chunk, **kwargs)
+        except httpx.HTTPError as exc:
+            if raise_on_error:
+                raise
+            return index, {"errors": [chunk_error(index, len(chunk), exc)]}
+
+    chunks = enumerate(chunked(inputs, batch_size or batch_limit(method)))
+    responses = dict([response async for response in aimap_bounded(send, chunks, max_concurrency)])
+    return merge_batch_responses(responses[index] for index in sorted(responses))
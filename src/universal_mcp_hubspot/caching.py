@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import httpx
+
+DEFAULT_METADATA_TTL_SECONDS = 300.0
+DEFAULT_METADATA_MAX_ENTRIES = 512
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe mapping with per-entry expiry and least-recently-used eviction.
+
+    Args:
+        ttl (float): Seconds an entry stays valid. 0 disables the cache.
+        max_entries (int): Entries kept before the least recently used one is evicted
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for ``key`` and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or entry[0] < time.monotonic():
+                if entry is not _MISSING:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drop every entry whose key matches ``predicate``.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Called with each key
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+
+def _metadata_scope(path: str) -> Optional[str]:
+    """
+    Path prefix of the metadata a request reads or changes.
+
+    Properties and property groups are scoped per object type, association
+    types per pair of object types; a schema change may add or remove
+    properties or association labels of any type, so it covers all metadata.
+    """
+    parts = path.strip("/").split("/")
+    if len(parts) >= 4 and parts[:3] == ["crm", "v3", "properties"]:
+        return "/" + "/".join(parts[:4])
+    if len(parts) == 6 and parts[:3] == ["crm", "v3", "associations"] and parts[5] == "types":
+        return "/" + "/".join(parts[:5])
+    if len(parts) >= 3 and parts[:3] == ["crm", "v3", "schemas"]:
+        return "/crm/v3/"
+    return None
+
+
+class MetadataCache:
+    """
+    Response cache for property, property group, association type and schema metadata.
+
+    GET responses from ``/crm/v3/properties``, ``/crm/v3/schemas`` and
+    ``/crm/v3/associations/{from}/{to}/types`` are cached per portal (one
+    cache per ``HubspotApp``) keyed on the full URL, so
+    ``get_properties_by_object_type``, ``get_property_groups_by_object_type``,
+    ``get_crm_property``, ``list_schemas``, ``get_schema_by_object_type``,
+    ``get_association_types_by_object_types`` and their async twins are
+    served without a network call while fresh. Any
+    successful write under the same scope, e.g. ``create_property_schema``,
+    ``patch_crm_property_by_name`` or ``create_crm_schema``, invalidates it.
+
+    Args:
+        ttl (float): Seconds a response stays valid. 0 disables caching.
+        max_entries (int): Responses kept before least recently used ones are evicted
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_METADATA_TTL_SECONDS,
+        max_entries: int = DEFAULT_METADATA_MAX_ENTRIES,
+    ) -> None:
+        self._cache = TTLCache(ttl, max_entries)
+
+    def lookup(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Cached response for ``request``, if it is a fresh metadata read.
+
+        Args:
+            request (httpx.Request): The request about to be sent
+
+        Returns:
+            Optional[httpx.Response]: The cached response, or None on a miss
+        """
+        if request.method != "GET" or _metadata_scope(request.url.path) is None:
+            return None
+        return self._cache.get((request.url.path, str(request.url)))
+
+    def store(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Remember a successful metadata read.
+
+        Args:
+            request (httpx.Request): The request that was sent
+            response (httpx.Response): Its response, already read
+        """
+        if (
+            request.method == "GET"
+            and response.is_success
+            and _metadata_scope(request.url.path) is not None
+        ):
+            self._cache.set((request.url.path, str(request.url)), response)
+
+    def invalidate(self, path: str) -> int:
+        """
+        Drop cached metadata affected by a write to ``path``.
+
+        Args:
+            path (str): URL path of a successful non-GET request
+
+        Returns:
+            int: Number of responses dropped
+        """
+        scope = _metadata_scope(path)
+        if scope is None:
+            return 0
+        prefix = scope.rstrip("/") + "/"
+        return self._cache.invalidate(
+            lambda key: key[0] == scope or key[0].startswith(prefix)
+        )
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        return self._cache.stats()
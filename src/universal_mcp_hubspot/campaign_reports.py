@@ -0,0 +1,287 @@
+import asyncio
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional, Sequence
+
+import httpx
+
+from universal_mcp_hubspot.batching import batch_error, imap_bounded
+from universal_mcp_hubspot.pagination import apaginate, paginate
+
+CAMPAIGN_REPORTS = ("metrics", "revenue", "budget", "contacts")
+DEFAULT_CAMPAIGN_REPORTS = ("metrics", "revenue", "budget")
+CONTACT_REPORT_TYPES = ("contactFirstTouch", "contactLastTouch", "influencedContacts")
+DEFAULT_REPORT_CONCURRENCY = 8
+CONTACT_REPORT_PAGE_SIZE = 100
+
+# One report call of one campaign: (campaignGuid, report, contactType)
+Call = tuple[str, str, Optional[str]]
+
+
+class CampaignReportTable:
+    """
+    Reports of many campaigns merged into one table, one row per campaign.
+
+    Report fields become columns prefixed with the report name, e.g.
+    ``metrics.sessions``, ``revenue.revenueAmount`` or
+    ``budget.spendItemsSum``; contact reports become contact counts such as
+    ``contacts.influencedContacts``. A report that failed leaves its columns
+    empty for that campaign and is recorded in ``errors``.
+
+    Attributes:
+        rows (dict[str, dict[str, Any]]): Rows by campaign GUID, in the order campaigns were requested
+        errors (dict[str, dict[str, dict[str, Any]]]): Campaign GUID to report name to error
+        requests (int): Reports fetched; a paged contact report counts once
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.errors: dict[str, dict[str, dict[str, Any]]] = {}
+        self.requests = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def columns(self) -> List[str]:
+        """Every column, in first-seen order, starting with ``campaignGuid``."""
+        columns: dict[str, None] = {}
+        for row in self.rows.values():
+            columns.update(dict.fromkeys(row))
+        return list(columns)
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Values of one column, one per campaign; None where a campaign has no value.
+
+        Args:
+            name (str): Column name, e.g. ``revenue.revenueAmount``
+
+        Returns:
+            List[Any]: The values, in row order
+        """
+        return [row.get(name) for row in self.rows.values()]
+
+    def totals(self) -> dict[str, float]:
+        """Sum of every numeric column over all campaigns."""
+        totals: dict[str, float] = {}
+        for row in self.rows.values():
+            for name, value in row.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def to_records(self) -> List[dict[str, Any]]:
+        """One dict per campaign with every column, None where a value is missing."""
+        columns = self.columns
+        return [{name: row.get(name) for name in columns} for row in self.rows.values()]
+
+    def _add_campaign(self, guid: str, name: Optional[str]) -> None:
+        row = self.rows.setdefault(guid, {"campaignGuid": guid})
+        if name is not None:
+            row["name"] = name
+
+    def _record(self, call: Call, response: Any) -> None:
+        guid, report, contact_type = call
+        row = self.rows[guid]
+        if report == "contacts":
+            row[f"contacts.{contact_type}"] = response
+            return
+        for key, value in (response or {}).items():
+            if not isinstance(value, (dict, list)):
+                row[f"{report}.{key}"] = value
+
+    def _fail(self, call: Call, error: Exception) -> None:
+        guid, report, contact_type = call
+        self.errors.setdefault(guid, {})[f"contacts.{contact_type}" if report == "contacts" else report] = batch_error(error, "REPORT_FAILED")
+
+
+def _calls(guid: str, reports: Sequence[str], contact_types: Sequence[str]) -> Iterator[Call]:
+    for report in reports:
+        if report == "contacts":
+            for contact_type in contact_types:
+                yield guid, report, contact_type
+        else:
+            yield guid, report, None
+
+
+def _check_reports(reports: Sequence[str]) -> None:
+    unknown = [report for report in reports if report not in CAMPAIGN_REPORTS]
+    if unknown:
+        raise ValueError(f"Unknown campaign reports: {', '.join(unknown)}. Choose from {', '.join(CAMPAIGN_REPORTS)}.")
+
+
+def _fetch(app: Any, call: Call, startDate: Optional[str], endDate: Optional[str], attributionModel: Optional[str]) -> Any:
+    guid, report, contact_type = call
+    marketing = app.marketing
+    if report == "metrics":
+        return marketing.get_campaign_metrics(guid, startDate=startDate, endDate=endDate)
+    if report == "revenue":
+        return marketing.get_campaign_revenue_report(guid, attributionModel=attributionModel, startDate=startDate, endDate=endDate)
+    if report == "budget":
+        return marketing.get_campaign_budget_totals(guid)
+    return sum(
+        1
+        for _ in paginate(
+            marketing.get_campaign_contacts_report_by_type,
+            campaignGuid=guid,
+            contactType=contact_type,
+            startDate=startDate,
+            endDate=endDate,
+            limit=CONTACT_REPORT_PAGE_SIZE,
+        )
+    )
+
+
+async def _afetch(app: Any, call: Call, startDate: Optional[str], endDate: Optional[str], attributionModel: Optional[str]) -> Any:
+    guid, report, contact_type = call
+    marketing = app.marketing
+    if report == "metrics":
+        return await marketing.aget_campaign_metrics(guid, startDate=startDate, endDate=endDate)
+    if report == "revenue":
+        return await marketing.aget_campaign_revenue_report(guid, attributionModel=attributionModel, startDate=startDate, endDate=endDate)
+    if report == "budget":
+        return await marketing.aget_campaign_budget_totals(guid)
+    count = 0
+    async for _ in apaginate(
+        marketing.get_campaign_contacts_report_by_type,
+        campaignGuid=guid,
+        contactType=contact_type,
+        startDate=startDate,
+        endDate=endDate,
+        limit=CONTACT_REPORT_PAGE_SIZE,
+    ):
+        count += 1
+    return count
+
+
+def campaign_reports(
+    app: Any,
+    campaignGuids: Optional[Iterable[str]] = None,
+    reports: Sequence[str] = DEFAULT_CAMPAIGN_REPORTS,
+    contact_types: Sequence[str] = CONTACT_REPORT_TYPES,
+    startDate: Optional[str] = None,
+    endDate: Optional[str] = None,
+    attributionModel: Optional[str] = None,
+    max_concurrency: int = DEFAULT_REPORT_CONCURRENCY,
+) -> CampaignReportTable:
+    """
+    Fetch reports of many campaigns concurrently and merge them into one table.
+
+    Every (campaign, report) pair is one request, with up to
+    ``max_concurrency`` in flight; the app's rate limiter paces them within
+    the portal's request budget. Campaigns are read from
+    ``get_marketing_campaigns`` page by page when no GUIDs are given.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        campaignGuids (Optional[Iterable[str]]): Campaigns to report on. Reports on every campaign when None.
+        reports (Sequence[str]): Any of ``metrics``, ``revenue``, ``budget`` and ``contacts``
+        contact_types (Sequence[str]): Contact reports to count when ``contacts`` is requested
+        startDate (Optional[str]): Start of the reporting period, e.g. ``2024-10-01``
+        endDate (Optional[str]): End of the reporting period
+        attributionModel (Optional[str]): Attribution model of the revenue report, e.g. ``LINEAR``
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        CampaignReportTable: One row per campaign, with failed reports in ``errors``
+
+    Raises:
+        ValueError: Raised when a report name is unknown.
+        HTTPStatusError: Raised when listing campaigns fails with detailed error information including status code and response body.
+
+    Example:
+        >>> table = campaign_reports(app, reports=("metrics", "revenue"), startDate="2024-10-01", endDate="2024-12-31")
+        >>> table.totals()["revenue.revenueAmount"]
+    """
+    _check_reports(reports)
+    table = CampaignReportTable()
+    if campaignGuids is None:
+        campaigns = (
+            (campaign["id"], (campaign.get("properties") or {}).get("hs_name"))
+            for campaign in paginate(app.marketing.get_marketing_campaigns, properties=["hs_name"])
+        )
+    else:
+        campaigns = ((str(guid), None) for guid in campaignGuids)
+
+    def calls() -> Iterator[Call]:
+        for guid, name in campaigns:
+            table._add_campaign(guid, name)
+            yield from _calls(guid, reports, contact_types)
+
+    def fetch(call: Call) -> tuple[Call, Any, Optional[httpx.HTTPError]]:
+        try:
+            return call, _fetch(app, call, startDate, endDate, attributionModel), None
+        except httpx.HTTPError as exc:
+            return call, None, exc
+
+    # Workers only fetch; the table is updated here on the calling thread
+    for call, response, error in imap_bounded(fetch, calls(), max_concurrency):
+        table.requests += 1
+        if error is None:
+            table._record(call, response)
+        else:
+            table._fail(call, error)
+    return table
+
+
+async def acampaign_reports(
+    app: Any,
+    campaignGuids: Optional[Iterable[str]] = None,
+    reports: Sequence[str] = DEFAULT_CAMPAIGN_REPORTS,
+    contact_types: Sequence[str] = CONTACT_REPORT_TYPES,
+    startDate: Optional[str] = None,
+    endDate: Optional[str] = None,
+    attributionModel: Optional[str] = None,
+    max_concurrency: int = DEFAULT_REPORT_CONCURRENCY,
+) -> CampaignReportTable:
+    """
+    Async counterpart of ``campaign_reports``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        campaignGuids (Optional[Iterable[str]]): Campaigns to report on. Reports on every campaign when None.
+        reports (Sequence[str]): Any of ``metrics``, ``revenue``, ``budget`` and ``contacts``
+        contact_types (Sequence[str]): Contact reports to count when ``contacts`` is requested
+        startDate (Optional[str]): Start of the reporting period, e.g. ``2024-10-01``
+        endDate (Optional[str]): End of the reporting period
+        attributionModel (Optional[str]): Attribution model of the revenue report, e.g. ``LINEAR``
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        CampaignReportTable: One row per campaign, with failed reports in ``errors``
+
+    Raises:
+        ValueError: Raised when a report name is unknown.
+        HTTPStatusError: Raised when listing campaigns fails with detailed error information including status code and response body.
+    """
+    _check_reports(reports)
+    table = CampaignReportTable()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+
+    async def campaigns() -> AsyncIterator[tuple[str, Optional[str]]]:
+        if campaignGuids is None:
+            async for campaign in apaginate(app.marketing.get_marketing_campaigns, properties=["hs_name"]):
+                yield campaign["id"], (campaign.get("properties") or {}).get("hs_name")
+        else:
+            for guid in campaignGuids:
+                yield str(guid), None
+
+    async def produce() -> None:
+        try:
+            async for guid, name in campaigns():
+                table._add_campaign(guid, name)
+                for call in _calls(guid, reports, contact_types):
+                    await queue.put(call)
+        finally:
+            for _ in range(max_concurrency):
+                await queue.put(None)
+
+    async def worker() -> None:
+        while (call := await queue.get()) is not None:
+            table.requests += 1
+            try:
+                table._record(call, await _afetch(app, call, startDate, endDate, attributionModel))
+            except httpx.HTTPError as exc:
+                table._fail(call, exc)
+
+    await asyncio.gather(produce(), *(worker() for _ in range(max_concurrency)))
+    return table
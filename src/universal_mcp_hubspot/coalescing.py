@@ -0,0 +1,176 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Hashable, List, Optional
+
+# Single-record getters that can be served by ``read_batch_objects``: name -> (objectType, id argument)
+COALESCED_GETTERS = {
+    "get_contact_by_id": ("contacts", "contactId"),
+    "get_company_by_id": ("companies", "companyId"),
+    "get_deal_by_id": ("deals", "dealId"),
+    "get_ticket_by_id": ("tickets", "ticketId"),
+    "get_line_item_by_id": ("line_items", "lineItemId"),
+    "get_product_by_id": ("products", "productId"),
+    "get_quote_by_id": ("quotes", "quoteId"),
+    "get_email_by_id": ("emails", "emailId"),
+    "get_feedback_submission_by_id": ("feedback_submissions", "feedbackSubmissionId"),
+}
+DEFAULT_WINDOW_SECONDS = 0.01
+MAX_BATCH_READ = 100
+
+
+class ReadCoalescer:
+    """
+    Merges concurrent single-record reads into batch reads.
+
+    Calls to the async getters listed in ``COALESCED_GETTERS`` that arrive
+    within ``window`` seconds of each other and ask for the same properties are
+    sent as one ``read_batch_objects`` request; every caller still receives
+    exactly the record it asked for. Reads with ``associations`` (not supported
+    by batch reads), ``idProperty`` reads without a ``properties`` list and
+    records missing from the batch response go through the regular
+    single-record getter, so errors such as 404s surface unchanged.
+
+    Args:
+        crm (Any): The ``CrmApi`` segment to read through
+        window (float): Seconds to wait for more reads before flushing a batch
+        max_batch (int): Flush immediately once this many distinct reads are queued
+    """
+
+    def __init__(self, crm: Any, window: float = DEFAULT_WINDOW_SECONDS, max_batch: int = MAX_BATCH_READ) -> None:
+        self.crm = crm
+        self.window = window
+        self.max_batch = max_batch
+        self._queues: dict[Hashable, List[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self.batches_sent = 0
+        self.reads_queued = 0
+
+    def install(self) -> None:
+        """Replace the async getters of ``crm`` with coalescing versions."""
+        for name in COALESCED_GETTERS:
+            setattr(self.crm, f"a{name}", self._coalescing_getter(name))
+
+    def _coalescing_getter(self, name: str):
+        object_type, id_argument = COALESCED_GETTERS[name]
+        getter = getattr(self.crm, name)
+        single = getattr(type(self.crm), f"a{name}").__get__(self.crm)
+        signature = inspect.signature(getter)
+
+        @functools.wraps(getter)
+        async def coalesced(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            arguments = signature.bind(*args, **kwargs).arguments
+            if arguments.get("associations") or arguments.get(id_argument) is None:
+                return await single(*args, **kwargs)
+            # Without an explicit property list the batch read would return only
+            # the idProperty it needs for matching instead of the default properties
+            if arguments.get("idProperty") and not arguments.get("properties"):
+                return await single(*args, **kwargs)
+            return await self.get(
+                object_type,
+                arguments[id_argument],
+                properties=arguments.get("properties"),
+                propertiesWithHistory=arguments.get("propertiesWithHistory"),
+                archived=arguments.get("archived"),
+                idProperty=arguments.get("idProperty"),
+                fallback=functools.partial(single, *args, **kwargs),
+            )
+
+        return coalesced
+
+    async def get(
+        self,
+        object_type: str,
+        record_id: str,
+        properties: Optional[List[str]] = None,
+        propertiesWithHistory: Optional[List[str]] = None,
+        archived: Optional[bool] = None,
+        idProperty: Optional[str] = None,
+        fallback: Any = None,
+    ) -> dict[str, Any]:
+        """
+        Read one record, sharing the request with other reads in the same window.
+
+        Args:
+            object_type (str): CRM object type, e.g. ``contacts``
+            record_id (str): ID of the record, or the value of ``idProperty``
+            properties (Optional[List[str]]): Properties to return
+            propertiesWithHistory (Optional[List[str]]): Properties to return with their history
+            archived (Optional[bool]): Whether to read archived records
+            idProperty (Optional[str]): Unique property ``record_id`` refers to
+            fallback (Any): Coroutine function used when the record is missing from the batch result
+
+        Returns:
+            dict[str, Any]: The record, shaped like the single-record getter response
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        key = (
+            object_type,
+            tuple(properties or ()),
+            tuple(propertiesWithHistory or ()),
+            archived,
+            idProperty,
+        )
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.setdefault(key, [])
+        queue.append((str(record_id), future))
+        if len(queue) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        elif len({record for record, _ in queue}) >= self.max_batch:
+            self._flush(key)
+        self.reads_queued += 1
+        record = await future
+        if record is None:
+            if fallback is None:
+                raise LookupError(f"{object_type} record '{record_id}' was not found.")
+            return await fallback()
+        return record
+
+    def _flush(self, key: Hashable) -> None:
+        # A batch flushed early at max_batch must not leave its window timer
+        # behind to cut short the next batch queued under the same key
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        queue = self._queues.pop(key, None)
+        if queue:
+            asyncio.ensure_future(self._dispatch(key, queue))
+
+    async def _dispatch(self, key: Hashable, queue: List[tuple[str, asyncio.Future]]) -> None:
+        object_type, properties, properties_with_history, archived, id_property = key
+        ids = list(dict.fromkeys(record_id for record_id, _ in queue))
+        # HubSpot only returns the idProperty value when it is requested
+        requested = list(properties)
+        if id_property and id_property not in requested:
+            requested.append(id_property)
+        self.batches_sent += 1
+        try:
+            response = await self.crm.aread_batch_objects(
+                object_type,
+                propertiesWithHistory=list(properties_with_history),
+                inputs=[{"id": record_id} for record_id in ids],
+                properties=requested,
+                archived=archived,
+                idProperty=id_property,
+            )
+        except Exception as exc:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        records = {}
+        for record in response.get("results") or []:
+            if not id_property:
+                records[str(record.get("id"))] = record
+                continue
+            values = record.get("properties") or {}
+            # idProperty lookups such as email match regardless of case
+            records[str(values.get(id_property)).lower()] = record
+            if id_property not in properties:
+                record["properties"] = {name: value for name, value in values.items() if name != id_property}
+        for record_id, future in queue:
+            if not future.done():
+                future.set_result(records.get(record_id.lower() if id_property else record_id))
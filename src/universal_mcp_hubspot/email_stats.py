@@ -0,0 +1,490 @@
+import asyncio
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from universal_mcp_hubspot.batching import DEFAULT_CONCURRENCY, chunked
+
+# Counters reported for every bucket, in column order; other counters HubSpot returns follow them
+COUNTERS = ("sent", "delivered", "open", "click", "bounce", "unsubscribed")
+# Email IDs per request; the IDs are sent in the query string
+EMAIL_IDS_PER_REQUEST = 100
+_FIXED_INTERVALS = {
+    "SECOND": 1,
+    "MINUTE": 60,
+    "QUARTER_HOUR": 900,
+    "HOUR": 3_600,
+    "DAY": 86_400,
+    "WEEK": 7 * 86_400,
+}
+_MONTHS_PER_INTERVAL = {"MONTH": 1, "QUARTER": 3, "YEAR": 12}
+# Finest to coarsest
+_INTERVALS = (*_FIXED_INTERVALS, *_MONTHS_PER_INTERVAL)
+# Weeks start on Monday; 1970-01-05 is the first Monday after the epoch
+_FIRST_MONDAY = 4 * 86_400
+
+Moment = Union[str, int, datetime]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _moment(value: Moment) -> datetime:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _ms(moment: datetime) -> int:
+    return round(moment.timestamp() * 1000)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def floor_time(moment: Moment, interval: str) -> datetime:
+    """
+    Start of the histogram bucket that contains ``moment``, in UTC.
+
+    Args:
+        moment (Union[str, int, datetime]): ISO 8601 string, epoch milliseconds or datetime
+        interval (str): ``YEAR``, ``QUARTER``, ``MONTH``, ``WEEK``, ``DAY``, ``HOUR``, ``QUARTER_HOUR``, ``MINUTE`` or ``SECOND``
+
+    Returns:
+        datetime: The bucket start
+
+    Raises:
+        ValueError: Raised when the interval is unknown.
+    """
+    moment = _moment(moment).astimezone(timezone.utc)
+    if interval in _FIXED_INTERVALS:
+        step = _FIXED_INTERVALS[interval]
+        offset = _FIRST_MONDAY if interval == "WEEK" else 0
+        seconds = int(moment.timestamp())
+        return datetime.fromtimestamp((seconds - offset) // step * step + offset, tz=timezone.utc)
+    if interval in _MONTHS_PER_INTERVAL:
+        months = _MONTHS_PER_INTERVAL[interval]
+        month = (moment.month - 1) // months * months + 1
+        return datetime(moment.year, month, 1, tzinfo=timezone.utc)
+    raise ValueError(f"Unknown interval '{interval}'.")
+
+
+def next_bucket(start: datetime, interval: str) -> datetime:
+    """
+    Start of the bucket after the one starting at ``start``.
+
+    Args:
+        start (datetime): A bucket start, as returned by ``floor_time``
+        interval (str): Histogram interval
+
+    Returns:
+        datetime: The next bucket start
+    """
+    if interval in _FIXED_INTERVALS:
+        return start + timedelta(seconds=_FIXED_INTERVALS[interval])
+    month = start.month - 1 + _MONTHS_PER_INTERVAL[interval]
+    return start.replace(year=start.year + month // 12, month=month % 12 + 1)
+
+
+def shard_ranges(start: Moment, end: Moment, interval: str, shards: int) -> List[tuple[datetime, datetime]]:
+    """
+    Split ``[start, end)`` into up to ``shards`` consecutive ranges cut at bucket boundaries.
+
+    Cutting on boundaries keeps every bucket inside one shard, so shard
+    histograms concatenate without double-counting.
+
+    Args:
+        start (Union[str, int, datetime]): Range start
+        end (Union[str, int, datetime]): Range end
+        interval (str): Histogram interval
+        shards (int): Maximum number of ranges
+
+    Returns:
+        List[tuple[datetime, datetime]]: The ranges, in order
+    """
+    start, end = _moment(start), _moment(end)
+    step = (end - start) / max(1, shards)
+    cuts = sorted({floor_time(start + step * index, interval) for index in range(1, max(1, shards))})
+    bounds = [start] + [cut for cut in cuts if start < cut < end] + [end]
+    return list(zip(bounds, bounds[1:]))
+
+
+class EmailStatsSeries:
+    """
+    Columnar time series of email statistics, one row per histogram bucket.
+
+    Bucket bounds are stored as epoch milliseconds and every counter as a
+    contiguous ``array('q')``, so a series of thousands of buckets costs a few
+    bytes per value. ``to_numpy`` exposes the columns as NumPy arrays without
+    copying, and ``rollup`` and ``rate`` use NumPy for their arithmetic when it
+    is installed (``pip install universal-mcp-hubspot[numpy]``).
+
+    Attributes:
+        interval (str): Bucket size, e.g. ``DAY``
+        starts (array): Bucket starts in epoch milliseconds, ascending
+        ends (array): Bucket ends in epoch milliseconds
+        counters (dict[str, array]): Counter name to one value per bucket, e.g. ``sent``, ``open``, ``click`` and ``bounce``
+    """
+
+    def __init__(
+        self,
+        interval: str,
+        starts: Iterable[int] = (),
+        ends: Iterable[int] = (),
+        counters: Optional[dict[str, Iterable[int]]] = None,
+    ) -> None:
+        self.interval = interval
+        self.starts = array("q", starts)
+        self.ends = array("q", ends)
+        self.counters = {name: array("q", values) for name, values in (counters or {}).items()}
+        for name in COUNTERS:
+            self.counters.setdefault(name, array("q", [0]) * len(self.starts))
+
+    @classmethod
+    def from_histograms(cls, interval: str, responses: Iterable[dict[str, Any]]) -> "EmailStatsSeries":
+        """
+        Merge ``get_email_statistics_histogram`` responses into one series.
+
+        Buckets with the same start, e.g. from requests for different email
+        IDs, are summed.
+
+        Args:
+            interval (str): Interval the histograms were requested with
+            responses (Iterable[dict[str, Any]]): Histogram responses
+
+        Returns:
+            EmailStatsSeries: Buckets in ascending order
+        """
+        buckets: dict[int, tuple[int, dict[str, int]]] = {}
+        names = list(COUNTERS)
+        for response in responses:
+            for bucket in response.get("results") or []:
+                start = _ms(_moment(bucket["interval"]["start"]))
+                end = _ms(_moment(bucket["interval"]["end"]))
+                _, totals = buckets.setdefault(start, (end, {}))
+                for name, value in ((bucket.get("aggregations") or {}).get("counters") or {}).items():
+                    if name not in names:
+                        names.append(name)
+                    totals[name] = totals.get(name, 0) + int(value or 0)
+        order = sorted(buckets)
+        return cls(
+            interval,
+            order,
+            (buckets[start][0] for start in order),
+            {name: [buckets[start][1].get(name, 0) for start in order] for name in names},
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def column(self, name: str) -> array:
+        """
+        Values of one counter, one per bucket.
+
+        Args:
+            name (str): Counter name, e.g. ``open``
+
+        Returns:
+            array: The column; zeros when HubSpot did not report the counter
+
+        Raises:
+            KeyError: Raised when the counter is unknown.
+        """
+        return self.counters[name]
+
+    def totals(self) -> dict[str, int]:
+        """Sum of every counter over the whole series."""
+        return {name: sum(values) for name, values in self.counters.items()}
+
+    def between(self, start: Moment, end: Moment) -> "EmailStatsSeries":
+        """
+        Buckets that start in ``[start, end)``.
+
+        Args:
+            start (Union[str, int, datetime]): Range start
+            end (Union[str, int, datetime]): Range end
+
+        Returns:
+            EmailStatsSeries: A new series sharing no storage with this one
+        """
+        low = bisect_left(self.starts, _ms(_moment(start)))
+        high = bisect_left(self.starts, _ms(_moment(end)))
+        return EmailStatsSeries(
+            self.interval,
+            self.starts[low:high],
+            self.ends[low:high],
+            {name: values[low:high] for name, values in self.counters.items()},
+        )
+
+    def rollup(self, interval: str) -> "EmailStatsSeries":
+        """
+        Aggregate the series into coarser buckets, e.g. ``DAY`` into ``WEEK``.
+
+        Args:
+            interval (str): Target interval; it must be at least as coarse as the series interval
+
+        Returns:
+            EmailStatsSeries: One bucket per target interval that has data
+
+        Raises:
+            ValueError: Raised when ``interval`` is unknown, finer than the series interval, or splits its buckets (weeks into months).
+        """
+        if interval not in _INTERVALS:
+            raise ValueError(f"Unknown interval '{interval}'.")
+        if _INTERVALS.index(interval) < _INTERVALS.index(self.interval):
+            raise ValueError(f"Cannot roll {self.interval} buckets up into finer {interval} buckets.")
+        if self.interval == "WEEK" and interval in _MONTHS_PER_INTERVAL:
+            raise ValueError(f"WEEK buckets do not nest in {interval} buckets.")
+        keys = [_ms(floor_time(start, interval)) for start in self.starts]
+        offsets = [index for index, key in enumerate(keys) if index == 0 or key != keys[index - 1]]
+        group_starts = [keys[index] for index in offsets]
+        group_ends = [_ms(next_bucket(_moment(start), interval)) for start in group_starts]
+        numpy = _numpy()
+        counters = {}
+        for name, values in self.counters.items():
+            if numpy is not None and offsets:
+                summed = array("q")
+                summed.frombytes(numpy.add.reduceat(numpy.frombuffer(values, dtype=numpy.int64), offsets).tobytes())
+                counters[name] = summed
+            else:
+                bounds = offsets + [len(values)]
+                counters[name] = array("q", (sum(values[low:high]) for low, high in zip(bounds, bounds[1:])))
+        return EmailStatsSeries(interval, group_starts, group_ends, counters)
+
+    def rate(self, numerator: str, denominator: str = "delivered") -> array:
+        """
+        Per-bucket ratio of two counters, e.g. the open rate.
+
+        Args:
+            numerator (str): Counter name, e.g. ``open``
+            denominator (str): Counter name. Defaults to ``delivered``.
+
+        Returns:
+            array: One float per bucket; 0.0 where the denominator is zero
+        """
+        top, bottom = self.counters[numerator], self.counters[denominator]
+        numpy = _numpy()
+        if numpy is not None and len(top):
+            top_values = numpy.frombuffer(top, dtype=numpy.int64).astype(numpy.float64)
+            bottom_values = numpy.frombuffer(bottom, dtype=numpy.int64).astype(numpy.float64)
+            ratios = numpy.divide(top_values, bottom_values, out=numpy.zeros_like(top_values), where=bottom_values != 0)
+            result = array("d")
+            result.frombytes(ratios.tobytes())
+            return result
+        return array("d", (high / low if low else 0.0 for high, low in zip(top, bottom)))
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        The columns as NumPy arrays, without copying.
+
+        Returns:
+            dict[str, Any]: ``start`` and ``end`` as ``datetime64[ms]`` arrays and one ``int64`` array per counter
+
+        Raises:
+            ImportError: Raised when NumPy is not installed.
+        """
+        numpy = _numpy()
+        if numpy is None:
+            raise ImportError(
+                "NumPy series require the 'numpy' package. Install it with 'pip install universal-mcp-hubspot[numpy]'."
+            )
+        columns = {
+            "start": numpy.frombuffer(self.starts, dtype=numpy.int64).view("datetime64[ms]"),
+            "end": numpy.frombuffer(self.ends, dtype=numpy.int64).view("datetime64[ms]"),
+        }
+        for name, values in self.counters.items():
+            columns[name] = numpy.frombuffer(values, dtype=numpy.int64)
+        return columns
+
+    def to_records(self) -> List[dict[str, Any]]:
+        """One dict per bucket with ISO ``start`` and ``end`` and every counter."""
+        names = list(self.counters)
+        return [
+            {
+                "start": _iso(_moment(start)),
+                "end": _iso(_moment(end)),
+                **{name: self.counters[name][index] for name in names},
+            }
+            for index, (start, end) in enumerate(zip(self.starts, self.ends))
+        ]
+
+
+def _histogram_requests(
+    start: Moment,
+    end: Moment,
+    interval: str,
+    emailIds: Optional[Sequence[int]],
+    shards: int,
+) -> List[dict[str, Any]]:
+    id_groups: List[Optional[List[int]]] = list(chunked(emailIds, EMAIL_IDS_PER_REQUEST)) if emailIds else [None]
+    return [
+        {"interval": interval, "startTimestamp": _iso(low), "endTimestamp": _iso(high), "emailIds": ids}
+        for low, high in shard_ranges(start, end, interval, shards)
+        for ids in id_groups
+    ]
+
+
+def email_statistics(
+    app: Any,
+    start: Moment,
+    end: Moment,
+    interval: str = "DAY",
+    emailIds: Optional[Sequence[int]] = None,
+    shards: Optional[int] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> EmailStatsSeries:
+    """
+    Fetch an email statistics histogram as a columnar series, in parallel shards.
+
+    ``[start, end)`` is cut into ``shards`` ranges at bucket boundaries and
+    ``emailIds`` into groups of 100, and every (range, group) pair is one
+    ``get_email_statistics_histogram`` request, with up to
+    ``max_concurrency`` in flight. Groups are summed bucket by bucket.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        start (Union[str, int, datetime]): Range start, as ISO 8601, epoch milliseconds or datetime
+        end (Union[str, int, datetime]): Range end
+        interval (str): ``YEAR``, ``QUARTER``, ``MONTH``, ``WEEK``, ``DAY``, ``HOUR``, ``QUARTER_HOUR``, ``MINUTE`` or ``SECOND``
+        emailIds (Optional[Sequence[int]]): Emails to include. Includes every email when None.
+        shards (Optional[int]): Number of time ranges. Defaults to ``max_concurrency``.
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        EmailStatsSeries: Counters per bucket
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+    Example:
+        >>> series = email_statistics(app, "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z", "DAY", emailIds=email_ids)
+        >>> weekly = series.rollup("WEEK")
+        >>> open_rate = weekly.rate("open")
+    """
+    requests = _histogram_requests(start, end, interval, emailIds, shards or max_concurrency)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        responses = list(executor.map(lambda kwargs: app.marketing.get_email_statistics_histogram(**kwargs), requests))
+    return EmailStatsSeries.from_histograms(interval, responses)
+
+
+async def aemail_statistics(
+    app: Any,
+    start: Moment,
+    end: Moment,
+    interval: str = "DAY",
+    emailIds: Optional[Sequence[int]] = None,
+    shards: Optional[int] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> EmailStatsSeries:
+    """
+    Async counterpart of ``email_statistics``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        start (Union[str, int, datetime]): Range start, as ISO 8601, epoch milliseconds or datetime
+        end (Union[str, int, datetime]): Range end
+        interval (str): Histogram interval, e.g. ``DAY``
+        emailIds (Optional[Sequence[int]]): Emails to include. Includes every email when None.
+        shards (Optional[int]): Number of time ranges. Defaults to ``max_concurrency``.
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        EmailStatsSeries: Counters per bucket
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    requests = _histogram_requests(start, end, interval, emailIds, shards or max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(kwargs: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await app.marketing.aget_email_statistics_histogram(**kwargs)
+
+    responses = await asyncio.gather(*(fetch(kwargs) for kwargs in requests))
+    return EmailStatsSeries.from_histograms(interval, responses)
+
+
+def _sum_aggregates(responses: Iterable[dict[str, Any]]) -> dict[str, int]:
+    totals = dict.fromkeys(COUNTERS, 0)
+    for response in responses:
+        for name, value in ((response.get("aggregate") or {}).get("counters") or {}).items():
+            totals[name] = totals.get(name, 0) + int(value or 0)
+    return totals
+
+
+def email_statistics_totals(
+    app: Any,
+    start: Moment,
+    end: Moment,
+    emailIds: Optional[Sequence[int]] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, int]:
+    """
+    Total counters of many emails over a range, from parallel ``list_email_statistics`` requests.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        start (Union[str, int, datetime]): Range start, as ISO 8601, epoch milliseconds or datetime
+        end (Union[str, int, datetime]): Range end
+        emailIds (Optional[Sequence[int]]): Emails to include, 100 per request. Includes every email when None.
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        dict[str, int]: Counter name to total, e.g. {"sent": 12000, "open": 4100, ...}
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    low, high = _iso(_moment(start)), _iso(_moment(end))
+    id_groups = list(chunked(emailIds, EMAIL_IDS_PER_REQUEST)) if emailIds else [None]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        responses = executor.map(
+            lambda ids: app.marketing.list_email_statistics(startTimestamp=low, endTimestamp=high, emailIds=ids),
+            id_groups,
+        )
+        return _sum_aggregates(responses)
+
+
+async def aemail_statistics_totals(
+    app: Any,
+    start: Moment,
+    end: Moment,
+    emailIds: Optional[Sequence[int]] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, int]:
+    """
+    Async counterpart of ``email_statistics_totals``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        start (Union[str, int, datetime]): Range start, as ISO 8601, epoch milliseconds or datetime
+        end (Union[str, int, datetime]): Range end
+        emailIds (Optional[Sequence[int]]): Emails to include, 100 per request. Includes every email when None.
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        dict[str, int]: Counter name to total
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    low, high = _iso(_moment(start)), _iso(_moment(end))
+    id_groups = list(chunked(emailIds, EMAIL_IDS_PER_REQUEST)) if emailIds else [None]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(ids: Optional[List[int]]) -> dict[str, Any]:
+        async with semaphore:
+            return await app.marketing.alist_email_statistics(startTimestamp=low, endTimestamp=high, emailIds=ids)
+
+    return _sum_aggregates(await asyncio.gather(*(fetch(ids) for ids in id_groups)))
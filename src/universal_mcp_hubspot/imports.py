@@ -0,0 +1,621 @@
+import asyncio
+import csv
+import inspect
+import io
+import json
+import tempfile
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Union
+
+from universal_mcp_hubspot.pagination import apaginate, paginate
+
+DEFAULT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+PARQUET_BATCH_SIZE = 10_000
+
+TERMINAL_IMPORT_STATES = frozenset({"DONE", "FAILED", "CANCELED", "REVERTED"})
+# Queued imports change slowly, so polling starts further apart than for running ones
+QUEUED_IMPORT_STATES = frozenset({"STARTED", "DEFERRED"})
+DEFAULT_MIN_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+DEFAULT_POLL_BACKOFF = 1.5
+IMPORT_ERRORS_PAGE_SIZE = 100
+
+# Object type IDs HubSpot expects in import requests
+OBJECT_TYPE_IDS = {
+    "contacts": "0-1",
+    "companies": "0-2",
+    "deals": "0-3",
+    "tickets": "0-5",
+    "products": "0-7",
+    "line_items": "0-8",
+    "quotes": "0-14",
+}
+# Properties that identify existing records, for imports that update
+ID_COLUMN_TYPES = {
+    "hs_object_id": "HUBSPOT_OBJECT_ID",
+    "email": "HUBSPOT_ALTERNATE_ID",
+    "domain": "HUBSPOT_ALTERNATE_ID",
+}
+
+
+def parquet_records(path: str, batch_size: int = PARQUET_BATCH_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Lazily read the rows of a Parquet file as dicts, one record batch at a time.
+
+    Args:
+        path (str): Parquet file
+        batch_size (int): Rows decoded at once
+
+    Returns:
+        Iterator[dict[str, Any]]: One dict per row, keyed by column name
+
+    Raises:
+        ImportError: Raised when pyarrow is not installed.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Reading Parquet needs pyarrow: pip install universal-mcp-hubspot[parquet]"
+        ) from exc
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+class ImportBuilder:
+    """
+    Builds a ``create_crm_import`` request from records without holding the file in memory.
+
+    Records are written as CSV rows into a ``SpooledTemporaryFile`` that
+    moves to disk once it exceeds ``spool_max_size``, and the upload streams
+    that file in chunks as the multipart body. Column mappings are derived
+    from the object type's property metadata (served from
+    ``app.metadata_cache``): a column maps to the property whose internal
+    name or label matches it, case-insensitively.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        object_type (str): Object type to import into, e.g. ``contacts``, or an object type ID such as ``2-123456``
+        name (Optional[str]): Name of the import in HubSpot. Defaults to ``"<object_type> import"``.
+        operation (str): ``CREATE``, ``UPDATE`` or ``UPSERT``
+        columns (Optional[List[str]]): CSV header. Defaults to the keys of the first record.
+        date_format (Optional[str]): ``MONTH_DAY_YEAR``, ``DAY_MONTH_YEAR`` or ``YEAR_MONTH_DAY``
+        ignore_unknown_columns (bool): Leave columns without a matching property unmapped instead of raising
+        spool_max_size (int): Bytes kept in memory before the CSV is moved to a temporary file
+
+    Example:
+        >>> with ImportBuilder(app, "contacts", operation="UPSERT") as builder:
+        ...     builder.extend(rows)
+        ...     response = builder.submit()
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        object_type: str,
+        name: Optional[str] = None,
+        operation: str = "CREATE",
+        columns: Optional[List[str]] = None,
+        date_format: Optional[str] = None,
+        ignore_unknown_columns: bool = False,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+    ) -> None:
+        self.app = app
+        self.object_type = object_type
+        self.object_type_id = OBJECT_TYPE_IDS.get(object_type, object_type)
+        self.name = name or f"{object_type} import"
+        self.operation = operation
+        self.columns = list(columns) if columns else None
+        self.date_format = date_format
+        self.ignore_unknown_columns = ignore_unknown_columns
+        self.rows = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_max_size, mode="w+b")
+        self._text = io.TextIOWrapper(self._file, encoding="utf-8", newline="", write_through=True)
+        self._writer: Optional[csv.DictWriter] = None
+
+    @property
+    def file_name(self) -> str:
+        """Name of the uploaded CSV file."""
+        return f"{self.object_type}.csv"
+
+    @property
+    def size(self) -> int:
+        """Bytes of CSV written so far."""
+        return self._file.tell()
+
+    def add(self, record: dict[str, Any]) -> None:
+        """
+        Append one record as a CSV row.
+
+        Args:
+            record (dict[str, Any]): Column values; None becomes an empty cell
+
+        Raises:
+            ValueError: Raised when the record has a column that is not in the header.
+        """
+        if self._writer is None:
+            self.columns = self.columns or list(record)
+            self._writer = csv.DictWriter(self._text, fieldnames=self.columns, extrasaction="raise")
+            self._writer.writeheader()
+        self._writer.writerow(record)
+        self.rows += 1
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Append records from any iterable, consuming it lazily.
+
+        Args:
+            records (Iterable[dict[str, Any]]): Records, e.g. a generator over a database cursor
+
+        Returns:
+            int: Number of records appended
+        """
+        before = self.rows
+        for record in records:
+            self.add(record)
+        return self.rows - before
+
+    def extend_parquet(self, path: str, batch_size: int = PARQUET_BATCH_SIZE) -> int:
+        """
+        Append every row of a Parquet file, converting it to CSV batch by batch.
+
+        Args:
+            path (str): Parquet file
+            batch_size (int): Rows decoded at once
+
+        Returns:
+            int: Number of records appended
+
+        Raises:
+            ImportError: Raised when pyarrow is not installed.
+        """
+        return self.extend(parquet_records(path, batch_size))
+
+    def _mappings(self, properties: dict[str, Any]) -> List[dict[str, Any]]:
+        by_key: dict[str, str] = {}
+        for prop in properties.get("results") or []:
+            by_key.setdefault(prop["name"].lower(), prop["name"])
+            if prop.get("label"):
+                by_key.setdefault(prop["label"].lower(), prop["name"])
+        mappings, unknown = [], []
+        for column in self.columns or []:
+            property_name = by_key.get(column.strip().lower())
+            if property_name is None:
+                unknown.append(column)
+                continue
+            mapping = {
+                "columnObjectTypeId": self.object_type_id,
+                "columnName": column,
+                "propertyName": property_name,
+            }
+            if self.operation != "CREATE" and property_name in ID_COLUMN_TYPES:
+                mapping["idColumnType"] = ID_COLUMN_TYPES[property_name]
+            mappings.append(mapping)
+        if unknown and not self.ignore_unknown_columns:
+            raise ValueError(f"No {self.object_type} property matches the columns: {', '.join(unknown)}.")
+        return mappings
+
+    def _import_request(self, properties: dict[str, Any]) -> dict[str, Any]:
+        if self.rows == 0:
+            raise ValueError("The import has no records.")
+        request: dict[str, Any] = {
+            "name": self.name,
+            "importOperations": {self.object_type_id: self.operation},
+            "files": [
+                {
+                    "fileName": self.file_name,
+                    "fileFormat": "CSV",
+                    "fileImportPage": {"hasHeader": True, "columnMappings": self._mappings(properties)},
+                }
+            ],
+        }
+        if self.date_format:
+            request["dateFormat"] = self.date_format
+        return request
+
+    def import_request(self) -> dict[str, Any]:
+        """
+        The ``importRequest`` metadata with generated column mappings.
+
+        Returns:
+            dict[str, Any]: Import name, operation and the CSV file's column mappings
+
+        Raises:
+            ValueError: Raised when the import is empty or a column matches no property.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return self._import_request(self.app.crm.get_properties_by_object_type(self.object_type))
+
+    async def aimport_request(self) -> dict[str, Any]:
+        """
+        Async counterpart of ``import_request``.
+
+        Returns:
+            dict[str, Any]: Import name, operation and the CSV file's column mappings
+
+        Raises:
+            ValueError: Raised when the import is empty or a column matches no property.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return self._import_request(await self.app.crm.aget_properties_by_object_type(self.object_type))
+
+    def _upload(self) -> tuple[str, Any, str]:
+        self._text.flush()
+        self._file.seek(0)
+        return (self.file_name, self._file, "text/csv")
+
+    def submit(self) -> dict[str, Any]:
+        """
+        Start the import, streaming the CSV as the multipart body.
+
+        Returns:
+            dict[str, Any]: The import job, including its ``id`` and ``state``
+
+        Raises:
+            ValueError: Raised when the import is empty or a column matches no property.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        request = self.import_request()
+        return self.app.crm.create_crm_import(files=self._upload(), importRequest=json.dumps(request))
+
+    async def asubmit(self) -> dict[str, Any]:
+        """
+        Async counterpart of ``submit``.
+
+        Returns:
+            dict[str, Any]: The import job, including its ``id`` and ``state``
+
+        Raises:
+            ValueError: Raised when the import is empty or a column matches no property.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        request = await self.aimport_request()
+        return await self.app.crm.acreate_crm_import(files=self._upload(), importRequest=json.dumps(request))
+
+    def close(self) -> None:
+        """Delete the spooled CSV."""
+        self._text.close()
+
+    def __enter__(self) -> "ImportBuilder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class PollSchedule:
+    """
+    Adaptive delay between import status polls.
+
+    The delay starts at ``min_interval`` (four times that while the import is
+    queued), grows by ``backoff`` with every poll that shows no change and
+    drops back as soon as the state or progress counters move.
+
+    Args:
+        min_interval (float): Seconds between polls right after a change
+        max_interval (float): Upper bound of the delay
+        backoff (float): Growth factor per unchanged poll
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+
+    def next(self, changed: bool, queued: bool = False) -> float:
+        """
+        Delay before the next poll.
+
+        Args:
+            changed (bool): Whether the last poll showed a new state or progress
+            queued (bool): Whether every watched import is still waiting to start
+
+        Returns:
+            float: Seconds to sleep
+        """
+        base = self.min_interval * (4 if queued else 1)
+        if changed:
+            self.interval = base
+        else:
+            self.interval = max(base, min(self.max_interval, self.interval * self.backoff))
+        return self.interval
+
+
+class ImportJob:
+    """
+    Handle on a CRM import started with ``create_crm_import``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        import_id (str): ID of the import
+        job (Optional[dict[str, Any]]): Last known import object, e.g. the ``create_crm_import`` response
+
+    Example:
+        >>> job = ImportJob(app, builder.submit()["id"])
+        >>> job.result(timeout=3600)
+        >>> for error in job.errors():
+        ...     print(error["errorType"], error["sourceData"]["lineNumber"])
+    """
+
+    def __init__(self, app: Any, import_id: str, job: Optional[dict[str, Any]] = None) -> None:
+        self.app = app
+        self.id = str(import_id)
+        self.job: dict[str, Any] = job or {}
+        self.polls = 0
+
+    @property
+    def state(self) -> Optional[str]:
+        """Import state, e.g. ``PROCESSING`` or ``DONE``; None before the first poll."""
+        return self.job.get("state")
+
+    @property
+    def done(self) -> bool:
+        """Whether the import reached a terminal state."""
+        return self.state in TERMINAL_IMPORT_STATES
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Progress counters such as ``TOTAL_ROWS``, ``CREATED_OBJECTS`` and ``ERRORS``."""
+        return dict((self.job.get("metadata") or {}).get("counters") or {})
+
+    def _progress(self) -> tuple[Any, ...]:
+        return (self.state, tuple(sorted(self.counters.items())))
+
+    def update(self, job: dict[str, Any]) -> bool:
+        """
+        Store a newer import object.
+
+        Args:
+            job (dict[str, Any]): Import object returned by the API
+
+        Returns:
+            bool: Whether the state or progress counters changed
+        """
+        before = self._progress()
+        self.job = job
+        return self._progress() != before
+
+    def refresh(self) -> bool:
+        """
+        Poll the import once.
+
+        Returns:
+            bool: Whether the state or progress counters changed
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        self.polls += 1
+        return self.update(self.app.crm.get_import_by_id(self.id))
+
+    async def arefresh(self) -> bool:
+        """
+        Async counterpart of ``refresh``.
+
+        Returns:
+            bool: Whether the state or progress counters changed
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        self.polls += 1
+        return self.update(await self.app.crm.aget_import_by_id(self.id))
+
+    def result(self, timeout: Optional[float] = None, schedule: Optional[PollSchedule] = None) -> dict[str, Any]:
+        """
+        Block until the import finishes, polling on an adaptive schedule.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait before giving up. Waits indefinitely when None.
+            schedule (Optional[PollSchedule]): Polling intervals. Defaults to ``PollSchedule()``.
+
+        Returns:
+            dict[str, Any]: The final import object
+
+        Raises:
+            TimeoutError: Raised when the import is still running after ``timeout`` seconds.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        schedule = schedule or PollSchedule()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = self.refresh()
+        while not self.done:
+            delay = schedule.next(changed, self.state in QUEUED_IMPORT_STATES)
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Import {self.id} is still {self.state} after {timeout} seconds.")
+            time.sleep(delay)
+            changed = self.refresh()
+        return self.job
+
+    async def aresult(self, timeout: Optional[float] = None, schedule: Optional[PollSchedule] = None) -> dict[str, Any]:
+        """
+        Async counterpart of ``result``.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait before giving up. Waits indefinitely when None.
+            schedule (Optional[PollSchedule]): Polling intervals. Defaults to ``PollSchedule()``.
+
+        Returns:
+            dict[str, Any]: The final import object
+
+        Raises:
+            TimeoutError: Raised when the import is still running after ``timeout`` seconds.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        watcher = ImportWatcher(self.app, schedule=schedule)
+        watcher.watch(self)
+        await watcher.run(timeout)
+        return self.job
+
+    def errors(self, page_size: int = IMPORT_ERRORS_PAGE_SIZE) -> Iterator[dict[str, Any]]:
+        """
+        Lazily stream every error row of the import.
+
+        Args:
+            page_size (int): Errors per request
+
+        Returns:
+            Iterator[dict[str, Any]]: Error objects with ``errorType``, ``invalidValue`` and ``sourceData``
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return paginate(self.app.crm.get_import_errors_by_id, importId=self.id, limit=page_size)
+
+    def aerrors(self, page_size: int = IMPORT_ERRORS_PAGE_SIZE) -> AsyncIterator[dict[str, Any]]:
+        """
+        Async counterpart of ``errors``.
+
+        Args:
+            page_size (int): Errors per request
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Error objects with ``errorType``, ``invalidValue`` and ``sourceData``
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return apaginate(self.app.crm.get_import_errors_by_id, importId=self.id, limit=page_size)
+
+    def cancel(self) -> dict[str, Any]:
+        """
+        Cancel the import.
+
+        Returns:
+            dict[str, Any]: The API response
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return self.app.crm.cancel_import_by_id(self.id)
+
+    async def acancel(self) -> dict[str, Any]:
+        """
+        Async counterpart of ``cancel``.
+
+        Returns:
+            dict[str, Any]: The API response
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        return await self.app.crm.acancel_import_by_id(self.id)
+
+
+class ImportWatcher:
+    """
+    Awaits many imports from one event loop with a shared polling budget.
+
+    With more than one import pending, each poll is a single
+    ``get_crm_imports`` listing of the portal's active imports instead of one
+    ``get_import_by_id`` per import; only imports that dropped out of the
+    active list are fetched individually, once, to read their final state.
+    The delay between polls follows one ``PollSchedule`` for all imports.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        schedule (Optional[PollSchedule]): Polling intervals. Defaults to ``PollSchedule()``.
+
+    Example:
+        >>> watcher = ImportWatcher(app)
+        >>> for response in responses:
+        ...     watcher.watch(response["id"], on_complete=lambda job: print(job.id, job.state))
+        >>> await watcher.run(timeout=3600)
+    """
+
+    def __init__(self, app: Any, schedule: Optional[PollSchedule] = None) -> None:
+        self.app = app
+        self.schedule = schedule or PollSchedule()
+        self.jobs: dict[str, ImportJob] = {}
+        self._callbacks: dict[str, List[Callable[[ImportJob], Any]]] = {}
+        self.polls = 0
+
+    def watch(
+        self,
+        job: Union[ImportJob, str],
+        on_complete: Optional[Callable[[ImportJob], Any]] = None,
+    ) -> ImportJob:
+        """
+        Add an import to watch.
+
+        Args:
+            job (Union[ImportJob, str]): Import handle or import ID
+            on_complete (Optional[Callable[[ImportJob], Any]]): Called with the job once it reaches a terminal state; may be a coroutine function
+
+        Returns:
+            ImportJob: The watched job
+        """
+        if not isinstance(job, ImportJob):
+            job = self.jobs.get(str(job)) or ImportJob(self.app, str(job))
+        self.jobs.setdefault(job.id, job)
+        if on_complete is not None:
+            self._callbacks.setdefault(job.id, []).append(on_complete)
+        return self.jobs[job.id]
+
+    @property
+    def pending(self) -> List[ImportJob]:
+        """Watched imports that have not finished."""
+        return [job for job in self.jobs.values() if not job.done]
+
+    async def _poll(self, pending: List[ImportJob]) -> bool:
+        self.polls += 1
+        if len(pending) == 1:
+            return await pending[0].arefresh()
+        active = {
+            str(job["id"]): job
+            async for job in apaginate(self.app.crm.get_crm_imports, limit=100)
+        }
+        changed = False
+        for job in pending:
+            if job.id in active:
+                changed = job.update(active[job.id]) or changed
+            else:
+                changed = await job.arefresh() or changed
+        return changed
+
+    async def _complete(self, job: ImportJob) -> None:
+        for callback in self._callbacks.pop(job.id, []):
+            outcome = callback(job)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    async def run(self, timeout: Optional[float] = None) -> List[ImportJob]:
+        """
+        Poll until every watched import finished, calling ``on_complete`` callbacks as they do.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait before giving up. Waits indefinitely when None.
+
+        Returns:
+            List[ImportJob]: Every watched job, in the order they were added
+
+        Raises:
+            TimeoutError: Raised when imports are still running after ``timeout`` seconds.
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pending = self.pending
+            for job in [job for job in self.jobs.values() if job.done and job.id in self._callbacks]:
+                await self._complete(job)
+            if not pending:
+                return list(self.jobs.values())
+            changed = await self._poll(pending)
+            for job in pending:
+                if job.done:
+                    await self._complete(job)
+            pending = self.pending
+            if not pending:
+                return list(self.jobs.values())
+            queued = all(job.state in QUEUED_IMPORT_STATES for job in pending)
+            delay = self.schedule.next(changed, queued)
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"{len(pending)} imports are still running after {timeout} seconds.")
+            await asyncio.sleep(delay)
@@ -0,0 +1,253 @@
+import threading
+import time
+from typing import Any, Iterable, List, Optional
+
+import httpx
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RequestEvent:
+    """
+    What happened to one HubSpot request, passed to every ``RequestHook``.
+
+    Attributes:
+        tool (Optional[str]): Name of the tool method that issued the request, e.g. ``get_contact_by_id``
+        method (str): HTTP method
+        endpoint (str): URL path template, e.g. ``/crm/v3/objects/contacts/{contactId}``
+        url (str): Full request URL
+        status (Optional[int]): Final HTTP status, None when the request failed without a response
+        latency (float): Seconds from the first attempt to the final outcome, rate-limit waits and retries included
+        bytes_out (int): Request body size
+        bytes_in (int): Response body size as received on the wire, 0 for cached responses
+        retries (int): Attempts after the first one
+        cached (bool): Whether the response was served from ``metadata_cache``
+        error (Optional[BaseException]): Transport error that ended the request
+        context (dict[Any, Any]): Scratch space for hooks, e.g. to carry a span from ``on_request`` to ``on_response``
+    """
+
+    def __init__(self, request: httpx.Request) -> None:
+        call = request.extensions.get("hubspot_tool_call")
+        self.tool: Optional[str] = call.name if call is not None else None
+        self.method = request.method
+        self.endpoint = call.endpoint(request.url.path) if call is not None else request.url.path
+        self.url = str(request.url)
+        self.status: Optional[int] = None
+        self.latency = 0.0
+        self.bytes_out = int(request.headers.get("Content-Length") or 0)
+        self.bytes_in = 0
+        self.retries = 0
+        self.cached = False
+        self.error: Optional[BaseException] = None
+        self.context: dict[Any, Any] = {}
+        self._started = time.perf_counter()
+
+
+class RequestHook:
+    """
+    Base class for request instrumentation; override any of the three callbacks.
+
+    Hooks run inline on the request path, so they should be cheap and must not
+    raise.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called before the first attempt is sent."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called with the final response, after retries, including HTTP error statuses."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the request failed without a response, e.g. on a connection error."""
+
+
+def start_request(hooks: Iterable[RequestHook], request: httpx.Request) -> RequestEvent:
+    """Create the event for ``request`` and run the ``on_request`` hooks."""
+    event = RequestEvent(request)
+    for hook in hooks:
+        hook.on_request(event)
+    return event
+
+
+def finish_request(
+    hooks: Iterable[RequestHook],
+    event: RequestEvent,
+    response: httpx.Response,
+    retries: int,
+    cached: bool = False,
+) -> None:
+    """Record the final response on ``event`` and run the ``on_response`` hooks."""
+    event.latency = time.perf_counter() - event._started
+    event.status = response.status_code
+    event.bytes_in = 0 if cached else response.num_bytes_downloaded or len(response.content)
+    event.retries = retries
+    event.cached = cached
+    for hook in hooks:
+        hook.on_response(event)
+
+
+def fail_request(
+    hooks: Iterable[RequestHook], event: RequestEvent, error: BaseException, retries: int
+) -> None:
+    """Record a transport error on ``event`` and run the ``on_error`` hooks."""
+    event.latency = time.perf_counter() - event._started
+    event.error = error
+    event.retries = retries
+    for hook in hooks:
+        hook.on_error(event)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+
+
+class PrometheusExporter(RequestHook):
+    """
+    Aggregate request events into Prometheus metrics.
+
+    Series are labelled by tool, HTTP method and endpoint template (plus status
+    for request counts), never by record ID. ``render()`` returns the text
+    exposition format, ready to serve from a ``/metrics`` handler.
+
+    Args:
+        namespace (str): Prefix of every metric name
+        buckets (Iterable[float]): Upper bounds, in seconds, of the latency histogram
+    """
+
+    def __init__(
+        self, namespace: str = "hubspot", buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: dict[tuple, int] = {}
+        self._cached: dict[tuple, int] = {}
+        self._latency: dict[tuple, List[Any]] = {}
+        self._bytes_out: dict[tuple, int] = {}
+        self._bytes_in: dict[tuple, int] = {}
+        self._retries: dict[tuple, int] = {}
+
+    def _record(self, event: RequestEvent, status: str) -> None:
+        key = (event.tool or "", event.method, event.endpoint)
+        with self._lock:
+            self._requests[key + (status,)] = self._requests.get(key + (status,), 0) + 1
+            if event.cached:
+                self._cached[key] = self._cached.get(key, 0) + 1
+                return
+            # Per-bucket counts followed by sum and count
+            series = self._latency.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for index, bound in enumerate(self.buckets):
+                if event.latency <= bound:
+                    series[index] += 1
+            series[-2] += event.latency
+            series[-1] += 1
+            self._bytes_out[key] = self._bytes_out.get(key, 0) + event.bytes_out
+            self._bytes_in[key] = self._bytes_in.get(key, 0) + event.bytes_in
+            self._retries[key] = self._retries.get(key, 0) + event.retries
+
+    def on_response(self, event: RequestEvent) -> None:
+        self._record(event, str(event.status))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event, "error")
+
+    def render(self) -> str:
+        """
+        Current metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: One ``# HELP``/``# TYPE`` block per metric followed by its samples
+        """
+        prefix = self.namespace
+        names = ("tool", "method", "endpoint")
+        lines: List[str] = []
+        with self._lock:
+            counters = (
+                ("requests_total", "HubSpot API requests by final status.", self._requests, names + ("status",)),
+                ("cached_responses_total", "Requests answered from the metadata cache.", self._cached, names),
+                ("request_bytes_total", "Request body bytes sent.", self._bytes_out, names),
+                ("response_bytes_total", "Response body bytes received.", self._bytes_in, names),
+                ("retries_total", "Request attempts beyond the first.", self._retries, names),
+            )
+            for name, help_text, samples, label_names in counters:
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for key, value in sorted(samples.items()):
+                    lines.append(f"{prefix}_{name}{{{_labels(label_names, key)}}} {value}")
+            name = f"{prefix}_request_duration_seconds"
+            lines.append(f"# HELP {name} Latency of HubSpot API requests, retries included.")
+            lines.append(f"# TYPE {name} histogram")
+            for key, series in sorted(self._latency.items()):
+                labels = _labels(names, key)
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {series[-1]}')
+                lines.append(f"{name}_sum{{{labels}}} {series[-2]}")
+                lines.append(f"{name}_count{{{labels}}} {series[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Emit one OpenTelemetry client span per HubSpot request.
+
+    Spans are named after the tool (falling back to ``METHOD endpoint``) and
+    carry the HTTP semantic-convention attributes plus ``hubspot.tool`` and
+    ``hubspot.cached``. Requires the ``opentelemetry-api`` package
+    (``pip install universal-mcp-hubspot[otel]``).
+
+    Args:
+        tracer (Optional[Any]): Tracer to use. Defaults to ``trace.get_tracer("universal_mcp_hubspot")``.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetry support requires the 'opentelemetry-api' package. Install it with 'pip install universal-mcp-hubspot[otel]'."
+            ) from exc
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("universal_mcp_hubspot")
+
+    def on_request(self, event: RequestEvent) -> None:
+        span = self.tracer.start_span(
+            event.tool or f"{event.method} {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "url.full": event.url,
+                "url.template": event.endpoint,
+                "hubspot.tool": event.tool or "",
+            },
+        )
+        event.context[self] = span
+
+    def _end(self, event: RequestEvent, error: bool) -> None:
+        span = event.context.pop(self, None)
+        if span is None:
+            return
+        span.set_attribute("http.request.body.size", event.bytes_out)
+        span.set_attribute("http.response.body.size", event.bytes_in)
+        span.set_attribute("http.request.resend_count", event.retries)
+        span.set_attribute("hubspot.cached", event.cached)
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error.type", type(event.error).__name__)
+        elif error:
+            span.set_attribute("error.type", str(event.status))
+        if error:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def on_response(self, event: RequestEvent) -> None:
+        self._end(event, error=event.status is not None and event.status >= 400)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._end(event, error=True)
@@ -0,0 +1,257 @@
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+import httpx
+
+from universal_mcp_hubspot.batching import DEFAULT_CONCURRENCY, chunk_error
+from universal_mcp_hubspot.pagination import apaginate, paginate
+
+LIST_MEMBERSHIP_PAGE_SIZE = 250
+# Record IDs per add/remove request; HubSpot accepts up to 100,000
+DEFAULT_MEMBERSHIP_CHUNK_SIZE = 10_000
+
+
+def compact_ids(ids: Iterable[Any]) -> array:
+    """
+    Record IDs as a sorted, de-duplicated array of 64-bit integers.
+
+    Holds 8 bytes per ID instead of a Python ``int`` or ``str`` object each,
+    so half a million members take about 4 MB. Input that is already strictly
+    ascending, such as list memberships, is not copied again.
+
+    Args:
+        ids (Iterable[Any]): Record IDs as ints or numeric strings
+
+    Returns:
+        array: Ascending unique IDs (typecode ``q``)
+    """
+    values = ids if isinstance(ids, array) and ids.typecode == "q" else array("q", (int(record_id) for record_id in ids))
+    if all(values[index] < values[index + 1] for index in range(len(values) - 1)):
+        return values
+    unique = array("q")
+    previous = None
+    for record_id in sorted(values):
+        if record_id != previous:
+            unique.append(record_id)
+            previous = record_id
+    return unique
+
+
+def diff_ids(current: array, desired: array) -> tuple[array, array]:
+    """
+    Merge two ascending ID arrays into the IDs to add and to remove.
+
+    Args:
+        current (array): Current members, as returned by ``compact_ids``
+        desired (array): Desired members, as returned by ``compact_ids``
+
+    Returns:
+        tuple[array, array]: IDs only in ``desired`` (to add) and IDs only in ``current`` (to remove)
+    """
+    to_add, to_remove = array("q"), array("q")
+    i = j = 0
+    while i < len(current) and j < len(desired):
+        if current[i] == desired[j]:
+            i += 1
+            j += 1
+        elif current[i] < desired[j]:
+            to_remove.append(current[i])
+            i += 1
+        else:
+            to_add.append(desired[j])
+            j += 1
+    to_remove.extend(current[i:])
+    to_add.extend(desired[j:])
+    return to_add, to_remove
+
+
+def iter_list_members(app: Any, listId: str, page_size: int = LIST_MEMBERSHIP_PAGE_SIZE) -> Iterator[int]:
+    """
+    Lazily stream the record IDs of every member of a list.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        listId (str): The ILS ID of the list
+        page_size (int): Members per request, at most 250
+
+    Returns:
+        Iterator[int]: Record IDs in ascending order
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    for membership in paginate(app.fetch_list_memberships, listId=listId, limit=page_size):
+        yield int(membership["recordId"])
+
+
+async def aiter_list_members(app: Any, listId: str, page_size: int = LIST_MEMBERSHIP_PAGE_SIZE) -> AsyncIterator[int]:
+    """
+    Async counterpart of ``iter_list_members``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        listId (str): The ILS ID of the list
+        page_size (int): Members per request, at most 250
+
+    Returns:
+        AsyncIterator[int]: Record IDs in ascending order
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    async for membership in apaginate(app.fetch_list_memberships, listId=listId, limit=page_size):
+        yield int(membership["recordId"])
+
+
+class ListSyncResult:
+    """
+    Outcome of ``reconcile_list``.
+
+    Attributes:
+        list_id (str): The ILS ID of the list
+        to_add (array): Desired IDs that were not members
+        to_remove (array): Members that are not desired
+        unchanged (int): Members kept as they are
+        added (int): Records HubSpot reports as added
+        removed (int): Records HubSpot reports as removed
+        missing (List[str]): Record IDs HubSpot ignored because they do not exist
+        errors (List[dict[str, Any]]): One entry per failed add/remove request
+    """
+
+    def __init__(self, list_id: str, to_add: array, to_remove: array, unchanged: int) -> None:
+        self.list_id = list_id
+        self.to_add = to_add
+        self.to_remove = to_remove
+        self.unchanged = unchanged
+        self.added = 0
+        self.removed = 0
+        self.missing: List[str] = []
+        self.errors: List[dict[str, Any]] = []
+
+    def _jobs(self, app: Any, chunk_size: int, asynchronous: bool) -> List[tuple[Any, array]]:
+        prefix = "a" if asynchronous else ""
+        add = getattr(app, f"{prefix}add_records_to_list")
+        remove = getattr(app, f"{prefix}remove_records_from_list")
+        return [
+            (method, ids[start : start + chunk_size])
+            for method, ids in ((remove, self.to_remove), (add, self.to_add))
+            for start in range(0, len(ids), chunk_size)
+        ]
+
+    def _record(self, index: int, size: int, response: Any = None, error: Optional[Exception] = None) -> None:
+        if error is not None:
+            self.errors.append(chunk_error(index, size, error))
+            return
+        response = response or {}
+        self.added += len(response.get("recordIdsAdded") or [])
+        self.removed += len(response.get("recordIdsRemoved") or [])
+        self.missing.extend(str(record_id) for record_id in response.get("recordIdsMissing") or [])
+
+
+def _desired_and_unchanged(current: array, desired: Iterable[Any]) -> tuple[array, array, int]:
+    to_add, to_remove = diff_ids(current, compact_ids(desired))
+    return to_add, to_remove, len(current) - len(to_remove)
+
+
+def reconcile_list(
+    app: Any,
+    listId: str,
+    desired: Iterable[Any],
+    chunk_size: int = DEFAULT_MEMBERSHIP_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False,
+) -> ListSyncResult:
+    """
+    Make the members of a MANUAL or SNAPSHOT list equal to ``desired``, sending only the difference.
+
+    Current members are streamed with ``fetch_list_memberships`` into a
+    compact integer array and merged against the desired IDs; only the IDs to
+    add and remove are sent, in chunks of ``chunk_size`` with up to
+    ``max_concurrency`` ``add_records_to_list``/``remove_records_from_list``
+    requests in flight.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        listId (str): The ILS ID of the list
+        desired (Iterable[Any]): Record IDs the list should contain, in any order, or an array from ``compact_ids``
+        chunk_size (int): Record IDs per add/remove request
+        max_concurrency (int): Maximum number of requests in flight
+        dry_run (bool): Only compute the difference
+
+    Returns:
+        ListSyncResult: The difference and what HubSpot applied; failed chunks are reported in ``errors``
+
+    Raises:
+        HTTPStatusError: Raised when reading the current members fails with detailed error information including status code and response body.
+
+    Example:
+        >>> result = reconcile_list(app, "123", customer_ids)
+        >>> print(len(result.to_add), len(result.to_remove), result.errors)
+    """
+    current = compact_ids(iter_list_members(app, listId))
+    result = ListSyncResult(str(listId), *_desired_and_unchanged(current, desired))
+    del current
+    jobs = [] if dry_run else result._jobs(app, chunk_size, asynchronous=False)
+    if not jobs:
+        return result
+
+    def send(job: tuple[Any, array]) -> Any:
+        method, ids = job
+        try:
+            return method(listId, [str(record_id) for record_id in ids]), None
+        except httpx.HTTPError as exc:
+            return None, exc
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for index, (job, (response, error)) in enumerate(zip(jobs, executor.map(send, jobs))):
+            result._record(index, len(job[1]), response, error)
+    return result
+
+
+async def areconcile_list(
+    app: Any,
+    listId: str,
+    desired: Iterable[Any],
+    chunk_size: int = DEFAULT_MEMBERSHIP_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False,
+) -> ListSyncResult:
+    """
+    Async counterpart of ``reconcile_list``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        listId (str): The ILS ID of the list
+        desired (Iterable[Any]): Record IDs the list should contain, in any order, or an array from ``compact_ids``
+        chunk_size (int): Record IDs per add/remove request
+        max_concurrency (int): Maximum number of requests in flight
+        dry_run (bool): Only compute the difference
+
+    Returns:
+        ListSyncResult: The difference and what HubSpot applied; failed chunks are reported in ``errors``
+
+    Raises:
+        HTTPStatusError: Raised when reading the current members fails with detailed error information including status code and response body.
+    """
+    current = array("q")
+    async for record_id in aiter_list_members(app, listId):
+        current.append(record_id)
+    current = compact_ids(current)
+    result = ListSyncResult(str(listId), *_desired_and_unchanged(current, desired))
+    del current
+    jobs = [] if dry_run else result._jobs(app, chunk_size, asynchronous=True)
+    numbered = enumerate(jobs)
+
+    async def worker() -> None:
+        for index, (method, ids) in numbered:
+            try:
+                response = await method(listId, [str(record_id) for record_id in ids])
+            except httpx.HTTPError as exc:
+                result._record(index, len(ids), error=exc)
+            else:
+                result._record(index, len(ids), response)
+
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(jobs)))))
+    return result
@@ -0,0 +1,248 @@
+"""
+Precomputed tool manifest for fast server startup.
+
+Building ``Tool`` objects parses every docstring and builds a pydantic
+argument model per method, which dominates cold start with 200+ tools. The
+manifest stores the resulting names, descriptions, tags and JSON schemas in
+``tool_manifest.json``; ``ManifestToolManager`` registers ``LazyTool``
+entries from it and binds the method and its argument model only when a tool
+is first called.
+
+Regenerate the manifest after changing any tool (``bump_and_release.sh`` does
+this on release)::
+
+    python -m universal_mcp_hubspot.manifest
+"""
+
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import Any, List, Optional
+
+from pydantic import PrivateAttr
+from universal_mcp.tools.func_metadata import FuncMetadata
+from universal_mcp.tools.manager import ToolManager
+from universal_mcp.tools.tools import Tool
+from universal_mcp.utils.docstring_parser import parse_docstring
+
+from universal_mcp_hubspot.tool_filter import APP_SEGMENT
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+MANIFEST_SOURCES = ("app.py", "api_segments/crm_api.py", "api_segments/marketing_api.py")
+# Naming and default tag used by ToolManager.register_tools_from_app
+TOOL_NAME_SEPARATOR = "_"
+DEFAULT_IMPORTANT_TAG = "important"
+
+
+def source_fingerprint() -> str:
+    """
+    Hash of the tool sources the manifest was built from.
+
+    Returns:
+        str: Hex digest that changes whenever a tool signature or docstring may have changed
+    """
+    digest = hashlib.sha256()
+    root = Path(__file__).parent
+    for name in MANIFEST_SOURCES:
+        digest.update((root / name).read_bytes())
+    return digest.hexdigest()
+
+
+def _filter_by_tags(tools: List[Tool], tags: List[str]) -> List[Tool]:
+    # Case-insensitive, any tag matches and "all" keeps every tool, like ToolManager
+    if "all" in tags:
+        return tools
+    wanted = {tag.lower() for tag in tags}
+    return [tool for tool in tools if wanted & {tag.lower() for tag in tool.tags}]
+
+
+def _filter_by_name(tools: List[Tool], tool_names: List[str]) -> List[Tool]:
+    # Case-insensitive substring match on the prefixed tool name, like ToolManager
+    wanted = [name.lower() for name in tool_names]
+    return [tool for tool in tools if any(name in tool.name.lower() for name in wanted)]
+
+
+def _segment_of(app: Any, tool: Any) -> str:
+    owner = tool.__self__
+    if owner is app:
+        return APP_SEGMENT
+    for name, value in vars(app).items():
+        if value is owner:
+            return name
+    raise ValueError(f"Tool {tool.__name__} does not belong to a segment of {app.name}.")
+
+
+def build_manifest(app: Any) -> dict[str, Any]:
+    """
+    Introspect every tool of ``app`` the way ``Tool.from_function`` does.
+
+    Args:
+        app (Any): A ``HubspotApp``
+
+    Returns:
+        dict[str, Any]: JSON-serializable manifest with the source fingerprint and one entry per tool
+    """
+    entries = []
+    for function in app.list_tools():
+        tool = Tool.from_function(function)
+        entries.append(
+            {
+                "name": tool.name,
+                "segment": _segment_of(app, function),
+                "description": tool.description,
+                "args_description": tool.args_description,
+                "returns_description": tool.returns_description,
+                "raises_description": tool.raises_description,
+                "tags": tool.tags,
+                "parameters": tool.parameters,
+            }
+        )
+    return {"fingerprint": source_fingerprint(), "tools": entries}
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any]:
+    """
+    Build the manifest for ``HubspotApp`` and write it to ``path``.
+
+    Args:
+        path (Path): Destination file
+
+    Returns:
+        dict[str, Any]: The manifest written
+    """
+    from universal_mcp_hubspot.app import HubspotApp
+
+    app = HubspotApp()
+    manifest = build_manifest(app)
+    path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return manifest
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Optional[dict[str, Any]]:
+    """
+    Read the manifest if it exists and matches the installed sources.
+
+    Args:
+        path (Path): Manifest file
+
+    Returns:
+        Optional[dict[str, Any]]: The manifest, or None when it is missing or stale
+    """
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("fingerprint") != source_fingerprint():
+        return None
+    return manifest
+
+
+class LazyTool(Tool):
+    """
+    Tool registered from a manifest entry.
+
+    The bound method and its argument model are resolved on the first call;
+    until then the tool only holds the precomputed description and schema.
+    """
+
+    _app: Any = PrivateAttr(default=None)
+    _segment: str = PrivateAttr(default=APP_SEGMENT)
+    _method_name: str = PrivateAttr(default="")
+
+    @classmethod
+    def from_manifest(cls, app: Any, entry: dict[str, Any]) -> "LazyTool":
+        """
+        Build an unbound tool from a manifest entry without introspection.
+
+        Args:
+            app (Any): The ``HubspotApp`` the tool will be bound to
+            entry (dict[str, Any]): One item of the manifest's ``tools``
+
+        Returns:
+            LazyTool: Tool whose ``fn`` and ``fn_metadata`` are resolved on first call
+        """
+        tool = cls.model_construct(
+            fn=None,
+            name=entry["name"],
+            description=entry["description"],
+            args_description=entry["args_description"],
+            returns_description=entry["returns_description"],
+            raises_description=entry["raises_description"],
+            tags=list(entry["tags"]),
+            parameters=entry["parameters"],
+            fn_metadata=None,
+            is_async=bool(getattr(app, "async_tools", False)),
+        )
+        tool._app = app
+        tool._segment = entry["segment"]
+        tool._method_name = entry["name"]
+        return tool
+
+    def bind(self) -> None:
+        """Resolve the method and build its argument model, if not done yet."""
+        if self.fn_metadata is not None:
+            return
+        owner = self._app if self._segment == APP_SEGMENT else getattr(self._app, self._segment)
+        prefix = "a" if self.is_async else ""
+        fn = getattr(owner, f"{prefix}{self._method_name}")
+        parsed_doc = parse_docstring(inspect.getdoc(fn))
+        self.fn = fn
+        self.fn_metadata = FuncMetadata.func_metadata(fn, arg_description=parsed_doc["args"])
+
+    async def run(self, arguments: dict[str, Any], context: Optional[dict[str, Any]] = None) -> Any:
+        self.bind()
+        return await super().run(arguments, context)
+
+
+class ManifestToolManager(ToolManager):
+    """
+    ``ToolManager`` that registers tools from the precomputed manifest.
+
+    The app's ``tool_filter`` is applied to the manifest entries, so filtered
+    out tools cost nothing at startup. Applications without an up-to-date
+    manifest are registered the regular, eager way.
+
+    Args:
+        warn_on_duplicate_tools (bool): Log when a tool name is registered twice
+        manifest_path (Path): Manifest file to load
+    """
+
+    def __init__(self, warn_on_duplicate_tools: bool = True, manifest_path: Path = MANIFEST_PATH) -> None:
+        super().__init__(warn_on_duplicate_tools=warn_on_duplicate_tools)
+        self.manifest_path = manifest_path
+
+    def register_tools_from_app(
+        self,
+        app: Any,
+        tool_names: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        from universal_mcp_hubspot.app import HubspotApp
+
+        manifest = load_manifest(self.manifest_path) if isinstance(app, HubspotApp) else None
+        if manifest is None:
+            super().register_tools_from_app(app, tool_names=tool_names, tags=tags)
+            return
+        tools = []
+        for entry in manifest["tools"]:
+            if app.tool_filter and not app.tool_filter.matches(entry["segment"], entry["tags"]):
+                continue
+            tool = LazyTool.from_manifest(app, entry)
+            tool.name = f"{app.name}{TOOL_NAME_SEPARATOR}{tool.name}"
+            if app.name not in tool.tags:
+                tool.tags.append(app.name)
+            tools.append(tool)
+        # Same filtering as ToolManager.register_tools_from_app
+        if tags:
+            tools = _filter_by_tags(tools, tags)
+        if tool_names:
+            tools = _filter_by_name(tools, tool_names)
+        if not tool_names and not tags:
+            tools = _filter_by_tags(tools, [DEFAULT_IMPORTANT_TAG])
+        self.register_tools(tools, app_name=app.name)
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    print(f"Wrote {len(written['tools'])} tools to {MANIFEST_PATH}")  # noqa: T201
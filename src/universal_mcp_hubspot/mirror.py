@@ -0,0 +1,476 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Iterable, List, Optional
+
+import httpx
+
+from universal_mcp_hubspot.search import last_modified_property, to_filter_value
+from universal_mcp_hubspot.sync import (
+    IncrementalSync,
+    SQLiteWatermarkStore,
+    default_cache_path,
+)
+
+MIRRORED_OBJECT_TYPES = ("contacts", "companies", "deals", "tickets", "line_items")
+DEFAULT_MIRROR_MAX_AGE_SECONDS = 900.0
+DEFAULT_MIRROR_PROPERTIES: dict[str, List[str]] = {
+    "contacts": ["email", "firstname", "lastname", "phone", "company", "lifecyclestage", "hubspot_owner_id"],
+    "companies": ["name", "domain", "industry", "city", "country", "lifecyclestage", "hubspot_owner_id"],
+    "deals": ["dealname", "amount", "dealstage", "pipeline", "closedate", "hubspot_owner_id"],
+    "tickets": ["subject", "content", "hs_pipeline", "hs_pipeline_stage", "hs_ticket_priority", "hubspot_owner_id"],
+    "line_items": ["name", "quantity", "price", "amount", "hs_product_id"],
+}
+# Properties every record carries regardless of the requested ones
+DEFAULT_RECORD_PROPERTIES = ("hs_object_id", "createdate", "lastmodifieddate", "hs_lastmodifieddate")
+_PROPERTY_NAME = re.compile(r"^[A-Za-z0-9_]+$")
+# Set while a refresh runs, so its own searches reach HubSpot instead of the mirror
+_refreshing: ContextVar[bool] = ContextVar("hubspot_mirror_refreshing", default=False)
+
+
+def _sortable(value: Any) -> Any:
+    """SQLite function ``hs_value``: numbers and datetimes as REAL epoch milliseconds, other text unchanged."""
+    if value is None:
+        return None
+    converted = to_filter_value(value)
+    try:
+        return float(converted)
+    except ValueError:
+        return converted
+
+
+class _NotPushable(Exception):
+    """The query uses a feature the mirror cannot answer; send it to HubSpot instead."""
+
+
+class CrmMirror:
+    """
+    Local SQLite copy of CRM records with HubSpot search pushed down to SQL.
+
+    Every contact, company, deal, ticket and line item returned by or written
+    through ``CrmApi`` is upserted into an indexed table per object type, and
+    ``refresh`` pulls all changes since the previous refresh through
+    ``IncrementalSync``. While an object type was refreshed within
+    ``max_age``, its search tools (e.g. ``search_deals``) and single-record
+    getters are answered from SQLite without an API call, provided every
+    property they filter, sort or return is mirrored. Anything else (free-text
+    ``query``, associations, property history, unmirrored properties) goes to
+    HubSpot as usual.
+
+    Filters are translated to SQL over ``json_extract`` of the stored
+    properties; numbers and dates compare numerically, and the properties in
+    ``properties`` get expression indexes.
+
+    Args:
+        path (Optional[str]): SQLite database file. Defaults to ``default_cache_path("mirror.db")``;
+            ``":memory:"`` keeps the mirror in memory.
+        object_types (Iterable[str]): Object types to mirror
+        properties (Optional[dict[str, List[str]]]): Properties mirrored and indexed per object type. Defaults to ``DEFAULT_MIRROR_PROPERTIES``.
+        max_age (float): Seconds after a refresh during which reads are answered locally
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        object_types: Iterable[str] = MIRRORED_OBJECT_TYPES,
+        properties: Optional[dict[str, List[str]]] = None,
+        max_age: float = DEFAULT_MIRROR_MAX_AGE_SECONDS,
+    ) -> None:
+        path = path if path is not None else default_cache_path("mirror.db")
+        self.path = path
+        self.object_types = tuple(object_types)
+        properties = {**DEFAULT_MIRROR_PROPERTIES, **(properties or {})}
+        self.properties = {
+            object_type: list(properties.get(object_type) or []) for object_type in self.object_types
+        }
+        for object_type, names in self.properties.items():
+            for name in names:
+                if not _PROPERTY_NAME.match(name):
+                    raise ValueError(f"Invalid property name {name!r} for {object_type}.")
+        self.max_age = max_age
+        self.app: Any = None
+        self.served = 0
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.create_function("hs_value", 1, _sortable, deterministic=True)
+        self.watermarks = SQLiteWatermarkStore(path)
+        self._create_schema()
+        self._refreshed_at = {
+            row[0]: row[1]
+            for row in self._connection.execute("SELECT object_type, refreshed_at FROM hubspot_mirror_state")
+        }
+
+    def _create_schema(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS hubspot_mirror_state "
+                "(object_type TEXT PRIMARY KEY, refreshed_at REAL NOT NULL)"
+            )
+            for object_type in self.object_types:
+                table = self._table(object_type)
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, properties TEXT NOT NULL, "
+                    "created_at TEXT, updated_at TEXT, archived INTEGER NOT NULL DEFAULT 0)"
+                )
+                indexed = self.properties[object_type] + [last_modified_property(object_type)]
+                for name in indexed:
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{name} ON {table} ({self._column(name)})"
+                    )
+
+    @staticmethod
+    def _table(object_type: str) -> str:
+        return f"hubspot_{object_type}"
+
+    @staticmethod
+    def _column(name: str) -> str:
+        if not _PROPERTY_NAME.match(name):
+            raise _NotPushable(name)
+        return f"hs_value(json_extract(properties, '$.{name}'))"
+
+    def attach(self, app: Any) -> None:
+        """
+        Connect the mirror to ``app``: ingest its CRM responses and answer its reads.
+
+        Args:
+            app (Any): The ``HubspotApp`` to mirror
+        """
+        self.app = app
+        app.mirror = self
+        app.response_listeners.append(self.ingest)
+
+    # Writing
+
+    def upsert(self, object_type: str, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert or merge records; properties missing from a record keep their stored value.
+
+        Args:
+            object_type (str): Mirrored object type
+            records (Iterable[dict[str, Any]]): Records as returned by HubSpot
+
+        Returns:
+            int: Number of records written
+        """
+        rows = [
+            (
+                int(record["id"]),
+                json.dumps(record.get("properties") or {}),
+                record.get("createdAt"),
+                record.get("updatedAt"),
+                1 if record.get("archived") else 0,
+            )
+            for record in records
+            if record.get("id") is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {self._table(object_type)} (id, properties, created_at, updated_at, archived) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "properties = json_patch(properties, excluded.properties), "
+                "created_at = coalesce(excluded.created_at, created_at), "
+                "updated_at = coalesce(excluded.updated_at, updated_at), archived = excluded.archived",
+                rows,
+            )
+        return len(rows)
+
+    def archive(self, object_type: str, ids: Iterable[Any]) -> None:
+        """Mark records as deleted so local reads no longer return them."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"UPDATE {self._table(object_type)} SET archived = 1 WHERE id = ?",
+                [(int(record_id),) for record_id in ids],
+            )
+
+    def ingest(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Response listener: store the CRM records in a successful response.
+
+        Args:
+            request (httpx.Request): The request that was sent
+            response (httpx.Response): Its successful response
+        """
+        parts = request.url.path.strip("/").split("/")
+        if parts[:3] != ["crm", "v3", "objects"] or len(parts) < 4 or parts[3] not in self.object_types:
+            return
+        object_type, rest = parts[3], parts[4:]
+        if request.method == "DELETE" and len(rest) == 1:
+            self.archive(object_type, rest)
+            return
+        if rest == ["batch", "archive"]:
+            body = json.loads(request.content or b"{}")
+            self.archive(object_type, [item["id"] for item in body.get("inputs") or []])
+            return
+        if not response.content:
+            return
+        body = response.json()
+        if isinstance(body, dict) and "results" in body:
+            self.upsert(object_type, body.get("results") or [])
+        elif isinstance(body, dict) and "id" in body and "properties" in body:
+            self.upsert(object_type, [body])
+
+    def refresh(self, object_type: Optional[str] = None) -> int:
+        """
+        Pull every change since the previous refresh and mark the mirror fresh.
+
+        The first refresh of an object type loads all of its records. Its
+        searches always go to HubSpot, even while the mirror is fresh.
+
+        Args:
+            object_type (Optional[str]): Type to refresh, or every mirrored type when None
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        written = 0
+        token = _refreshing.set(True)
+        try:
+            for current in [object_type] if object_type else self.object_types:
+                sync = self._sync(current)
+                for change_set in sync.changes(current):
+                    written += self.upsert(current, change_set.records)
+                self._mark_refreshed(current)
+        finally:
+            _refreshing.reset(token)
+        return written
+
+    async def arefresh(self, object_type: Optional[str] = None) -> int:
+        """
+        Async counterpart of ``refresh``.
+
+        Args:
+            object_type (Optional[str]): Type to refresh, or every mirrored type when None
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        written = 0
+        token = _refreshing.set(True)
+        try:
+            for current in [object_type] if object_type else self.object_types:
+                sync = self._sync(current)
+                async for change_set in sync.achanges(current):
+                    written += self.upsert(current, change_set.records)
+                self._mark_refreshed(current)
+        finally:
+            _refreshing.reset(token)
+        return written
+
+    def _sync(self, object_type: str) -> IncrementalSync:
+        if self.app is None:
+            raise RuntimeError("Attach the mirror to a HubspotApp before refreshing it.")
+        return IncrementalSync(
+            self.app,
+            store=self.watermarks,
+            properties={object_type: self.properties[object_type]},
+            namespace="mirror",
+        )
+
+    def _mark_refreshed(self, object_type: str) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO hubspot_mirror_state (object_type, refreshed_at) VALUES (?, ?) "
+                "ON CONFLICT(object_type) DO UPDATE SET refreshed_at = excluded.refreshed_at",
+                (object_type, now),
+            )
+        self._refreshed_at[object_type] = now
+
+    # Reading
+
+    def is_fresh(self, object_type: str) -> bool:
+        """Whether ``object_type`` was refreshed within ``max_age``."""
+        refreshed_at = self._refreshed_at.get(object_type)
+        return refreshed_at is not None and time.time() - refreshed_at <= self.max_age
+
+    def _check_properties(self, object_type: str, names: Iterable[str]) -> None:
+        available = set(self.properties[object_type]) | set(DEFAULT_RECORD_PROPERTIES)
+        missing = [name for name in names if name not in available]
+        if missing:
+            raise _NotPushable(", ".join(missing))
+
+    def _record(self, object_type: str, row: tuple, properties: Optional[List[str]]) -> dict[str, Any]:
+        record_id, stored, created_at, updated_at = row
+        values = json.loads(stored)
+        keep = list(properties or self.properties[object_type]) + ["hs_object_id", "createdate", last_modified_property(object_type)]
+        return {
+            "id": str(record_id),
+            "properties": {name: values.get(name) for name in dict.fromkeys(keep)},
+            "createdAt": created_at,
+            "updatedAt": updated_at,
+            "archived": False,
+        }
+
+    def _where(self, filter_groups: List[dict[str, Any]]) -> tuple[str, List[Any]]:
+        clauses, params = [], []
+        for group in filter_groups:
+            conditions = []
+            for flt in group.get("filters") or []:
+                condition, values = self._condition(flt)
+                conditions.append(condition)
+                params.extend(values)
+            if conditions:
+                clauses.append("(" + " AND ".join(conditions) + ")")
+        where = "archived = 0"
+        if clauses:
+            where += " AND (" + " OR ".join(clauses) + ")"
+        return where, params
+
+    def _condition(self, flt: dict[str, Any]) -> tuple[str, List[Any]]:
+        column = self._column(flt.get("propertyName") or "")
+        operator = flt.get("operator", "EQ")
+        comparisons = {"LT": "<", "LTE": "<=", "GT": ">", "GTE": ">="}
+        if operator in comparisons:
+            return f"{column} {comparisons[operator]} ?", [_sortable(flt.get("value"))]
+        if operator == "BETWEEN":
+            return f"{column} BETWEEN ? AND ?", [_sortable(flt.get("value")), _sortable(flt.get("highValue"))]
+        if operator in ("EQ", "NEQ", "IN", "NOT_IN"):
+            values = flt.get("values") or [] if operator in ("IN", "NOT_IN") else [flt.get("value")]
+            condition, params = self._equals(column, [_sortable(value) for value in values])
+            if operator in ("EQ", "IN"):
+                return condition, params
+            return f"({column} IS NULL OR NOT {condition})", params
+        if operator == "HAS_PROPERTY":
+            return f"coalesce({column}, '') != ''", []
+        if operator == "NOT_HAS_PROPERTY":
+            return f"coalesce({column}, '') = ''", []
+        if operator in ("CONTAINS_TOKEN", "NOT_CONTAINS_TOKEN"):
+            token = f"%{str(flt.get('value', '')).strip('*').lower()}%"
+            if operator == "CONTAINS_TOKEN":
+                return f"lower({column}) LIKE ?", [token]
+            return f"({column} IS NULL OR lower({column}) NOT LIKE ?)", [token]
+        raise _NotPushable(operator)
+
+    @staticmethod
+    def _equals(column: str, values: List[Any]) -> tuple[str, List[Any]]:
+        # Text matches case-insensitively like HubSpot; numbers and dates compare as numbers
+        numbers = [value for value in values if not isinstance(value, str)]
+        texts = [value.lower() for value in values if isinstance(value, str)]
+        parts = []
+        if numbers:
+            parts.append(f"{column} IN ({', '.join('?' for _ in numbers)})")
+        if texts:
+            parts.append(f"lower({column}) IN ({', '.join('?' for _ in texts)})")
+        if not parts:
+            return "0", []
+        return "(" + " OR ".join(parts) + ")", numbers + texts
+
+    def search(self, object_type: str, payload: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Answer a search request body from the mirror.
+
+        Args:
+            object_type (str): Mirrored object type
+            payload (dict[str, Any]): Search body with ``filterGroups``, ``sorts``, ``properties``, ``limit`` and ``after``
+
+        Returns:
+            Optional[dict[str, Any]]: A HubSpot-shaped search response, or None when the query cannot be answered locally
+        """
+        if object_type not in self.object_types or payload.get("query"):
+            return None
+        groups = payload.get("filterGroups") or []
+        sorts = [
+            (sort.lstrip("-"), sort.startswith("-")) if isinstance(sort, str)
+            else (sort.get("propertyName"), sort.get("direction") == "DESCENDING")
+            for sort in payload.get("sorts") or []
+        ]
+        referenced = [flt.get("propertyName") for group in groups for flt in group.get("filters") or []]
+        referenced += [name for name, _ in sorts] + list(payload.get("properties") or [])
+        limit = int(payload.get("limit") or 10)
+        offset = int(payload.get("after") or 0)
+        try:
+            self._check_properties(object_type, referenced)
+            where, params = self._where(groups)
+            order = [f"{self._column(name)} {'DESC' if descending else 'ASC'}" for name, descending in sorts]
+        except _NotPushable:
+            return None
+        table = self._table(object_type)
+        order_by = ", ".join(order + ["id ASC"])
+        with self._lock:
+            total = self._connection.execute(f"SELECT count(*) FROM {table} WHERE {where}", params).fetchone()[0]
+            rows = self._connection.execute(
+                f"SELECT id, properties, created_at, updated_at FROM {table} WHERE {where} "
+                f"ORDER BY {order_by} LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        body: dict[str, Any] = {
+            "total": total,
+            "results": [self._record(object_type, row, payload.get("properties")) for row in rows],
+        }
+        if offset + limit < total:
+            body["paging"] = {"next": {"after": str(offset + limit)}}
+        return body
+
+    def get(self, object_type: str, record_id: str, properties: Optional[List[str]] = None) -> Optional[dict[str, Any]]:
+        """
+        A mirrored record by ID.
+
+        Args:
+            object_type (str): Mirrored object type
+            record_id (str): Record ID
+            properties (Optional[List[str]]): Properties to return
+
+        Returns:
+            Optional[dict[str, Any]]: The record, or None if it is not mirrored or requests unmirrored properties
+        """
+        if object_type not in self.object_types or not str(record_id).isdigit():
+            return None
+        try:
+            self._check_properties(object_type, properties or [])
+        except _NotPushable:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT id, properties, created_at, updated_at FROM {self._table(object_type)} "
+                "WHERE id = ? AND archived = 0",
+                (int(record_id),),
+            ).fetchone()
+        return self._record(object_type, row, properties) if row else None
+
+    def lookup(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Local response for a search or single-record read of a fresh object type.
+
+        Args:
+            request (httpx.Request): The request about to be sent
+
+        Returns:
+            Optional[httpx.Response]: The response built from the mirror, or None to send the request
+        """
+        if _refreshing.get():
+            return None
+        parts = request.url.path.strip("/").split("/")
+        if parts[:3] != ["crm", "v3", "objects"] or len(parts) != 5 or not self.is_fresh(parts[3]):
+            return None
+        object_type = parts[3]
+        body = None
+        if request.method == "POST" and parts[4] == "search":
+            body = self.search(object_type, json.loads(request.content or b"{}"))
+        elif request.method == "GET" and parts[4] != "search":
+            params = request.url.params
+            if any(params.get(name) for name in ("associations", "propertiesWithHistory", "idProperty")):
+                return None
+            if params.get("archived") == "true":
+                return None
+            properties = [name for value in params.get_list("properties") for name in value.split(",") if name]
+            body = self.get(object_type, parts[4], properties or None)
+        if body is None:
+            return None
+        self.served += 1
+        return httpx.Response(200, json=body, request=request)
+
+    def close(self) -> None:
+        """Close the database connections."""
+        self._connection.close()
+        self.watermarks.close()
@@ -0,0 +1,212 @@
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+from universal_mcp_hubspot.batching import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    Chunk,
+    ChunkOutcome,
+    aimap_bounded,
+    asend_splitting,
+    batch_error,
+    chunked,
+    imap_bounded,
+    send_splitting,
+)
+
+Note = Union[str, dict[str, Any]]
+
+
+class NoteBatchResult:
+    """
+    Outcome of ``add_notes``, keyed by the position of each note in the input.
+
+    Attributes:
+        created (dict[int, dict[str, Any]]): Created note objects by input index
+        failed (dict[int, dict[str, Any]]): Errors by input index, with ``message``, ``category`` and ``statusCode``
+        requests (int): Batch requests sent
+    """
+
+    def __init__(self) -> None:
+        self.created: dict[int, dict[str, Any]] = {}
+        self.failed: dict[int, dict[str, Any]] = {}
+        self.requests = 0
+
+    def __len__(self) -> int:
+        return len(self.created) + len(self.failed)
+
+    def _reject(self, index: int, message: str) -> None:
+        self.failed[index] = {"status": "error", "category": "VALIDATION_ERROR", "message": message, "statusCode": None}
+
+
+def note_inputs(
+    notes: Iterable[Note],
+    associations: Optional[List[dict[str, Any]]] = None,
+    hs_timestamp: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Batch-create inputs for notes, in the shape ``add_a_note`` sends.
+
+    Notes without a timestamp share one default taken when the generator
+    starts, instead of a clock read per note.
+
+    Args:
+        notes (Iterable[Union[str, dict[str, Any]]]): Note bodies, or dicts with ``hs_note_body`` and optionally ``hs_timestamp``, ``associations`` and other note properties
+        associations (Optional[List[dict[str, Any]]]): Associations of notes that do not set their own, in the format of ``add_a_note``
+        hs_timestamp (Optional[str]): Timestamp of notes that do not set their own (ISO format). Defaults to the current time.
+
+    Returns:
+        Iterator[dict[str, Any]]: One input per note, with ``objectWriteTraceId`` set to its index
+    """
+    default_timestamp = hs_timestamp or datetime.now(timezone.utc).isoformat()
+    for index, note in enumerate(notes):
+        yield _note_input(index, note, associations, default_timestamp)
+
+
+def _note_input(index: int, note: Note, associations: Optional[List[dict[str, Any]]], default_timestamp: str) -> dict[str, Any]:
+    fields = {"hs_note_body": note} if isinstance(note, str) else dict(note)
+    note_associations = fields.pop("associations", None) or associations
+    if fields.get("hs_note_body") is None:
+        raise ValueError(f"Note {index} is missing 'hs_note_body'.")
+    if fields.get("hs_timestamp") is None:
+        fields["hs_timestamp"] = default_timestamp
+    item: dict[str, Any] = {"properties": fields, "objectWriteTraceId": str(index)}
+    if note_associations:
+        item["associations"] = note_associations
+    return item
+
+
+def _record(result: NoteBatchResult, chunk: Chunk, response: Any) -> None:
+    """Assign the results and errors of one batch response to input indexes."""
+    indexes = [index for index, _ in chunk]
+    remaining = list(indexes)
+    for error in (response or {}).get("errors") or []:
+        traces = (error.get("context") or {}).get("objectWriteTraceId") or []
+        for trace in traces:
+            if trace.isdigit() and int(trace) in remaining:
+                result.failed[int(trace)] = error
+                remaining.remove(int(trace))
+    results = (response or {}).get("results") or []
+    untraced = []
+    for note in results:
+        trace = note.get("objectWriteTraceId")
+        if trace is not None and str(trace).isdigit() and int(trace) in remaining:
+            result.created[int(trace)] = note
+            remaining.remove(int(trace))
+        else:
+            untraced.append(note)
+    # HubSpot returns batch results in input order when trace IDs are not echoed
+    for index, note in zip(list(remaining), untraced):
+        result.created[index] = note
+        remaining.remove(index)
+    for index in remaining:
+        result.failed[index] = {"status": "error", "category": "NOT_CREATED", "message": "Missing from the batch response.", "statusCode": None}
+
+
+def _apply(result: NoteBatchResult, outcomes: List[ChunkOutcome], requests: int) -> None:
+    """Assign the outcomes of one chunk sent by ``send_splitting`` to input indexes."""
+    result.requests += requests
+    for chunk, response, error in outcomes:
+        if error is None:
+            _record(result, chunk, response)
+            continue
+        for index, _ in chunk:
+            result.failed[index] = batch_error(error, "VALIDATION_ERROR" if len(chunk) == 1 else "CHUNK_FAILED")
+
+
+def _chunks(
+    result: NoteBatchResult,
+    notes: Iterable[Note],
+    associations: Optional[List[dict[str, Any]]],
+    hs_timestamp: Optional[str],
+    batch_size: int,
+) -> Iterator[Chunk]:
+    default_timestamp = hs_timestamp or datetime.now(timezone.utc).isoformat()
+
+    def valid() -> Iterator[tuple[int, dict[str, Any]]]:
+        # Notes without a body are rejected without stopping the chunks already sent
+        for index, note in enumerate(notes):
+            try:
+                yield index, _note_input(index, note, associations, default_timestamp)
+            except ValueError as exc:
+                result._reject(index, str(exc))
+
+    return chunked(valid(), batch_size)
+
+
+def add_notes(
+    app: Any,
+    notes: Iterable[Note],
+    associations: Optional[List[dict[str, Any]]] = None,
+    hs_timestamp: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> NoteBatchResult:
+    """
+    Create any number of notes through the notes batch-create endpoint.
+
+    The bulk counterpart of ``add_a_note``: ``notes`` is consumed lazily in
+    chunks of ``batch_size`` with up to ``max_concurrency`` requests in
+    flight. A chunk HubSpot rejects as invalid is split in halves until the
+    offending notes are isolated, so one bad note does not fail its
+    neighbours and every failure is reported against its input index. Notes
+    without a body are never sent and fail with ``VALIDATION_ERROR``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        notes (Iterable[Union[str, dict[str, Any]]]): Note bodies, or dicts with ``hs_note_body`` and optionally ``hs_timestamp``, ``associations`` and other note properties
+        associations (Optional[List[dict[str, Any]]]): Associations of notes that do not set their own. Example: [{"to": {"id": "101"}, "types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 202}]}]
+        hs_timestamp (Optional[str]): Timestamp of notes that do not set their own (ISO format). Defaults to the current time.
+        batch_size (int): Notes per request, at most 100
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        NoteBatchResult: Created notes and failures by input index
+
+    Example:
+        >>> result = add_notes(app, ({"hs_note_body": call.summary, "associations": call.contact_associations} for call in calls))
+        >>> print(len(result.created), result.failed)
+    """
+    result = NoteBatchResult()
+
+    def send(inputs: List[dict[str, Any]]) -> Any:
+        return app.crm.batch_create_object_records(objectType="notes", inputs=inputs)
+
+    chunks = _chunks(result, notes, associations, hs_timestamp, batch_size)
+    # Outcomes are applied here on the calling thread, not by the workers
+    for outcomes, requests in imap_bounded(lambda chunk: send_splitting(send, chunk), chunks, max_concurrency):
+        _apply(result, outcomes, requests)
+    return result
+
+
+async def aadd_notes(
+    app: Any,
+    notes: Iterable[Note],
+    associations: Optional[List[dict[str, Any]]] = None,
+    hs_timestamp: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> NoteBatchResult:
+    """
+    Async counterpart of ``add_notes``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        notes (Iterable[Union[str, dict[str, Any]]]): Note bodies, or dicts with ``hs_note_body`` and optionally ``hs_timestamp``, ``associations`` and other note properties
+        associations (Optional[List[dict[str, Any]]]): Associations of notes that do not set their own
+        hs_timestamp (Optional[str]): Timestamp of notes that do not set their own (ISO format). Defaults to the current time.
+        batch_size (int): Notes per request, at most 100
+        max_concurrency (int): Maximum number of requests in flight
+
+    Returns:
+        NoteBatchResult: Created notes and failures by input index
+    """
+    result = NoteBatchResult()
+
+    async def send(inputs: List[dict[str, Any]]) -> Any:
+        return await app.crm.abatch_create_object_records(objectType="notes", inputs=inputs)
+
+    chunks = _chunks(result, notes, associations, hs_timestamp, batch_size)
+    async for outcomes, requests in aimap_bounded(lambda chunk: asend_splitting(send, chunk), chunks, max_concurrency):
+        _apply(result, outcomes, requests)
+    return result
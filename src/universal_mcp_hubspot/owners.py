@@ -0,0 +1,174 @@
+import threading
+import time
+from typing import Any, Iterable, Iterator, List, Optional
+
+from universal_mcp_hubspot.pagination import apaginate, paginate
+
+DEFAULT_OWNER_TTL_SECONDS = 3600.0
+OWNERS_PAGE_SIZE = 500
+
+
+class OwnerDirectory:
+    """
+    Local directory of every owner in the portal, indexed by ID, email and user ID.
+
+    The first lookup pulls all owners with ``get_owners_list`` (following
+    pagination). Once the TTL has passed, lookups keep answering from the
+    current copy while a daemon thread reloads it, so resolving
+    ``hubspot_owner_id`` on any number of records never waits on the network
+    after the first load.
+
+    Args:
+        app (Any): The ``HubspotApp`` whose CRM segment is used to list owners
+        ttl (float): Seconds before the directory is refreshed in the background
+        include_archived (bool): Also index archived owners, which old records may still reference
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        ttl: float = DEFAULT_OWNER_TTL_SECONDS,
+        include_archived: bool = True,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self.include_archived = include_archived
+        self._lock = threading.Lock()
+        self._refreshing: Optional[threading.Thread] = None
+        self._loaded_at: Optional[float] = None
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_email: dict[str, dict[str, Any]] = {}
+        self._by_user_id: dict[str, dict[str, Any]] = {}
+
+    def _archived_flags(self) -> List[bool]:
+        return [False, True] if self.include_archived else [False]
+
+    def _index(self, owners: Iterable[dict[str, Any]]) -> None:
+        by_id, by_email, by_user_id = {}, {}, {}
+        for owner in owners:
+            by_id[str(owner["id"])] = owner
+            if owner.get("email"):
+                # Active owners win over archived ones sharing an email
+                by_email.setdefault(owner["email"].lower(), owner)
+            if owner.get("userId") is not None:
+                by_user_id.setdefault(str(owner["userId"]), owner)
+        with self._lock:
+            self._by_id, self._by_email, self._by_user_id = by_id, by_email, by_user_id
+            self._loaded_at = time.monotonic()
+
+    def load(self) -> None:
+        """
+        Pull every owner and rebuild the indexes.
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        owners = []
+        for archived in self._archived_flags():
+            owners.extend(
+                paginate(self.app.crm.get_owners_list, archived=archived, limit=OWNERS_PAGE_SIZE)
+            )
+        self._index(owners)
+
+    async def aload(self) -> None:
+        """
+        Async counterpart of ``load``.
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        owners = []
+        for archived in self._archived_flags():
+            async for owner in apaginate(
+                self.app.crm.get_owners_list, archived=archived, limit=OWNERS_PAGE_SIZE
+            ):
+                owners.append(owner)
+        self._index(owners)
+
+    def refresh_in_background(self) -> None:
+        """Reload the directory on a daemon thread unless a reload is already running."""
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            self._refreshing = threading.Thread(
+                target=self._refresh_quietly, name="hubspot-owner-refresh", daemon=True
+            )
+            self._refreshing.start()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            # Keep serving the previous copy; the next stale lookup tries again
+            with self._lock:
+                self._loaded_at = time.monotonic() - self.ttl
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded_at is None:
+            self.load()
+        elif time.monotonic() - self._loaded_at > self.ttl:
+            self.refresh_in_background()
+
+    def get(self, owner_id: Any) -> Optional[dict[str, Any]]:
+        """
+        Owner by ID, e.g. the ``hubspot_owner_id`` property of a record.
+
+        Args:
+            owner_id (Any): Owner ID as string or number
+
+        Returns:
+            Optional[dict[str, Any]]: The owner, or None if unknown
+        """
+        if owner_id in (None, ""):
+            return None
+        self._ensure_loaded()
+        return self._by_id.get(str(owner_id))
+
+    def by_email(self, email: str) -> Optional[dict[str, Any]]:
+        """Owner by email address (case-insensitive), or None if unknown."""
+        self._ensure_loaded()
+        return self._by_email.get(email.lower()) if email else None
+
+    def by_user_id(self, user_id: Any) -> Optional[dict[str, Any]]:
+        """Owner by HubSpot user ID, or None if unknown."""
+        self._ensure_loaded()
+        return self._by_user_id.get(str(user_id))
+
+    def name(self, owner_id: Any) -> Optional[str]:
+        """
+        Display name of an owner: first and last name, falling back to the email.
+
+        Args:
+            owner_id (Any): Owner ID as string or number
+
+        Returns:
+            Optional[str]: The name, or None if the owner is unknown
+        """
+        owner = self.get(owner_id)
+        if owner is None:
+            return None
+        full_name = " ".join(
+            part for part in (owner.get("firstName"), owner.get("lastName")) if part
+        )
+        return full_name or owner.get("email")
+
+    def enrich(
+        self,
+        records: Iterable[dict[str, Any]],
+        owner_property: str = "hubspot_owner_id",
+        target: str = "owner",
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Attach the owner object to each CRM record that references one.
+
+        Args:
+            records (Iterable[dict[str, Any]]): Records as returned by list, search or batch tools
+            owner_property (str): Property holding the owner ID
+            target (str): Key under which the owner is stored on each record
+
+        Returns:
+            Iterator[dict[str, Any]]: The same records, lazily, with ``target`` set (None when unassigned or unknown)
+        """
+        for record in records:
+            record[target] = self.get((record.get("properties") or {}).get(owner_property))
+            yield record
@@ -0,0 +1,114 @@
+import inspect
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def next_cursor(page: dict[str, Any]) -> Optional[str]:
+    """
+    Extract the ``paging.next.after`` cursor from a HubSpot list response.
+
+    Args:
+        page (dict[str, Any]): A single page returned by a cursor-based list endpoint
+
+    Returns:
+        Optional[str]: The cursor for the following page, or None on the last page
+    """
+    paging = (page or {}).get("paging") or {}
+    return (paging.get("next") or {}).get("after")
+
+
+def _page_kwargs(
+    method: Callable, kwargs: dict[str, Any], max_records: Optional[int]
+) -> dict[str, Any]:
+    kwargs = dict(kwargs)
+    if "limit" in inspect.signature(method).parameters:
+        limit = kwargs.get("limit") or DEFAULT_PAGE_SIZE
+        if max_records is not None:
+            limit = max(1, min(limit, max_records))
+        kwargs["limit"] = limit
+    return kwargs
+
+
+def paginate(
+    method: Callable[..., dict[str, Any]],
+    max_records: Optional[int] = None,
+    records_key: str = "results",
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily iterate over every record of a cursor-based list endpoint.
+
+    Pages are requested one at a time while the caller consumes records, so
+    memory stays bounded by a single page regardless of portal size.
+
+    Args:
+        method (Callable): A bound list tool such as ``app.crm.get_contacts`` that accepts an ``after`` cursor
+        max_records (Optional[int]): Stop after yielding this many records. Iterates everything when None.
+        records_key (str): Key of the record array in each page. Defaults to ``results``.
+        **kwargs: Extra arguments forwarded to ``method`` on every page, e.g. ``properties`` or ``limit``
+
+    Returns:
+        Iterator[dict[str, Any]]: Records in the order the API returns them
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+    Example:
+        >>> for contact in paginate(app.crm.get_contacts, properties=["email"]):
+        ...     print(contact["id"])
+    """
+    kwargs = _page_kwargs(method, kwargs, max_records)
+    yielded = 0
+    while True:
+        page = method(**kwargs)
+        for record in page.get(records_key) or []:
+            if max_records is not None and yielded >= max_records:
+                return
+            yield record
+            yielded += 1
+        after = next_cursor(page)
+        if not after or (max_records is not None and yielded >= max_records):
+            return
+        kwargs["after"] = after
+
+
+async def apaginate(
+    method: Callable[..., Any],
+    max_records: Optional[int] = None,
+    records_key: str = "results",
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Async counterpart of ``paginate``.
+
+    Accepts either an async twin (``app.crm.aget_contacts``) or the synchronous
+    tool method, in which case its async twin is used.
+
+    Args:
+        method (Callable): A bound list tool or its async twin that accepts an ``after`` cursor
+        max_records (Optional[int]): Stop after yielding this many records. Iterates everything when None.
+        records_key (str): Key of the record array in each page. Defaults to ``results``.
+        **kwargs: Extra arguments forwarded to ``method`` on every page
+
+    Returns:
+        AsyncIterator[dict[str, Any]]: Records in the order the API returns them
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    if not inspect.iscoroutinefunction(method):
+        method = getattr(method.__self__, f"a{method.__name__}")
+    kwargs = _page_kwargs(method, kwargs, max_records)
+    yielded = 0
+    while True:
+        page = await method(**kwargs)
+        for record in page.get(records_key) or []:
+            if max_records is not None and yielded >= max_records:
+                return
+            yield record
+            yielded += 1
+        after = next_cursor(page)
+        if not after or (max_records is not None and yielded >= max_records):
+            return
+        kwargs["after"] = after
@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Any, Optional
+
+DEFAULT_PIPELINE_TTL_SECONDS = 600.0
+
+
+class PipelineIndex:
+    """
+    In-memory index of pipelines and stages for label resolution.
+
+    Pipelines of an object type are loaded with a single
+    ``list_pipelines_by_type`` call (stages are embedded in the response) and
+    indexed by ``(objectType, pipelineId)`` and ``(objectType, pipelineId,
+    stageId)``; lookups afterwards are plain dict reads. An object type is
+    reloaded once its TTL expires or right after any pipeline write for it, e.g.
+    ``update_pipeline``, ``create_pipeline_stage`` or
+    ``delete_pipeline_stage_by_id``.
+
+    Args:
+        app (Any): The ``HubspotApp`` whose CRM segment is used to load pipelines
+        ttl (float): Seconds before an object type's pipelines are reloaded
+    """
+
+    def __init__(self, app: Any, ttl: float = DEFAULT_PIPELINE_TTL_SECONDS) -> None:
+        self.app = app
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._expires: dict[str, float] = {}
+        self._pipelines: dict[tuple[str, str], dict[str, Any]] = {}
+        self._stages: dict[tuple[str, str, str], dict[str, Any]] = {}
+        # Stage IDs are unique within a portal, so deal and ticket stages resolve without a pipeline ID
+        self._stages_by_id: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def _is_fresh(self, object_type: str) -> bool:
+        return self._expires.get(object_type, 0.0) > time.monotonic()
+
+    def _index(self, object_type: str, response: dict[str, Any]) -> None:
+        with self._lock:
+            self._drop(object_type)
+            for pipeline in response.get("results") or []:
+                pipeline_id = str(pipeline["id"])
+                self._pipelines[(object_type, pipeline_id)] = pipeline
+                for stage in pipeline.get("stages") or []:
+                    stage_id = str(stage["id"])
+                    self._stages[(object_type, pipeline_id, stage_id)] = stage
+                    self._stages_by_id[(object_type, stage_id)] = stage
+            self._expires[object_type] = time.monotonic() + self.ttl
+
+    def _drop(self, object_type: str) -> None:
+        self._expires.pop(object_type, None)
+        for index in (self._pipelines, self._stages, self._stages_by_id):
+            for key in [key for key in index if key[0] == object_type]:
+                del index[key]
+
+    def load(self, object_type: str, force: bool = False) -> None:
+        """
+        Load the pipelines of ``object_type`` unless a fresh copy is indexed.
+
+        Args:
+            object_type (str): Object type such as ``deals`` or ``tickets``
+            force (bool): Reload even when the indexed copy is still fresh
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if force or not self._is_fresh(object_type):
+            self._index(object_type, self.app.crm.list_pipelines_by_type(object_type))
+
+    async def aload(self, object_type: str, force: bool = False) -> None:
+        """
+        Async counterpart of ``load``.
+
+        Args:
+            object_type (str): Object type such as ``deals`` or ``tickets``
+            force (bool): Reload even when the indexed copy is still fresh
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if force or not self._is_fresh(object_type):
+            self._index(object_type, await self.app.crm.alist_pipelines_by_type(object_type))
+
+    def invalidate(self, object_type: Optional[str] = None) -> None:
+        """
+        Forget the indexed pipelines of ``object_type``, or of every type when None.
+
+        Args:
+            object_type (Optional[str]): Object type to drop
+        """
+        with self._lock:
+            if object_type is None:
+                self._expires.clear()
+                self._pipelines.clear()
+                self._stages.clear()
+                self._stages_by_id.clear()
+            else:
+                self._drop(object_type)
+
+    def invalidate_path(self, path: str) -> None:
+        """Mutation listener: drop the object type written under ``/crm/v3/pipelines``."""
+        parts = path.strip("/").split("/")
+        if len(parts) >= 4 and parts[:3] == ["crm", "v3", "pipelines"]:
+            self.invalidate(parts[3])
+
+    def pipeline(self, object_type: str, pipeline_id: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a pipeline, loading the object type on first use.
+
+        Args:
+            object_type (str): Object type such as ``deals``
+            pipeline_id (str): Pipeline ID, e.g. the ``pipeline`` property of a deal
+
+        Returns:
+            Optional[dict[str, Any]]: The pipeline including its stages, or None if unknown
+        """
+        self.load(object_type)
+        return self._pipelines.get((object_type, str(pipeline_id)))
+
+    def stage(
+        self, object_type: str, stage_id: str, pipeline_id: Optional[str] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        Look up a pipeline stage, loading the object type on first use.
+
+        Args:
+            object_type (str): Object type such as ``deals``
+            stage_id (str): Stage ID, e.g. the ``dealstage`` property of a deal
+            pipeline_id (Optional[str]): Pipeline the stage belongs to, if known
+
+        Returns:
+            Optional[dict[str, Any]]: The stage, or None if unknown
+        """
+        self.load(object_type)
+        if pipeline_id is None:
+            return self._stages_by_id.get((object_type, str(stage_id)))
+        return self._stages.get((object_type, str(pipeline_id), str(stage_id)))
+
+    def pipeline_label(self, object_type: str, pipeline_id: str) -> Optional[str]:
+        """Label of a pipeline, or None if unknown."""
+        pipeline = self.pipeline(object_type, pipeline_id)
+        return pipeline.get("label") if pipeline else None
+
+    def stage_label(
+        self, object_type: str, stage_id: str, pipeline_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Label of a pipeline stage, or None if unknown."""
+        stage = self.stage(object_type, stage_id, pipeline_id)
+        return stage.get("label") if stage else None
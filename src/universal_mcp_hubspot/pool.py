@@ -0,0 +1,107 @@
+from typing import Any, Optional
+
+import httpx
+
+DEFAULT_TIMEOUT_SECONDS = 180.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+
+
+class PoolConfig:
+    """
+    Connection-pool, protocol and timeout settings shared by the sync and async HTTP clients.
+
+    Args:
+        max_connections (int): Upper bound on open connections per client
+        max_keepalive_connections (int): Idle connections kept open for reuse
+        keepalive_expiry (float): Seconds an idle connection is kept before it is closed
+        http2 (bool): Negotiate HTTP/2 so concurrent requests are multiplexed over few connections. Requires the ``h2`` package (``pip install universal-mcp-hubspot[http2]``).
+        timeout (float): Default read/write timeout in seconds
+        connect_timeout (float): Seconds allowed to establish a connection, TLS handshake included
+        pool_timeout (Optional[float]): Seconds a request may wait for a free connection. Defaults to ``timeout``.
+        verb_timeouts (Optional[dict[str, float]]): Read/write timeout overrides per HTTP method, e.g. ``{"GET": 30, "POST": 120}``
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        pool_timeout: Optional[float] = None,
+        verb_timeouts: Optional[dict[str, float]] = None,
+    ) -> None:
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. Install it with 'pip install universal-mcp-hubspot[http2]'."
+                ) from exc
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.pool_timeout = pool_timeout
+        self.verb_timeouts = {method.upper(): value for method, value in (verb_timeouts or {}).items()}
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """``httpx.Limits`` for both clients."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout_for(self, method: str) -> httpx.Timeout:
+        """
+        Timeout for a request with the given HTTP method.
+
+        Args:
+            method (str): HTTP method such as ``GET``
+
+        Returns:
+            httpx.Timeout: Connect, pool and read/write timeouts for the request
+        """
+        timeout = self.verb_timeouts.get(method.upper(), self.timeout)
+        return httpx.Timeout(
+            timeout,
+            connect=self.connect_timeout,
+            pool=self.pool_timeout if self.pool_timeout is not None else timeout,
+        )
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``httpx.Client`` and ``httpx.AsyncClient``."""
+        return {"limits": self.limits, "http2": self.http2, "timeout": self.timeout_for("GET")}
+
+
+def pool_stats(client: Optional[Any]) -> dict[str, Any]:
+    """
+    Snapshot of an httpx client's connection pool.
+
+    Args:
+        client (Optional[Any]): An ``httpx.Client`` or ``httpx.AsyncClient``, or None if not created yet
+
+    Returns:
+        dict[str, Any]: Counts of open, active (serving a request), idle and HTTP/2 connections, and of requests queued for a free connection
+    """
+    stats = {"connections": 0, "active": 0, "idle": 0, "http2": 0, "queued": 0}
+    # httpx does not expose pool state publicly; read it from the default httpcore transport
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None:
+        return stats
+    for connection in list(getattr(pool, "connections", [])):
+        stats["connections"] += 1
+        if connection.is_idle():
+            stats["idle"] += 1
+        else:
+            stats["active"] += 1
+        info = getattr(connection, "info", lambda: "")()
+        if "HTTP/2" in info:
+            stats["http2"] += 1
+    stats["queued"] = sum(1 for request in list(getattr(pool, "_requests", [])) if request.is_queued())
+    return stats
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from typing import Any, Mapping, Optional
+
+# Burst limit of a private app on Free/Starter portals; adjusted from response headers
+DEFAULT_MAX_REQUESTS = 100
+DEFAULT_INTERVAL_SECONDS = 10.0
+# Search endpoints are limited separately and do not report rate-limit headers
+SEARCH_REQUESTS_PER_SECOND = 5
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with reservation semantics.
+
+    ``reserve`` takes a token immediately (letting the balance go negative) and
+    returns how long the caller has to wait before its token is actually
+    available, so synchronous and asyncio callers share one bucket and only
+    differ in how they sleep.
+    """
+
+    def __init__(self, capacity: float, interval: float) -> None:
+        self._lock = threading.Lock()
+        self.capacity = float(capacity)
+        self.interval = float(interval)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Tokens refilled per second."""
+        return self.capacity / self.interval
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def available(self) -> float:
+        """Tokens available right now; negative while callers are queued."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def configure(self, capacity: float, interval: float) -> None:
+        """Change the bucket size and window, keeping the current balance."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.capacity = float(capacity)
+            self.interval = float(interval)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def clamp(self, remaining: float) -> None:
+        """Lower the balance to what the server reports as ``remaining``."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Client-side governor for HubSpot's burst, search and daily quotas.
+
+    A single instance is owned by ``HubspotApp`` and therefore shared by every
+    API segment and by both the sync and the async transport. Outgoing requests
+    are paced with token buckets and the buckets are corrected from the
+    ``X-HubSpot-RateLimit-*`` headers of every response.
+
+    Args:
+        max_requests (int): Requests allowed per burst window until the headers say otherwise
+        interval (float): Length of the burst window in seconds
+        search_per_second (int): Requests per second allowed on ``/search`` endpoints
+        enabled (bool): When False, requests are never delayed but headers are still tracked
+    """
+
+    def __init__(
+        self,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        search_per_second: int = SEARCH_REQUESTS_PER_SECOND,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self.burst = TokenBucket(max_requests, interval)
+        self.search = TokenBucket(search_per_second, 1.0)
+        self.daily_limit: Optional[int] = None
+        self.daily_remaining: Optional[int] = None
+        self.interval_remaining: Optional[int] = None
+        self.throttled = 0
+
+    def _delay(self, path: str) -> float:
+        if not self.enabled:
+            return 0.0
+        delay = self.burst.reserve()
+        if path.rstrip("/").endswith("/search"):
+            delay = max(delay, self.search.reserve())
+        return delay
+
+    def acquire(self, path: str = "") -> None:
+        """
+        Block the calling thread until a request to ``path`` fits in the budget.
+
+        Args:
+            path (str): URL path of the request, used to apply the search limit
+        """
+        delay = self._delay(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, path: str = "") -> None:
+        """
+        Wait without blocking the event loop until a request to ``path`` fits in the budget.
+
+        Args:
+            path (str): URL path of the request, used to apply the search limit
+        """
+        delay = self._delay(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Feed a response back into the governor.
+
+        Args:
+            status_code (int): HTTP status of the response
+            headers (Mapping[str, str]): Response headers, searched case-insensitively by httpx
+        """
+        max_requests = _header_int(headers, "X-HubSpot-RateLimit-Max")
+        interval_ms = _header_int(headers, "X-HubSpot-RateLimit-Interval-Milliseconds")
+        if max_requests and interval_ms and (
+            max_requests != self.burst.capacity or interval_ms / 1000 != self.burst.interval
+        ):
+            self.burst.configure(max_requests, interval_ms / 1000)
+
+        remaining = _header_int(headers, "X-HubSpot-RateLimit-Remaining")
+        if remaining is not None:
+            self.interval_remaining = remaining
+            self.burst.clamp(remaining)
+
+        daily = _header_int(headers, "X-HubSpot-RateLimit-Daily")
+        if daily is not None:
+            self.daily_limit = daily
+        daily_remaining = _header_int(headers, "X-HubSpot-RateLimit-Daily-Remaining")
+        if daily_remaining is not None:
+            self.daily_remaining = daily_remaining
+
+        if status_code == 429:
+            self.throttled += 1
+            self.burst.clamp(0)
+
+    def budget(self) -> dict[str, Any]:
+        """
+        Snapshot of the remaining request budget.
+
+        Returns:
+            dict[str, Any]: Local token balances plus the last values reported by HubSpot
+        """
+        return {
+            "max_requests": int(self.burst.capacity),
+            "interval_seconds": self.burst.interval,
+            "available": max(0.0, self.burst.available()),
+            "search_available": max(0.0, self.search.available()),
+            "interval_remaining": self.interval_remaining,
+            "daily_limit": self.daily_limit,
+            "daily_remaining": self.daily_remaining,
+            "throttled": self.throttled,
+        }
@@ -0,0 +1,148 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# POST endpoints that only read data and are therefore safe to replay
+READ_ONLY_POST_SUFFIXES = ("/batch/read", "/search")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given either as seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): Raw header value
+
+    Returns:
+        Optional[float]: Seconds to wait, or None when the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed HubSpot request is sent again.
+
+    Delays follow a capped exponential curve with full jitter. A ``Retry-After``
+    header, when present, takes precedence. Throttled requests (429) are always
+    safe to replay because HubSpot rejected them unprocessed; other failures are
+    only retried for idempotent requests so that POST creates are never
+    duplicated.
+
+    Args:
+        max_attempts (int): Total attempts including the first one. 1 disables retries.
+        retry_statuses (Collection[int]): Response status codes worth retrying
+        backoff_base (float): Delay in seconds before the first retry, doubled on every attempt
+        backoff_max (float): Upper bound for a single backoff delay in seconds
+        jitter (bool): Randomise each delay between 0 and the backoff value
+        respect_retry_after (bool): Honour the ``Retry-After`` header when the server sends one
+        max_retry_after (float): Give up instead of sleeping when ``Retry-After`` asks for longer than this
+        retry_non_idempotent (bool): Also retry 5xx responses and timeouts of POST/PATCH writes
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        retry_non_idempotent: bool = False,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.retry_statuses = frozenset(retry_statuses)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        """Whether ``request`` can be replayed without side effects."""
+        if self.retry_non_idempotent or request.method in IDEMPOTENT_METHODS:
+            return True
+        return request.method == "POST" and request.url.path.rstrip("/").endswith(
+            READ_ONLY_POST_SUFFIXES
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Backoff delay before retry number ``attempt`` (0 for the first retry).
+
+        Args:
+            attempt (int): Number of failed attempts so far minus one
+
+        Returns:
+            float: Seconds to sleep
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def delay_for_response(
+        self, request: httpx.Request, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying after ``response``, or None to return it as is.
+
+        Args:
+            request (httpx.Request): The request that was sent
+            response (httpx.Response): The response received for it
+            attempt (int): Number of retries already performed
+
+        Returns:
+            Optional[float]: Delay before the next attempt, or None when no retry should happen
+        """
+        if attempt + 1 >= self.max_attempts or response.status_code not in self.retry_statuses:
+            return None
+        if response.status_code != 429 and not self.is_idempotent(request):
+            return None
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    def delay_for_error(
+        self, request: httpx.Request, error: httpx.TransportError, attempt: int
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying after a transport error, or None to re-raise it.
+
+        Connection failures never reached HubSpot and are retried for every
+        method; read timeouts and dropped connections only for idempotent requests.
+
+        Args:
+            request (httpx.Request): The request that was being sent
+            error (httpx.TransportError): The error raised by httpx
+            attempt (int): Number of retries already performed
+
+        Returns:
+            Optional[float]: Delay before the next attempt, or None when the error should propagate
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        unsent = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+        if not unsent and not self.is_idempotent(request):
+            return None
+        return self.backoff(attempt)
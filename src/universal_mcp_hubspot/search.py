@@ -0,0 +1,270 @@
+import inspect
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional
+
+from universal_mcp_hubspot.pagination import next_cursor
+
+SEARCH_WINDOW = 10_000
+SEARCH_PAGE_SIZE = 200
+UNIQUE_PARTITION_PROPERTIES = frozenset({"hs_object_id"})
+
+
+SEARCH_TOOLS = {
+    "contacts": "search_contacts_post",
+    "companies": "search_companies_post",
+    "deals": "search_deals",
+    "tickets": "search_tickets_post",
+    "line_items": "search_line_items",
+    "products": "search_products",
+    "quotes": "search_quotes",
+    "emails": "search_emails_post",
+    "feedback_submissions": "search_feedback_submissions",
+}
+
+
+def search_tool(crm: Any, object_type: str) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """
+    Search tool of ``object_type`` and the extra arguments it needs.
+
+    Args:
+        crm (Any): The app's ``CrmApi`` segment
+        object_type (str): Object type such as ``deals``, or a custom object type ID
+
+    Returns:
+        tuple[Callable[..., Any], dict[str, Any]]: The bound search tool and its fixed keyword arguments
+    """
+    if object_type in SEARCH_TOOLS:
+        return getattr(crm, SEARCH_TOOLS[object_type]), {}
+    return crm.search_objects_by_type_post, {"objectType": object_type}
+
+
+def last_modified_property(object_type: str) -> str:
+    """Name of the last-modified timestamp property: ``lastmodifieddate`` for contacts, ``hs_lastmodifieddate`` otherwise."""
+    return "lastmodifieddate" if object_type == "contacts" else "hs_lastmodifieddate"
+
+
+def to_filter_value(value: Any) -> str:
+    """Search filter value for a property value: numbers as is, ISO datetimes as epoch milliseconds."""
+    text = str(value)
+    try:
+        float(text)
+        return text
+    except ValueError:
+        pass
+    try:
+        return str(int(datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp() * 1000))
+    except ValueError:
+        return text
+
+
+class SearchPartitioner:
+    """
+    Cursor state of one logical search split into windows below HubSpot's result cap.
+
+    HubSpot search stops paging after 10,000 results per query. Results are
+    therefore sorted ascending by ``partition_by``; when the next page would
+    cross the cap, a new query starts from the last value seen by adding a
+    ``GT`` (unique properties such as ``hs_object_id``) or ``GTE`` (e.g.
+    ``lastmodifieddate``, with records at the boundary de-duplicated) filter to
+    every filter group.
+
+    Args:
+        filter_groups (Optional[List[dict[str, Any]]]): The caller's filter groups (ORed)
+        properties (Optional[List[str]]): Properties to return; ``partition_by`` is added when missing
+        partition_by (str): Property used to order and split the result set
+        page_size (int): Records per request, at most 200
+        window (int): Results reachable per query through ``after``
+        max_records (Optional[int]): Stop after this many records
+    """
+
+    def __init__(
+        self,
+        filter_groups: Optional[List[dict[str, Any]]] = None,
+        properties: Optional[List[str]] = None,
+        partition_by: str = "hs_object_id",
+        page_size: int = SEARCH_PAGE_SIZE,
+        window: int = SEARCH_WINDOW,
+        max_records: Optional[int] = None,
+    ) -> None:
+        self.filter_groups = list(filter_groups or [])
+        self.properties = list(properties) if properties is not None else None
+        if self.properties is not None and partition_by not in self.properties:
+            self.properties.append(partition_by)
+        self.partition_by = partition_by
+        self.page_size = min(page_size, SEARCH_PAGE_SIZE, window)
+        self.window = window
+        self.max_records = max_records
+        self.unique = partition_by in UNIQUE_PARTITION_PROPERTIES
+        self.after: Optional[str] = None
+        self.window_start: Optional[str] = None
+        self.window_count = 0
+        self.last_value: Optional[str] = None
+        self.boundary_ids: set[str] = set()
+        self.yielded = 0
+        self.windows = 1
+        self.finished = False
+
+    def _value(self, record: dict[str, Any]) -> str:
+        value = (record.get("properties") or {}).get(self.partition_by)
+        if value is None:
+            if self.partition_by == "hs_object_id":
+                return str(record["id"])
+            raise ValueError(
+                f"Search results do not include the partition property '{self.partition_by}'."
+            )
+        return to_filter_value(value)
+
+    def request_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments of the next search tool call."""
+        filter_groups = self.filter_groups
+        if self.window_start is not None:
+            bound = {
+                "propertyName": self.partition_by,
+                "operator": "GT" if self.unique else "GTE",
+                "value": self.window_start,
+            }
+            filter_groups = [
+                {**group, "filters": list(group.get("filters") or []) + [bound]}
+                for group in filter_groups
+            ] or [{"filters": [bound]}]
+        return {
+            "limit": self.page_size,
+            "after": self.after,
+            "sorts": [{"propertyName": self.partition_by, "direction": "ASCENDING"}],
+            "properties": self.properties,
+            "filterGroups": filter_groups,
+        }
+
+    def advance(self, page: dict[str, Any]) -> List[dict[str, Any]]:
+        """
+        Consume one response page and move the cursor.
+
+        Args:
+            page (dict[str, Any]): Search response
+
+        Returns:
+            List[dict[str, Any]]: Records of the page not yielded before
+
+        Raises:
+            RuntimeError: Raised when more than one window of records share a single ``partition_by`` value, so the result set cannot be split further.
+        """
+        records = []
+        results = page.get("results") or []
+        for record in results:
+            value = self._value(record)
+            if value != self.last_value:
+                self.last_value, self.boundary_ids = value, set()
+            elif str(record["id"]) in self.boundary_ids:
+                # Seen at the end of the previous window (GTE overlap)
+                continue
+            self.boundary_ids.add(str(record["id"]))
+            if self.max_records is not None and self.yielded >= self.max_records:
+                self.finished = True
+                return records
+            records.append(record)
+            self.yielded += 1
+        self.window_count += len(results)
+        after = next_cursor(page)
+        if not after or not results or (
+            self.max_records is not None and self.yielded >= self.max_records
+        ):
+            self.finished = True
+        elif self.window_count + self.page_size > self.window:
+            if self.last_value == self.window_start and not self.unique:
+                raise RuntimeError(
+                    f"More than {self.window} search results share {self.partition_by}={self.last_value}; "
+                    "partition by a more selective property."
+                )
+            self.window_start, self.after, self.window_count = self.last_value, None, 0
+            self.windows += 1
+        else:
+            self.after = after
+        return records
+
+
+def search_all(
+    method: Callable[..., dict[str, Any]],
+    filterGroups: Optional[List[dict[str, Any]]] = None,
+    properties: Optional[List[str]] = None,
+    partition_by: str = "hs_object_id",
+    page_size: int = SEARCH_PAGE_SIZE,
+    max_records: Optional[int] = None,
+    window: int = SEARCH_WINDOW,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily stream every result of a CRM search, beyond the 10,000-result cap.
+
+    Follows the ``after`` cursor and transparently re-partitions the query by
+    ``partition_by`` ranges whenever the cap would be reached, so memory stays
+    bounded by one page. Results come back in ascending ``partition_by``
+    order; caller-supplied sorts are not supported.
+
+    Args:
+        method (Callable): A bound search tool such as ``app.crm.search_deals`` or ``app.crm.search_objects_by_type_post``
+        filterGroups (Optional[List[dict[str, Any]]]): Filter groups as accepted by the search tool. Each gets one more filter when the query is split, so stay within HubSpot's limit of 6 filters per group.
+        properties (Optional[List[str]]): Properties to return
+        partition_by (str): ``hs_object_id`` (default) or a date property such as ``lastmodifieddate``/``hs_lastmodifieddate``
+        page_size (int): Records per request, at most 200
+        max_records (Optional[int]): Stop after yielding this many records. Iterates everything when None.
+        window (int): Results HubSpot serves per query. Only lower it for testing.
+        **kwargs: Extra arguments forwarded to ``method``, e.g. ``objectType`` or ``query``
+
+    Returns:
+        Iterator[dict[str, Any]]: Matching records, each exactly once
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        RuntimeError: Raised when more than ``window`` records share one ``partition_by`` value.
+
+    Example:
+        >>> filters = [{"filters": [{"propertyName": "dealstage", "operator": "EQ", "value": "closedwon"}]}]
+        >>> for deal in search_all(app.crm.search_deals, filters, properties=["amount"]):
+        ...     print(deal["id"])
+    """
+    partitioner = SearchPartitioner(filterGroups, properties, partition_by, page_size, window, max_records)
+    while not partitioner.finished:
+        page = method(**kwargs, **partitioner.request_kwargs())
+        yield from partitioner.advance(page)
+
+
+async def asearch_all(
+    method: Callable[..., Any],
+    filterGroups: Optional[List[dict[str, Any]]] = None,
+    properties: Optional[List[str]] = None,
+    partition_by: str = "hs_object_id",
+    page_size: int = SEARCH_PAGE_SIZE,
+    max_records: Optional[int] = None,
+    window: int = SEARCH_WINDOW,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Async counterpart of ``search_all``.
+
+    Accepts either an async twin (``app.crm.asearch_deals``) or the
+    synchronous search tool, in which case its async twin is used.
+
+    Args:
+        method (Callable): A bound search tool or its async twin
+        filterGroups (Optional[List[dict[str, Any]]]): Filter groups as accepted by the search tool
+        properties (Optional[List[str]]): Properties to return
+        partition_by (str): ``hs_object_id`` (default) or a date property such as ``lastmodifieddate``
+        page_size (int): Records per request, at most 200
+        max_records (Optional[int]): Stop after yielding this many records. Iterates everything when None.
+        window (int): Results HubSpot serves per query. Only lower it for testing.
+        **kwargs: Extra arguments forwarded to ``method``
+
+    Returns:
+        AsyncIterator[dict[str, Any]]: Matching records, each exactly once
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        RuntimeError: Raised when more than ``window`` records share one ``partition_by`` value.
+    """
+    if not inspect.iscoroutinefunction(method):
+        method = getattr(method.__self__, f"a{method.__name__}")
+    partitioner = SearchPartitioner(filterGroups, properties, partition_by, page_size, window, max_records)
+    while not partitioner.finished:
+        page = await method(**kwargs, **partitioner.request_kwargs())
+        for record in partitioner.advance(page):
+            yield record
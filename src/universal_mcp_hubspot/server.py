@@ -4,13 +4,18 @@ from universal_mcp.integrations import AgentRIntegration
 from universal_mcp.stores import EnvironmentStore
 
 from universal_mcp_hubspot.app import HubspotApp
+from universal_mcp_hubspot.manifest import ManifestToolManager
+from universal_mcp_hubspot.tool_filter import ToolFilter
 
 env_store = EnvironmentStore()
 integration_instance = AgentRIntegration(name="hubspot", store=env_store)
-app_instance = HubspotApp(integration=integration_instance)
+# Set HUBSPOT_TOOL_TAGS=Search,Basic (or HUBSPOT_TOOL_SEGMENTS=crm, ...) to expose a subset of tools
+app_instance = HubspotApp(integration=integration_instance, async_tools=True, tool_filter=ToolFilter.from_env())
 
 mcp = SingleMCPServer(
     app_instance=app_instance,
+    # Registers tools from the precomputed manifest; methods are bound on first call
+    tool_manager=ManifestToolManager(warn_on_duplicate_tools=True),
 )
 
 if __name__ == "__main__":
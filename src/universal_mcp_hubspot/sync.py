@@ -0,0 +1,360 @@
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+from universal_mcp_hubspot.search import (
+    asearch_all,
+    last_modified_property,
+    search_all,
+    search_tool,
+    to_filter_value,
+)
+
+DEFAULT_SYNC_OBJECT_TYPES = ("contacts", "companies", "deals")
+DEFAULT_CHANGE_SET_SIZE = 500
+CACHE_DIR_NAME = "universal-mcp-hubspot"
+
+
+def default_cache_path(filename: str) -> str:
+    """
+    Path of ``filename`` in the per-user cache directory, created if missing.
+
+    The directory is ``$XDG_CACHE_HOME/universal-mcp-hubspot``, or
+    ``~/.cache/universal-mcp-hubspot`` when ``XDG_CACHE_HOME`` is not set.
+
+    Args:
+        filename (str): File name inside the cache directory
+
+    Returns:
+        str: Absolute path of the file
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    directory = Path(root) / CACHE_DIR_NAME
+    directory.mkdir(parents=True, exist_ok=True)
+    return str(directory / filename)
+
+
+class WatermarkStore(ABC):
+    """
+    Where ``IncrementalSync`` keeps the last synced modification time per object type.
+
+    Subclass and implement ``get``, ``set`` and ``delete`` to keep watermarks
+    elsewhere, e.g. in the database the changes are written to.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Stored watermark for ``key``, or None if the key was never synced."""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store the watermark for ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Forget the watermark for ``key`` so the next sync starts from scratch."""
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    """Watermarks kept in a dict, for tests and single-process runs."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, str] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        return self._values.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self._values[key] = value
+
+    def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+
+
+class SQLiteWatermarkStore(WatermarkStore):
+    """
+    Watermarks persisted in a local SQLite file.
+
+    Args:
+        path (str): Database file, created on first use. ``":memory:"`` keeps it in memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS hubspot_watermarks "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM hubspot_watermarks WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO hubspot_watermarks (key, value, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                (key, value, datetime.now(timezone.utc).isoformat()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM hubspot_watermarks WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+class ChangeSet:
+    """
+    Records of one object type modified since the previous watermark.
+
+    Attributes:
+        object_type (str): Object type such as ``deals``
+        records (List[dict[str, Any]]): Changed records in ascending modification order
+        since (Optional[str]): Watermark the change set starts after (epoch milliseconds), None on the initial load
+        watermark (Optional[str]): Modification time (epoch milliseconds) up to which every record has been delivered,
+            committed once the change set is consumed. None while nothing can be committed yet.
+    """
+
+    def __init__(
+        self,
+        object_type: str,
+        records: List[dict[str, Any]],
+        since: Optional[str],
+        watermark: Optional[str],
+    ) -> None:
+        self.object_type = object_type
+        self.records = records
+        self.since = since
+        self.watermark = watermark
+
+    @property
+    def created(self) -> List[dict[str, Any]]:
+        """Records created after ``since``; every record on the initial load."""
+        if self.since is None:
+            return list(self.records)
+        since = float(self.since)
+        return [
+            record
+            for record in self.records
+            if float(to_filter_value((record.get("properties") or {}).get("createdate") or 0)) > since
+        ]
+
+    @property
+    def updated(self) -> List[dict[str, Any]]:
+        """Records that existed at ``since`` and were modified afterwards."""
+        created = {record["id"] for record in self.created}
+        return [record for record in self.records if record["id"] not in created]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class IncrementalSync:
+    """
+    Incremental CRM sync driven by last-modified watermarks.
+
+    Each run searches only records modified after the stored watermark of an
+    object type (``lastmodifieddate`` for contacts, ``hs_lastmodifieddate``
+    otherwise), ordered by that timestamp and streamed past the 10,000-result
+    search cap. Results are yielded as ``ChangeSet`` chunks, and the watermark
+    advances after each chunk has been consumed, so an interrupted run resumes
+    where it stopped and cost scales with churn rather than portal size.
+
+    Delivery is at-least-once: with ``lookback`` set, records modified shortly
+    before the watermark are delivered again to cover HubSpot's search
+    indexing delay, so consumers should upsert by ID. Deletions are not
+    reported because archived records drop out of search.
+
+    A change set only commits modification times it has delivered completely:
+    when records sharing the last timestamp continue into the next change set,
+    its watermark stops before that timestamp, so a resumed run re-reads the
+    tie instead of skipping the part it never delivered.
+
+    Args:
+        app (Any): The ``HubspotApp`` whose CRM search tools are used
+        store (Optional[WatermarkStore]): Watermark storage. Defaults to a ``SQLiteWatermarkStore`` at
+            ``default_cache_path("sync.db")``, so watermarks survive between runs.
+            Pass ``MemoryWatermarkStore()`` to start from scratch every time.
+        object_types (Iterable[str]): Object types synced by ``run``
+        properties (Optional[dict[str, List[str]]]): Properties to fetch per object type. HubSpot's defaults when missing.
+        change_set_size (int): Records per yielded change set
+        lookback (float): Seconds before the watermark to re-read on each run
+        namespace (str): Prefix of the watermark keys, to keep several portals or consumers apart in one store
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        store: Optional[WatermarkStore] = None,
+        object_types: Iterable[str] = DEFAULT_SYNC_OBJECT_TYPES,
+        properties: Optional[dict[str, List[str]]] = None,
+        change_set_size: int = DEFAULT_CHANGE_SET_SIZE,
+        lookback: float = 0.0,
+        namespace: str = "hubspot",
+    ) -> None:
+        self.app = app
+        self.store = store if store is not None else SQLiteWatermarkStore(default_cache_path("sync.db"))
+        self.object_types = tuple(object_types)
+        self.properties = properties or {}
+        self.change_set_size = change_set_size
+        self.lookback = lookback
+        self.namespace = namespace
+
+    def _key(self, object_type: str) -> str:
+        return f"{self.namespace}:{object_type}"
+
+    def watermark(self, object_type: str) -> Optional[str]:
+        """Stored watermark of ``object_type`` in epoch milliseconds, or None before the first sync."""
+        return self.store.get(self._key(object_type))
+
+    def reset(self, object_type: str) -> None:
+        """Forget the watermark of ``object_type`` so the next sync reloads every record."""
+        self.store.delete(self._key(object_type))
+
+    def _search_arguments(self, object_type: str) -> tuple[Any, dict[str, Any], Optional[str]]:
+        prop = last_modified_property(object_type)
+        since = self.watermark(object_type)
+        method, kwargs = search_tool(self.app.crm, object_type)
+        kwargs.update(
+            partition_by=prop,
+            properties=self.properties.get(object_type),
+            page_size=min(self.change_set_size, 200),
+        )
+        if since is not None:
+            if self.lookback:
+                operator, value = "GTE", str(int(float(since) - self.lookback * 1000))
+            else:
+                operator, value = "GT", since
+            kwargs["filterGroups"] = [
+                {"filters": [{"propertyName": prop, "operator": operator, "value": value}]}
+            ]
+        return method, kwargs, since
+
+    def _change_set(
+        self,
+        object_type: str,
+        records: List[dict[str, Any]],
+        since: Optional[str],
+        committed: Optional[str],
+        following: Optional[dict[str, Any]],
+    ) -> ChangeSet:
+        prop = last_modified_property(object_type)
+        stamps = [to_filter_value(record["properties"][prop]) for record in records]
+        watermark = stamps[-1]
+        if following is not None and to_filter_value(following["properties"][prop]) == watermark:
+            # The tie continues into the next change set; resuming after this
+            # timestamp would skip it, so stop at the previous one
+            watermark = next((stamp for stamp in reversed(stamps) if stamp != watermark), committed)
+        return ChangeSet(object_type, records, since, watermark)
+
+    def _commit(self, change_set: ChangeSet) -> None:
+        if change_set.watermark is not None:
+            self.store.set(self._key(change_set.object_type), change_set.watermark)
+
+    def changes(self, object_type: str) -> Iterator[ChangeSet]:
+        """
+        Stream change sets of one object type and advance its watermark.
+
+        The watermark of a change set is committed when the next one is
+        requested (or the iteration ends), i.e. after the caller processed it.
+
+        Args:
+            object_type (str): Object type such as ``contacts`` or a custom object type ID
+
+        Returns:
+            Iterator[ChangeSet]: Change sets of at most ``change_set_size`` records
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        method, kwargs, since = self._search_arguments(object_type)
+        records: List[dict[str, Any]] = []
+        committed = since
+        for record in search_all(method, **kwargs):
+            if len(records) >= self.change_set_size:
+                change_set = self._change_set(object_type, records, since, committed, record)
+                yield change_set
+                self._commit(change_set)
+                committed = change_set.watermark
+                records = []
+            records.append(record)
+        if records:
+            change_set = self._change_set(object_type, records, since, committed, None)
+            yield change_set
+            self._commit(change_set)
+
+    async def achanges(self, object_type: str) -> AsyncIterator[ChangeSet]:
+        """
+        Async counterpart of ``changes``.
+
+        Args:
+            object_type (str): Object type such as ``contacts`` or a custom object type ID
+
+        Returns:
+            AsyncIterator[ChangeSet]: Change sets of at most ``change_set_size`` records
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        method, kwargs, since = self._search_arguments(object_type)
+        records: List[dict[str, Any]] = []
+        committed = since
+        async for record in asearch_all(method, **kwargs):
+            if len(records) >= self.change_set_size:
+                change_set = self._change_set(object_type, records, since, committed, record)
+                yield change_set
+                self._commit(change_set)
+                committed = change_set.watermark
+                records = []
+            records.append(record)
+        if records:
+            change_set = self._change_set(object_type, records, since, committed, None)
+            yield change_set
+            self._commit(change_set)
+
+    def run(self, object_types: Optional[Iterable[str]] = None) -> Iterator[ChangeSet]:
+        """
+        Stream change sets of every configured object type, one type after the other.
+
+        Args:
+            object_types (Optional[Iterable[str]]): Types to sync instead of ``object_types``
+
+        Returns:
+            Iterator[ChangeSet]: Change sets in object type order
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        for object_type in object_types or self.object_types:
+            yield from self.changes(object_type)
+
+    async def arun(self, object_types: Optional[Iterable[str]] = None) -> AsyncIterator[ChangeSet]:
+        """
+        Async counterpart of ``run``.
+
+        Args:
+            object_types (Optional[Iterable[str]]): Types to sync instead of ``object_types``
+
+        Returns:
+            AsyncIterator[ChangeSet]: Change sets in object type order
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        for object_type in object_types or self.object_types:
+            async for change_set in self.achanges(object_type):
+                yield change_set
@@ -0,0 +1,441 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional
+
+from universal_mcp_hubspot.batching import (
+    DEFAULT_CONCURRENCY,
+    Chunk,
+    ChunkOutcome,
+    asend_splitting,
+    batch_error,
+    chunked,
+    imap_bounded,
+    send_splitting,
+)
+
+DEFAULT_TEMPLATE_TTL_SECONDS = 600.0
+TIMELINE_BATCH_LIMIT = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Event fields that identify the CRM record of an event on a contact template; other templates need objectId
+CONTACT_IDENTIFIERS = ("email", "utk", "objectId")
+
+
+def _number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def _date(value: Any) -> bool:
+    """Dates are epoch milliseconds or ISO 8601 strings."""
+    if _number(value):
+        return True
+    try:
+        datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+class TimelineTemplates:
+    """
+    Cache of timeline event templates, for validating events before they are sent.
+
+    The templates of an app are loaded with one
+    ``get_timeline_event_templates_by_app_id`` call and indexed by template ID
+    and token name. An app's templates are reloaded once the TTL expires or
+    right after any write under ``/crm/v3/timeline/{appId}/event-templates``,
+    e.g. ``update_event_template_token``.
+
+    Args:
+        app (Any): The ``HubspotApp`` whose CRM segment is used to load templates
+        ttl (float): Seconds before an app's templates are reloaded
+    """
+
+    def __init__(self, app: Any, ttl: float = DEFAULT_TEMPLATE_TTL_SECONDS) -> None:
+        self.app = app
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._expires: dict[str, float] = {}
+        # appId -> template ID -> template, with "tokens" re-keyed by token name
+        self._templates: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def _is_fresh(self, app_id: str) -> bool:
+        return self._expires.get(app_id, 0.0) > time.monotonic()
+
+    def _index(self, app_id: str, response: dict[str, Any]) -> None:
+        templates = {}
+        for template in response.get("results") or []:
+            tokens = {token["name"]: token for token in template.get("tokens") or []}
+            templates[str(template["id"])] = {**template, "tokens": tokens}
+        with self._lock:
+            self._templates[app_id] = templates
+            self._expires[app_id] = time.monotonic() + self.ttl
+
+    def load(self, app_id: str, force: bool = False) -> None:
+        """
+        Load the templates of ``app_id`` unless a fresh copy is cached.
+
+        Args:
+            app_id (str): ID of the HubSpot developer app that owns the templates
+            force (bool): Reload even when the cached copy is still fresh
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        app_id = str(app_id)
+        if force or not self._is_fresh(app_id):
+            self._index(app_id, self.app.crm.get_timeline_event_templates_by_app_id(app_id))
+
+    async def aload(self, app_id: str, force: bool = False) -> None:
+        """
+        Async counterpart of ``load``.
+
+        Args:
+            app_id (str): ID of the HubSpot developer app that owns the templates
+            force (bool): Reload even when the cached copy is still fresh
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        app_id = str(app_id)
+        if force or not self._is_fresh(app_id):
+            self._index(app_id, await self.app.crm.aget_timeline_event_templates_by_app_id(app_id))
+
+    def template(self, app_id: str, template_id: str) -> Optional[dict[str, Any]]:
+        """
+        Cached template, with its tokens keyed by name; call ``load`` first.
+
+        Args:
+            app_id (str): ID of the developer app
+            template_id (str): Event template ID
+
+        Returns:
+            Optional[dict[str, Any]]: The template, or None when the app has no such template
+        """
+        return self._templates.get(str(app_id), {}).get(str(template_id))
+
+    def validate(self, app_id: str, event: dict[str, Any]) -> List[str]:
+        """
+        Check an event against its cached template the way HubSpot would.
+
+        Verifies that the template exists, that the event identifies a record,
+        and that every token is defined by the template and has a value of the
+        token's type: a number, a date (epoch milliseconds or ISO 8601) or one
+        of the options of an enumeration.
+
+        Args:
+            app_id (str): ID of the developer app; its templates must be loaded
+            event (dict[str, Any]): Event in the ``create_event`` format
+
+        Returns:
+            List[str]: Problems found; empty when the event is valid
+        """
+        template = self.template(app_id, event.get("eventTemplateId"))
+        if template is None:
+            return [f"Unknown event template '{event.get('eventTemplateId')}'."]
+        problems = []
+        identifiers = CONTACT_IDENTIFIERS if template.get("objectType", "contacts").lower() == "contacts" else ("objectId",)
+        if not any(event.get(field) for field in identifiers):
+            problems.append(f"The event needs one of {', '.join(identifiers)}.")
+        for name, value in (event.get("tokens") or {}).items():
+            token = template["tokens"].get(name)
+            if token is None:
+                problems.append(f"Token '{name}' is not defined by template '{template['id']}'.")
+                continue
+            kind = token.get("type", "string")
+            if kind == "number" and not _number(value):
+                problems.append(f"Token '{name}' must be a number, got {value!r}.")
+            elif kind == "date" and not _date(value):
+                problems.append(f"Token '{name}' must be a date, got {value!r}.")
+            elif kind == "enumeration":
+                options = {str(option.get("value")) for option in token.get("options") or []}
+                if str(value) not in options:
+                    problems.append(f"Token '{name}' must be one of {', '.join(sorted(options))}, got {value!r}.")
+        return problems
+
+    def invalidate(self, app_id: Optional[str] = None) -> None:
+        """
+        Drop cached templates.
+
+        Args:
+            app_id (Optional[str]): App to drop. Drops every app when None.
+        """
+        with self._lock:
+            if app_id is None:
+                self._expires.clear()
+                self._templates.clear()
+            else:
+                self._expires.pop(str(app_id), None)
+                self._templates.pop(str(app_id), None)
+
+    def invalidate_path(self, path: str) -> None:
+        """Mutation listener: drop the templates of the app written under ``/crm/v3/timeline/{appId}/event-templates``."""
+        parts = path.strip("/").split("/")
+        if len(parts) >= 5 and parts[:3] == ["crm", "v3", "timeline"] and parts[4] == "event-templates":
+            self.invalidate(parts[3])
+
+
+class TimelineIngestResult:
+    """
+    Outcome of ingesting timeline events, keyed by the position of each event in the input.
+
+    Attributes:
+        created (int): Events HubSpot accepted
+        rejected (dict[int, dict[str, Any]]): Events that failed local validation, by input index, with ``category`` ``VALIDATION_ERROR`` and the problems as ``message``
+        failed (dict[int, dict[str, Any]]): Events HubSpot rejected, by input index
+        partial (List[dict[str, Any]]): Batches HubSpot accepted only in part, with the ``indexes`` they carried, the number ``created`` and HubSpot's ``errors``.
+            Batch timeline errors do not say which events failed, so these events are neither counted as failed nor retried.
+        requests (int): Batch requests sent
+    """
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.rejected: dict[int, dict[str, Any]] = {}
+        self.failed: dict[int, dict[str, Any]] = {}
+        self.partial: List[dict[str, Any]] = []
+        self.requests = 0
+
+    def __len__(self) -> int:
+        unresolved = sum(len(batch["indexes"]) - batch["created"] for batch in self.partial)
+        return self.created + len(self.rejected) + len(self.failed) + unresolved
+
+    def _reject(self, index: int, problems: List[str]) -> None:
+        self.rejected[index] = {"status": "error", "category": "VALIDATION_ERROR", "message": " ".join(problems), "statusCode": None}
+
+    def _record(self, chunk: Chunk, response: Any) -> None:
+        errors = (response or {}).get("errors") or []
+        created = len((response or {}).get("results") or []) if errors else len(chunk)
+        self.created += created
+        if errors:
+            self.partial.append({"indexes": [index for index, _ in chunk], "created": created, "errors": errors})
+
+    def _apply(self, outcomes: List[ChunkOutcome], requests: int) -> None:
+        """Record the outcomes of one chunk sent by ``send_splitting``."""
+        self.requests += requests
+        for chunk, response, error in outcomes:
+            if error is None:
+                self._record(chunk, response)
+                continue
+            for index, _ in chunk:
+                self.failed[index] = batch_error(error, "VALIDATION_ERROR" if len(chunk) == 1 else "CHUNK_FAILED")
+
+
+class TimelineEventPipeline:
+    """
+    Buffers timeline events into batch-create requests on a size/time flush policy.
+
+    Every event is validated against the cached template (see
+    ``TimelineTemplates.validate``) before it is buffered, so malformed tokens
+    are reported locally instead of failing a request. A batch is sent as
+    soon as ``batch_size`` events are buffered, or ``flush_interval`` seconds
+    after the first event of a partial batch. Up to ``max_concurrency``
+    batches are in flight; ``add`` waits for a free slot when all are busy, so
+    a fast producer cannot buffer without bound.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        app_id (str): ID of the developer app that owns the event templates
+        batch_size (int): Events per request, at most 500
+        flush_interval (float): Seconds a partial batch waits for more events
+        max_concurrency (int): Maximum number of requests in flight
+        validate (bool): Validate events against their template before sending them
+
+    Example:
+        >>> async with TimelineEventPipeline(app, "1001") as pipeline:
+        ...     async for usage in usage_events():
+        ...         await pipeline.add({"eventTemplateId": "1001298", "email": usage.email, "tokens": usage.tokens})
+        >>> print(pipeline.result.created, pipeline.result.rejected)
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        app_id: str,
+        batch_size: int = TIMELINE_BATCH_LIMIT,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        validate: bool = True,
+    ) -> None:
+        if not 1 <= batch_size <= TIMELINE_BATCH_LIMIT:
+            raise ValueError(f"Batch size must be between 1 and {TIMELINE_BATCH_LIMIT}.")
+        self.app = app
+        self.app_id = str(app_id)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.validate = validate
+        self.result = TimelineIngestResult()
+        self._buffer: Chunk = []
+        self._count = 0
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def add(self, event: dict[str, Any]) -> int:
+        """
+        Validate an event and buffer it for the next batch.
+
+        Args:
+            event (dict[str, Any]): Event in the ``create_event`` format, e.g. {"eventTemplateId": "1001298", "email": "a@example.com", "tokens": {"feature": "export"}}
+
+        Returns:
+            int: Index of the event, the key it is reported under in ``result``
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        index = self._count
+        self._count += 1
+        if self.validate:
+            await self.app.timeline_templates.aload(self.app_id)
+            problems = self.app.timeline_templates.validate(self.app_id, event)
+            if problems:
+                self.result._reject(index, problems)
+                return index
+        self._buffer.append((index, event))
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif len(self._buffer) == 1 and self.flush_interval > 0:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._flush_later)
+        return index
+
+    async def flush(self) -> None:
+        """Send the buffered events now, waiting for a free request slot."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        chunk, self._buffer = self._buffer, []
+        if chunk:
+            await self._slots.acquire()
+            self._spawn(chunk)
+
+    def _flush_later(self) -> None:
+        self._timer = None
+        chunk, self._buffer = self._buffer, []
+        if chunk:
+            self._tasks.add(task := asyncio.ensure_future(self._send_when_free(chunk)))
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_when_free(self, chunk: Chunk) -> None:
+        await self._slots.acquire()
+        await self._send(chunk)
+
+    def _spawn(self, chunk: Chunk) -> None:
+        task = asyncio.ensure_future(self._send(chunk))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, chunk: Chunk) -> None:
+        try:
+            self.result._apply(*await asend_splitting(self.app.crm.abatch_create_timeline_events, chunk))
+        finally:
+            self._slots.release()
+
+    async def close(self) -> TimelineIngestResult:
+        """
+        Flush the remaining events and wait for every request to finish.
+
+        Returns:
+            TimelineIngestResult: Counts and failures of every event added
+        """
+        await self.flush()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
+        return self.result
+
+    async def __aenter__(self) -> "TimelineEventPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+def ingest_events(
+    app: Any,
+    app_id: str,
+    events: Iterable[dict[str, Any]],
+    batch_size: int = TIMELINE_BATCH_LIMIT,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    validate: bool = True,
+) -> TimelineIngestResult:
+    """
+    Create any number of timeline events through the batch endpoint.
+
+    The bulk counterpart of ``create_event``: ``events`` is consumed lazily
+    in batches of ``batch_size`` with up to ``max_concurrency`` requests in
+    flight. Events are validated against the cached templates first, and a
+    batch HubSpot rejects as invalid is split in halves until the offending
+    events are isolated. A batch HubSpot accepts only in part is reported in
+    ``partial``, since its errors do not say which events failed.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        app_id (str): ID of the developer app that owns the event templates
+        events (Iterable[dict[str, Any]]): Events in the ``create_event`` format
+        batch_size (int): Events per request, at most 500
+        max_concurrency (int): Maximum number of requests in flight
+        validate (bool): Validate events against their template before sending them
+
+    Returns:
+        TimelineIngestResult: Counts and failures by input index
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    result = TimelineIngestResult()
+    if validate:
+        app.timeline_templates.load(app_id)
+
+    def valid() -> Iterator[tuple[int, dict[str, Any]]]:
+        for index, event in enumerate(events):
+            problems = app.timeline_templates.validate(app_id, event) if validate else []
+            if problems:
+                result._reject(index, problems)
+            else:
+                yield index, event
+
+    chunks = chunked(valid(), batch_size)
+    send = app.crm.batch_create_timeline_events
+    # Validation and outcomes both run here on the calling thread
+    for outcomes, requests in imap_bounded(lambda chunk: send_splitting(send, chunk), chunks, max_concurrency):
+        result._apply(outcomes, requests)
+    return result
+
+
+async def aingest_events(
+    app: Any,
+    app_id: str,
+    events: Iterable[dict[str, Any]],
+    batch_size: int = TIMELINE_BATCH_LIMIT,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    validate: bool = True,
+) -> TimelineIngestResult:
+    """
+    Async counterpart of ``ingest_events``.
+
+    Args:
+        app (Any): The ``HubspotApp``
+        app_id (str): ID of the developer app that owns the event templates
+        events (Iterable[dict[str, Any]]): Events in the ``create_event`` format
+        batch_size (int): Events per request, at most 500
+        max_concurrency (int): Maximum number of requests in flight
+        validate (bool): Validate events against their template before sending them
+
+    Returns:
+        TimelineIngestResult: Counts and failures by input index
+
+    Raises:
+        HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+    """
+    pipeline = TimelineEventPipeline(app, app_id, batch_size, 0, max_concurrency, validate)
+    for event in events:
+        await pipeline.add(event)
+    return await pipeline.close()
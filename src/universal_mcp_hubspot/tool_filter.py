@@ -0,0 +1,132 @@
+import os
+from typing import Any, Callable, Iterable, List, Optional
+
+APP_SEGMENT = "app"
+"""Segment name of the tools defined on ``HubspotApp`` itself (lists and notes)."""
+
+
+def docstring_tags(func: Callable) -> List[str]:
+    """
+    Tags listed in the ``Tags:`` section of a tool docstring.
+
+    Args:
+        func (Callable): Tool method
+
+    Returns:
+        List[str]: Tags in declaration order, e.g. ``["Search"]``
+    """
+    tags: List[str] = []
+    in_tags = False
+    for line in (func.__doc__ or "").splitlines():
+        stripped = line.strip()
+        if stripped == "Tags:":
+            in_tags = True
+        elif in_tags:
+            if not stripped:
+                if tags:
+                    break
+                continue
+            tags.extend(tag.strip() for tag in stripped.split(",") if tag.strip())
+    return tags
+
+
+def _normalize(values: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+    if values is None:
+        return None
+    normalized = frozenset(value.strip().lower() for value in values if value.strip())
+    return normalized or None
+
+
+def _split_env(name: str) -> Optional[List[str]]:
+    value = os.environ.get(name)
+    return value.split(",") if value else None
+
+
+class ToolFilter:
+    """
+    Include/exclude rules deciding which tools ``HubspotApp.list_tools`` exposes.
+
+    A tool is exposed when it matches every include rule that is set (any of
+    its tags in ``tags``, its segment in ``segments``) and no exclude rule.
+    Tags and segment names are matched case-insensitively. Segments are
+    ``crm``, ``marketing`` and ``app`` for the list and note tools defined on
+    ``HubspotApp``.
+
+    Args:
+        tags (Optional[Iterable[str]]): Expose only tools carrying at least one of these tags, e.g. ``["Search", "Basic"]``
+        exclude_tags (Optional[Iterable[str]]): Hide tools carrying any of these tags
+        segments (Optional[Iterable[str]]): Expose only tools of these segments
+        exclude_segments (Optional[Iterable[str]]): Hide tools of these segments
+    """
+
+    def __init__(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        exclude_tags: Optional[Iterable[str]] = None,
+        segments: Optional[Iterable[str]] = None,
+        exclude_segments: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.tags = _normalize(tags)
+        self.exclude_tags = _normalize(exclude_tags)
+        self.segments = _normalize(segments)
+        self.exclude_segments = _normalize(exclude_segments)
+
+    @classmethod
+    def from_env(cls) -> Optional["ToolFilter"]:
+        """
+        Filter configured by comma-separated environment variables.
+
+        Reads ``HUBSPOT_TOOL_TAGS``, ``HUBSPOT_EXCLUDE_TOOL_TAGS``,
+        ``HUBSPOT_TOOL_SEGMENTS`` and ``HUBSPOT_EXCLUDE_TOOL_SEGMENTS``.
+
+        Returns:
+            Optional[ToolFilter]: The filter, or None when none of the variables is set
+        """
+        tool_filter = cls(
+            tags=_split_env("HUBSPOT_TOOL_TAGS"),
+            exclude_tags=_split_env("HUBSPOT_EXCLUDE_TOOL_TAGS"),
+            segments=_split_env("HUBSPOT_TOOL_SEGMENTS"),
+            exclude_segments=_split_env("HUBSPOT_EXCLUDE_TOOL_SEGMENTS"),
+        )
+        return None if tool_filter.is_empty else tool_filter
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the filter lets every tool through."""
+        return not (self.tags or self.exclude_tags or self.segments or self.exclude_segments)
+
+    def matches(self, segment: str, tags: Iterable[str]) -> bool:
+        """
+        Whether a tool with ``tags`` in ``segment`` is exposed.
+
+        Args:
+            segment (str): Segment name, e.g. ``crm``
+            tags (Iterable[str]): The tool's docstring tags
+
+        Returns:
+            bool: True if the tool passes every rule
+        """
+        segment = segment.lower()
+        if self.segments is not None and segment not in self.segments:
+            return False
+        if self.exclude_segments is not None and segment in self.exclude_segments:
+            return False
+        tool_tags = {tag.lower() for tag in tags}
+        if self.tags is not None and not tool_tags & self.tags:
+            return False
+        if self.exclude_tags is not None and tool_tags & self.exclude_tags:
+            return False
+        return True
+
+    def filter(self, segment: str, tools: Iterable[Any]) -> List[Any]:
+        """
+        The tool methods of ``segment`` that pass the filter.
+
+        Args:
+            segment (str): Segment the tools belong to
+            tools (Iterable[Any]): Bound tool methods
+
+        Returns:
+            List[Any]: Matching tools, in order
+        """
+        return [tool for tool in tools if self.matches(segment, docstring_tags(tool))]
@@ -0,0 +1,209 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Any, Callable, List, Optional
+
+import httpx
+
+
+class PendingRequest:
+    """
+    A request that was built by a tool method but not sent yet.
+
+    Async twins run the synchronous tool body in capture mode: instead of
+    sending, the transport hands back a ``PendingRequest`` which the twin then
+    dispatches on the shared ``httpx.AsyncClient``.
+    """
+
+    __slots__ = ("request",)
+
+    def __init__(self, request: httpx.Request) -> None:
+        self.request = request
+
+
+_captured: ContextVar[Optional[List[PendingRequest]]] = ContextVar(
+    "hubspot_captured_request", default=None
+)
+
+
+class ToolCall:
+    """
+    The tool method invocation a request is issued from.
+
+    Attached to every request as ``request.extensions["hubspot_tool_call"]`` so
+    instrumentation can report which tool and endpoint a request belongs to.
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict[str, Any]) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def name(self) -> str:
+        return self.func.__name__
+
+    def endpoint(self, path: str) -> str:
+        """
+        Endpoint template of ``path``, e.g. ``/crm/v3/objects/contacts/{contactId}``.
+
+        Path segments equal to an argument of the call are replaced by the
+        argument name, so metrics do not explode into one series per record.
+
+        Args:
+            path (str): Concrete URL path of the request
+
+        Returns:
+            str: The path with argument values replaced by ``{argument}`` placeholders
+        """
+        signature = getattr(self.func, "__hubspot_signature__", None)
+        if signature is None:
+            signature = inspect.signature(self.func)
+            self.func.__hubspot_signature__ = signature
+        try:
+            arguments = signature.bind_partial(None, *self.args, **self.kwargs).arguments
+        except TypeError:
+            return path
+        values = {
+            str(value): name
+            for name, value in list(arguments.items())[1:]
+            if isinstance(value, (str, int)) and not isinstance(value, bool)
+        }
+        return "/".join(
+            f"{{{values[segment]}}}" if segment in values else segment
+            for segment in path.split("/")
+        )
+
+
+_current_call: ContextVar[Optional[ToolCall]] = ContextVar("hubspot_tool_call", default=None)
+
+
+def current_tool_call() -> Optional[ToolCall]:
+    """The innermost tool method currently executing in this context, if any."""
+    return _current_call.get()
+
+
+def tool_method(func: Callable) -> Callable:
+    """
+    Wrap a synchronous tool method so requests it issues know which tool they belong to.
+
+    Args:
+        func (Callable): Unbound tool method
+
+    Returns:
+        Callable: Wrapper with the same name, signature and docstring
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        token = _current_call.set(ToolCall(func, args, kwargs))
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _current_call.reset(token)
+
+    wrapper.__hubspot_tool_method__ = True
+    return wrapper
+
+
+def capture_request(request: httpx.Request) -> Optional[PendingRequest]:
+    """
+    Capture ``request`` if the current context belongs to an async twin.
+
+    Args:
+        request (httpx.Request): The fully built request
+
+    Returns:
+        Optional[PendingRequest]: The pending request to hand back to the tool body, or None when the request should be sent synchronously.
+
+    Raises:
+        RuntimeError: Raised when a tool issues more than one request, which async twins cannot replay.
+    """
+    captured = _captured.get()
+    if captured is None:
+        return None
+    if captured:
+        raise RuntimeError(
+            "Async twins only support tool methods that issue a single request."
+        )
+    pending = PendingRequest(request)
+    captured.append(pending)
+    return pending
+
+
+def no_async_twin(func: Callable) -> Callable:
+    """Mark a public method so that no ``a``-prefixed async twin is generated for it."""
+    func.__hubspot_no_async_twin__ = True
+    return func
+
+
+def async_twin(func: Callable) -> Callable:
+    """
+    Build the asyncio-native twin of a synchronous tool method.
+
+    The tool body runs unchanged (argument validation, URL and body building)
+    with request capture enabled; the captured request is then sent through
+    ``main_app._asend`` and parsed with the regular ``_handle_response``.
+
+    Args:
+        func (Callable): Unbound synchronous method issuing exactly one request
+
+    Returns:
+        Callable: Unbound coroutine function with the same signature and docstring
+    """
+
+    @functools.wraps(func)
+    async def twin(self, *args, **kwargs):
+        token = _captured.set([])
+        try:
+            result = func(self, *args, **kwargs)
+            captured = _captured.get()
+        finally:
+            _captured.reset(token)
+        if not captured:
+            return result
+        app = self._transport_app
+        response = await app._asend(captured[0].request)
+        return app._handle_response(response)
+
+    return twin
+
+
+class AsyncTwinsMixin:
+    """
+    Give every public tool method of a subclass an ``a``-prefixed coroutine twin.
+
+    ``get_contact_by_id`` gets ``aget_contact_by_id``, ``add_a_note`` gets
+    ``aadd_a_note`` and so on. Twins keep the original ``__name__`` and
+    signature so they can be registered as MCP tools under the same name.
+    Tool methods are also wrapped with ``tool_method`` so their requests carry
+    the calling tool for instrumentation.
+    """
+
+    _no_async_twins = frozenset({"list_tools"})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if (
+                name.startswith("_")
+                or name in cls._no_async_twins
+                or not inspect.isfunction(member)
+                or inspect.iscoroutinefunction(member)
+                or inspect.isgeneratorfunction(member)
+                or inspect.isasyncgenfunction(member)
+                or getattr(member, "__hubspot_tool_method__", False)
+            ):
+                continue
+            wrapped = tool_method(member)
+            setattr(cls, name, wrapped)
+            if getattr(wrapped, "__hubspot_no_async_twin__", False) or f"a{name}" in vars(cls):
+                continue
+            setattr(cls, f"a{name}", async_twin(wrapped))
+
+    @property
+    def _transport_app(self) -> Any:
+        """The application object owning the HTTP clients."""
+        return self
@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_hubspot.app import HubspotApp
+from universal_mcp_hubspot.rate_limit import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep default sync and mirror databases out of the real user cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def make_app():
+    """
+    Factory for a ``HubspotApp`` with a dummy access token.
+
+    ``make_app(mock=MockHubspot(...))`` serves the async client from the mock
+    in-process, with client-side pacing disabled. ``make_app(handler=fn)``
+    serves both clients from an ``httpx.MockTransport`` handler. Other
+    keyword arguments are passed to ``HubspotApp``.
+    """
+
+    def factory(mock=None, handler=None, **kwargs) -> HubspotApp:
+        mock_integration = MagicMock()
+        mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+        if mock is not None:
+            kwargs.setdefault("rate_limiter", RateLimiter(enabled=False))
+        if handler is not None:
+            kwargs.setdefault("client", httpx.Client(transport=httpx.MockTransport(handler)))
+        app = HubspotApp(integration=mock_integration, **kwargs)
+        if mock is not None:
+            app._async_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=mock))
+        elif handler is not None:
+            app._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return app
+
+    return factory
@@ -0,0 +1,808 @@
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email import policy
+from email.parser import BytesParser
+from typing import Any, Iterator, List, Optional
+from urllib.parse import parse_qs
+
+from universal_mcp_hubspot.search import last_modified_property
+
+SEARCH_WINDOW = 10_000
+BATCH_INPUT_LIMIT = 100
+ASSOCIATION_BATCH_LIMIT = 1_000
+ASSOCIATION_PAGE_SIZE = 500
+# Properties HubSpot rejects a create without, per object type
+REQUIRED_PROPERTIES = {"notes": ("hs_timestamp",)}
+# Property metadata served by /crm/v3/properties/{objectType}: (name, label, type)
+PROPERTIES = {
+    "contacts": [("email", "Email", "string"), ("firstname", "First Name", "string"), ("lastname", "Last Name", "string"), ("phone", "Phone Number", "string")],
+    "companies": [("name", "Company name", "string"), ("domain", "Company Domain Name", "string")],
+    "deals": [("dealname", "Deal Name", "string"), ("amount", "Amount", "number"), ("dealstage", "Deal Stage", "enumeration"), ("pipeline", "Pipeline", "enumeration")],
+}
+IMPORT_OBJECT_TYPES = {"0-1": "contacts", "0-2": "companies", "0-3": "deals", "0-5": "tickets", "0-8": "line_items"}
+# HubSpot-defined association type IDs of the seeded associations
+ASSOCIATION_TYPES = {
+    ("contacts", "companies"): (1, "contact_to_company"),
+    ("companies", "contacts"): (2, "company_to_contact"),
+    ("deals", "contacts"): (3, "deal_to_contact"),
+    ("contacts", "deals"): (4, "contact_to_deal"),
+    ("deals", "companies"): (5, "deal_to_company"),
+    ("companies", "deals"): (6, "company_to_deal"),
+}
+TIMELINE_BATCH_LIMIT = 500
+# Timeline event templates of the developer app TIMELINE_APP_ID
+TIMELINE_APP_ID = "1001"
+TIMELINE_TEMPLATES = [
+    {
+        "id": "1001298",
+        "name": "Feature used",
+        "objectType": "contacts",
+        "headerTemplate": "Used {{feature}} {{count}} times",
+        "tokens": [
+            {"name": "feature", "label": "Feature", "type": "string"},
+            {"name": "count", "label": "Count", "type": "number"},
+            {"name": "usedAt", "label": "Used at", "type": "date"},
+            {
+                "name": "plan",
+                "label": "Plan",
+                "type": "enumeration",
+                "options": [{"label": "Free", "value": "free"}, {"label": "Pro", "value": "pro"}],
+            },
+        ],
+    },
+]
+# Email statistics are generated per email and hour; buckets of the histogram route are HOUR or DAY
+EMAIL_STATISTICS_INTERVALS = {"HOUR": 3_600, "DAY": 86_400}
+DEFAULT_STATISTICS_EMAIL_IDS = tuple(range(1, 11))
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _comparable(value: Any) -> Any:
+    """Numbers and epoch milliseconds compare numerically, ISO datetimes as epoch milliseconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value)
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp() * 1000
+    except ValueError:
+        return text
+
+
+def _matches(record: dict[str, Any], flt: dict[str, Any]) -> bool:
+    operator = flt.get("operator", "EQ")
+    actual = record["properties"].get(flt.get("propertyName"))
+    if operator == "HAS_PROPERTY":
+        return actual not in (None, "")
+    if operator == "NOT_HAS_PROPERTY":
+        return actual in (None, "")
+    if actual in (None, ""):
+        return operator in ("NEQ", "NOT_IN")
+    if operator in ("IN", "NOT_IN"):
+        values = {str(value).lower() for value in flt.get("values") or []}
+        return (str(actual).lower() in values) == (operator == "IN")
+    if operator == "CONTAINS_TOKEN":
+        return str(flt.get("value", "")).strip("*").lower() in str(actual).lower()
+    left = _comparable(actual)
+    right = _comparable(flt.get("value"))
+    if type(left) is not type(right):
+        left, right = str(actual), str(flt.get("value"))
+    if operator in ("EQ", "NEQ"):
+        # HubSpot matches text regardless of case
+        if isinstance(left, str):
+            left, right = left.lower(), right.lower()
+        return (left == right) == (operator == "EQ")
+    if operator == "LT":
+        return left < right
+    if operator == "LTE":
+        return left <= right
+    if operator == "GT":
+        return left > right
+    if operator == "GTE":
+        return left >= right
+    if operator == "BETWEEN":
+        return right <= left <= _comparable(flt.get("highValue"))
+    return False
+
+
+class MockHubspot:
+    """
+    In-process ASGI stand-in for ``api.hubapi.com`` for offline tests and benchmarks.
+
+    Serves seeded, deterministic CRM records with HubSpot's response shapes:
+    cursor-paginated object and list-membership reads, search with filter
+    groups, sorts and the 10,000-result window, and batch create/read/update/
+    archive with the 100-input limit, association types and batched
+    association reads, CSV imports, timeline event templates and events, and marketing email
+    statistics. Records created through the API are
+    stored, so reads observe earlier writes. Latency and throttling (429) can
+    be injected to exercise retry and rate-limit handling.
+
+    Use it in-process with ``httpx.ASGITransport`` (async clients only), or
+    over real sockets with ``serve()``.
+
+    Args:
+        contacts (int): Number of seeded contacts
+        companies (int): Number of seeded companies
+        deals (int): Number of seeded deals
+        list_size (int): Members of the seeded list ``"1"`` (contact IDs 1..list_size)
+        latency (float): Seconds added to every response
+        jitter (float): Extra random latency of up to this many seconds
+        throttle_rate (float): Probability (0-1) of answering any request with 429
+        max_requests (Optional[int]): Requests allowed per ``interval`` before answering 429, like HubSpot's burst limit. None disables it.
+        interval (float): Rate-limit window in seconds
+        retry_after (Optional[float]): ``Retry-After`` seconds sent with 429 responses. HubSpot usually omits it.
+        search_window (int): Results reachable per search query through ``after``
+        import_duration (float): Seconds an import stays ``PROCESSING`` before it is ``DONE``
+        campaigns (int): Number of seeded marketing campaigns
+        seed (int): Seed for generated data, jitter and throttling
+    """
+
+    def __init__(
+        self,
+        contacts: int = 1_000,
+        companies: int = 100,
+        deals: int = 1_000,
+        list_size: int = 1_000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_requests: Optional[int] = None,
+        interval: float = 10.0,
+        retry_after: Optional[float] = None,
+        search_window: int = SEARCH_WINDOW,
+        import_duration: float = 0.0,
+        campaigns: int = 0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.max_requests = max_requests
+        self.interval = interval
+        self.retry_after = retry_after
+        self.search_window = search_window
+        self.import_duration = import_duration
+        self.imports: dict[str, dict[str, Any]] = {}
+        self.import_errors: dict[str, List[dict[str, Any]]] = {}
+        self.timeline_templates = {TIMELINE_APP_ID: [dict(template) for template in TIMELINE_TEMPLATES]}
+        self.timeline_events: List[dict[str, Any]] = []
+        # Campaign GUID -> campaign; GUIDs are derived from the index so runs are reproducible
+        self.campaigns: dict[str, dict[str, Any]] = {}
+        for index in range(campaigns):
+            guid = str(uuid.uuid5(uuid.NAMESPACE_URL, f"campaign-{seed}-{index}"))
+            self.campaigns[guid] = {"id": guid, "index": index, "properties": {"hs_name": f"Campaign {index}"}}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self.requests: Counter = Counter()
+        self.throttled = 0
+        self.objects: dict[str, dict[str, dict[str, Any]]] = {
+            "contacts": {}, "companies": {}, "deals": {}, "tickets": {}, "line_items": {}, "notes": {},
+        }
+        self._next_id = 1
+        for _ in range(contacts):
+            self._add("contacts", self._contact_properties(self._next_id))
+        for _ in range(companies):
+            self._add("companies", {"name": f"Company {self._next_id}", "domain": f"company{self._next_id}.example.com"})
+        stages = ("appointmentscheduled", "qualifiedtobuy", "presentationscheduled", "closedwon", "closedlost")
+        for index in range(deals):
+            self._add(
+                "deals",
+                {
+                    "dealname": f"Deal {index}",
+                    "amount": str(self._random.randrange(100, 100_000)),
+                    "pipeline": "default",
+                    "dealstage": stages[index % len(stages)],
+                },
+            )
+        contact_ids = sorted(self.objects["contacts"], key=int)
+        company_ids = sorted(self.objects["companies"], key=int)
+        self.lists: dict[str, List[str]] = {"1": contact_ids[:list_size]}
+        # (fromObjectType, toObjectType) -> from ID -> associated IDs, kept symmetric
+        self.associations: dict[tuple[str, str], dict[str, List[str]]] = {}
+        for index, contact_id in enumerate(contact_ids):
+            if company_ids:
+                self.associate("contacts", contact_id, "companies", company_ids[index % len(company_ids)])
+        for index, deal_id in enumerate(sorted(self.objects["deals"], key=int)):
+            if company_ids:
+                self.associate("deals", deal_id, "companies", company_ids[index % len(company_ids)])
+            if contact_ids:
+                self.associate("deals", deal_id, "contacts", contact_ids[index % len(contact_ids)])
+
+    def associate(self, from_type: str, from_id: str, to_type: str, to_id: str) -> None:
+        """Associate two records in both directions."""
+        for (source_type, source_id), (target_type, target_id) in (
+            ((from_type, from_id), (to_type, to_id)),
+            ((to_type, to_id), (from_type, from_id)),
+        ):
+            targets = self.associations.setdefault((source_type, target_type), {}).setdefault(source_id, [])
+            if target_id not in targets:
+                targets.append(target_id)
+
+    def _contact_properties(self, number: int) -> dict[str, Any]:
+        return {
+            "email": f"contact{number}@example.com",
+            "firstname": f"First{number}",
+            "lastname": f"Last{number}",
+        }
+
+    def _add(self, object_type: str, properties: dict[str, Any], seeded: bool = True) -> dict[str, Any]:
+        record_id = str(self._next_id)
+        # Seeded records get distinct past timestamps, records created through the API the current time
+        created = _iso(_EPOCH + timedelta(minutes=self._next_id) if seeded else datetime.now(timezone.utc))
+        self._next_id += 1
+        record = {
+            "id": record_id,
+            "properties": {
+                **{key: str(value) if value is not None else None for key, value in properties.items()},
+                "hs_object_id": record_id,
+                "createdate": created,
+                last_modified_property(object_type): created,
+            },
+            "createdAt": created,
+            "updatedAt": created,
+            "archived": False,
+        }
+        self.objects.setdefault(object_type, {})[record_id] = record
+        return record
+
+    def _update(self, object_type: str, record: dict[str, Any], properties: dict[str, Any]) -> dict[str, Any]:
+        now = _iso(datetime.now(timezone.utc))
+        record["properties"].update({key: str(value) for key, value in properties.items()})
+        record["properties"][last_modified_property(object_type)] = now
+        record["updatedAt"] = now
+        return record
+
+    @staticmethod
+    def _project(record: dict[str, Any], properties: Optional[List[str]]) -> dict[str, Any]:
+        if not properties:
+            return record
+        keep = set(properties) | {"hs_object_id", "createdate", "lastmodifieddate", "hs_lastmodifieddate"}
+        return {**record, "properties": {key: value for key, value in record["properties"].items() if key in keep}}
+
+    def _throttle(self) -> Optional[tuple[int, Any, dict[str, str]]]:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.interval:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            over_limit = self.max_requests is not None and self._window_count > self.max_requests
+            injected = self.throttle_rate > 0 and self._random.random() < self.throttle_rate
+            if not (over_limit or injected):
+                return None
+            self.throttled += 1
+        headers = {}
+        if self.retry_after is not None:
+            headers["Retry-After"] = str(self.retry_after)
+        return 429, {
+            "status": "error",
+            "message": "You have reached your ten_secondly_rolling limit.",
+            "errorType": "RATE_LIMIT",
+            "policyName": "TEN_SECONDLY_ROLLING",
+        }, headers
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        if self.max_requests is None:
+            return {}
+        return {
+            "X-HubSpot-RateLimit-Max": str(self.max_requests),
+            "X-HubSpot-RateLimit-Interval-Milliseconds": str(int(self.interval * 1000)),
+            "X-HubSpot-RateLimit-Remaining": str(max(0, self.max_requests - self._window_count)),
+        }
+
+    @staticmethod
+    def _error(status: int, message: str, category: str = "VALIDATION_ERROR") -> tuple[int, Any]:
+        return status, {"status": "error", "message": message, "category": category}
+
+    @staticmethod
+    def _page(items: List[Any], after: Optional[str], limit: int) -> tuple[List[Any], dict[str, Any]]:
+        offset = int(after or 0)
+        page = items[offset : offset + limit]
+        body: dict[str, Any] = {}
+        if offset + limit < len(items):
+            body["paging"] = {"next": {"after": str(offset + limit)}}
+        return page, body
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        raw = b"".join(chunks)
+        delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        path = scope["path"]
+        self.requests[(scope["method"], path)] += 1
+        throttled = self._throttle()
+        if throttled is not None:
+            status, body, headers = throttled
+        else:
+            query = {key: values for key, values in parse_qs(scope.get("query_string", b"").decode()).items()}
+            content_type = dict(scope.get("headers") or []).get(b"content-type", b"").decode()
+            if content_type.startswith("multipart/form-data"):
+                payload = self._multipart(content_type, raw)
+            else:
+                try:
+                    payload = json.loads(raw) if raw else None
+                except ValueError:
+                    payload = None
+            status, body = self.handle(scope["method"], path, query, payload)
+            headers = {}
+        headers.update(self._rate_limit_headers())
+        content = b"" if body is None else json.dumps(body).encode()
+        response_headers = [(b"content-type", b"application/json")]
+        response_headers += [(key.lower().encode(), value.encode()) for key, value in headers.items()]
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": content})
+
+    def handle(
+        self, method: str, path: str, query: dict[str, List[str]], payload: Any
+    ) -> tuple[int, Any]:
+        """
+        Route one request, after latency and throttling were applied.
+
+        Args:
+            method (str): HTTP method
+            path (str): URL path
+            query (dict[str, List[str]]): Parsed query string
+            payload (Any): Decoded JSON body, or None
+
+        Returns:
+            tuple[int, Any]: Status code and JSON-serializable body (None for an empty body)
+        """
+        parts = path.strip("/").split("/")
+        if parts[:3] == ["crm", "v3", "objects"] and len(parts) >= 4:
+            return self._objects(method, parts[3], parts[4:], query, payload or {})
+        if parts[:3] == ["crm", "v3", "associations"] and len(parts) == 6 and parts[5] == "types" and method == "GET":
+            association_type = ASSOCIATION_TYPES.get((parts[3], parts[4]))
+            results = [{"id": str(association_type[0]), "name": association_type[1]}] if association_type else []
+            return 200, {"results": results}
+        if parts[:3] == ["crm", "v4", "associations"] and parts[5:] == ["batch", "read"] and method == "POST":
+            return self._read_associations(parts[3], parts[4], payload or {})
+        if parts[:3] == ["crm", "v3", "properties"] and len(parts) == 4 and method == "GET":
+            properties = PROPERTIES.get(parts[3], []) + [("hs_object_id", "Record ID", "number")]
+            return 200, {"results": [{"name": name, "label": label, "type": kind} for name, label, kind in properties]}
+        if parts[:3] == ["marketing", "v3", "campaigns"] and method == "GET":
+            return self._campaigns(parts[3:], query)
+        if parts[:4] == ["marketing", "v3", "emails", "statistics"] and len(parts) == 5 and method == "GET":
+            return self._email_statistics(parts[4], query)
+        if parts[:3] == ["crm", "v3", "timeline"]:
+            return self._timeline(method, parts[3:], payload)
+        if parts[:3] == ["crm", "v3", "imports"]:
+            return self._imports(method, parts[3:], query, payload)
+        if parts[:3] == ["crm", "v3", "lists"] and len(parts) >= 5 and parts[4] == "memberships":
+            return self._memberships(method, parts[3], parts[5:], query, payload)
+        return self._error(404, f"No route for {method} {path}", "OBJECT_NOT_FOUND")
+
+    def _objects(
+        self, method: str, object_type: str, rest: List[str], query: dict[str, List[str]], payload: Any
+    ) -> tuple[int, Any]:
+        store = self.objects.setdefault(object_type, {})
+        properties = [name for value in query.get("properties", []) for name in value.split(",")]
+        if not rest:
+            if method == "GET":
+                limit = min(int(query.get("limit", ["10"])[0]), 100)
+                records = [record for record in store.values() if not record["archived"]]
+                page, body = self._page(records, query.get("after", [None])[0], limit)
+                return 200, {"results": [self._project(record, properties) for record in page], **body}
+            if method == "POST":
+                return 201, self._add(object_type, payload.get("properties") or {}, seeded=False)
+        elif rest == ["search"] and method == "POST":
+            return self._search(store, payload)
+        elif rest[0] == "batch" and len(rest) == 2 and method == "POST":
+            return self._batch(object_type, store, rest[1], payload)
+        elif len(rest) == 1:
+            record = store.get(rest[0])
+            if record is None or record["archived"]:
+                return self._error(404, "Object not found.  objectId are usually numeric.", "OBJECT_NOT_FOUND")
+            if method == "GET":
+                return 200, self._project(record, properties)
+            if method == "PATCH":
+                return 200, self._update(object_type, record, payload.get("properties") or {})
+            if method == "DELETE":
+                record["archived"] = True
+                return 204, None
+        return self._error(405, "Method not allowed")
+
+    def _search(self, store: dict[str, dict[str, Any]], payload: dict[str, Any]) -> tuple[int, Any]:
+        limit = min(int(payload.get("limit") or 10), 200)
+        offset = int(payload.get("after") or 0)
+        if offset + limit > self.search_window:
+            return self._error(400, f"There was a problem with the request. Search results are limited to {self.search_window} records.")
+        groups = payload.get("filterGroups") or []
+        records = [
+            record
+            for record in store.values()
+            if not record["archived"]
+            and (not groups or any(all(_matches(record, flt) for flt in group.get("filters") or []) for group in groups))
+        ]
+        if payload.get("query"):
+            needle = str(payload["query"]).lower()
+            records = [record for record in records if any(needle in str(value).lower() for value in record["properties"].values())]
+        records.sort(key=lambda record: int(record["id"]))
+        for sort in reversed(payload.get("sorts") or []):
+            if isinstance(sort, str):
+                name, descending = sort.lstrip("-"), sort.startswith("-")
+            else:
+                name, descending = sort.get("propertyName"), sort.get("direction") == "DESCENDING"
+            records.sort(key=lambda record: _comparable(record["properties"].get(name) or ""), reverse=descending)
+        page = records[offset : offset + limit]
+        body: dict[str, Any] = {
+            "total": len(records),
+            "results": [self._project(record, payload.get("properties")) for record in page],
+        }
+        if offset + limit < len(records):
+            body["paging"] = {"next": {"after": str(offset + limit)}}
+        return 200, body
+
+    def _batch(
+        self, object_type: str, store: dict[str, dict[str, Any]], action: str, payload: dict[str, Any]
+    ) -> tuple[int, Any]:
+        inputs = payload.get("inputs") or []
+        if len(inputs) > BATCH_INPUT_LIMIT:
+            return self._error(400, f"Batch size must be at most {BATCH_INPUT_LIMIT}, got {len(inputs)}.")
+        if action == "create":
+            for item in inputs:
+                absent = [name for name in REQUIRED_PROPERTIES.get(object_type, ()) if not (item.get("properties") or {}).get(name)]
+                if absent:
+                    return self._error(400, f"Property values were not valid: {', '.join(absent)} is required.")
+        started = _iso(datetime.now(timezone.utc))
+        results, missing = [], []
+        for item in inputs:
+            if action == "create":
+                record = self._add(object_type, item.get("properties") or {}, seeded=False)
+                if item.get("objectWriteTraceId") is not None:
+                    record = {**record, "objectWriteTraceId": item["objectWriteTraceId"]}
+                results.append(record)
+                continue
+            record = store.get(str(item.get("id")))
+            if record is None or record["archived"]:
+                missing.append(str(item.get("id")))
+            elif action == "read":
+                results.append(self._project(record, payload.get("properties")))
+            elif action == "update":
+                results.append(self._update(object_type, record, item.get("properties") or {}))
+            elif action == "archive":
+                record["archived"] = True
+            else:
+                return self._error(404, f"Unknown batch action {action}", "OBJECT_NOT_FOUND")
+        if action == "archive":
+            return 204, None
+        body: dict[str, Any] = {
+            "status": "COMPLETE",
+            "results": results,
+            "startedAt": started,
+            "completedAt": _iso(datetime.now(timezone.utc)),
+        }
+        if missing:
+            body["numErrors"] = 1
+            body["errors"] = [
+                {
+                    "status": "error",
+                    "category": "OBJECT_NOT_FOUND",
+                    "message": "Could not get some objects, they may be deleted or not exist.",
+                    "context": {"ids": missing},
+                }
+            ]
+            return 207, body
+        return (201 if action == "create" else 200), body
+
+    def _read_associations(self, from_type: str, to_type: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        inputs = payload.get("inputs") or []
+        if len(inputs) > ASSOCIATION_BATCH_LIMIT:
+            return self._error(400, f"Batch size must be at most {ASSOCIATION_BATCH_LIMIT}, got {len(inputs)}.")
+        type_id, _ = ASSOCIATION_TYPES.get((from_type, to_type), (0, None))
+        adjacency = self.associations.get((from_type, to_type), {})
+        results = []
+        for item in inputs:
+            targets = adjacency.get(str(item.get("id")))
+            if targets:
+                offset = int(item.get("after") or 0)
+                result = {
+                    "from": {"id": str(item["id"])},
+                    "to": [
+                        {
+                            "toObjectId": int(target),
+                            "associationTypes": [{"category": "HUBSPOT_DEFINED", "typeId": type_id, "label": None}],
+                        }
+                        for target in targets[offset : offset + ASSOCIATION_PAGE_SIZE]
+                    ],
+                }
+                if offset + ASSOCIATION_PAGE_SIZE < len(targets):
+                    result["paging"] = {"next": {"after": str(offset + ASSOCIATION_PAGE_SIZE), "link": None}}
+                results.append(result)
+        return 200, {"status": "COMPLETE", "results": results}
+
+    @staticmethod
+    def _multipart(content_type: str, raw: bytes) -> dict[str, Any]:
+        message = BytesParser(policy=policy.default).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+        )
+        fields: dict[str, Any] = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            content = part.get_payload(decode=True)
+            fields[name] = content if part.get_filename() else content.decode()
+        return fields
+
+    @staticmethod
+    def campaign_report(index: int, report: str) -> Any:
+        """Deterministic report of the campaign with seed index ``index``; contact reports are contact counts."""
+        if report == "metrics":
+            return {"sessions": 100 + index, "newContactsFirstTouch": index % 7, "influencedContacts": 2 * index}
+        if report == "revenue":
+            return {"revenueAmount": 1_000.0 * index, "dealAmount": 1_500.0 * index, "dealsNumber": index % 5, "currencyCode": "USD"}
+        if report == "budget":
+            return {"budgetItemsSum": 5_000.0, "spendItemsSum": 100.0 * index, "remainingBudget": 5_000.0 - 100.0 * index, "currencyCode": "USD"}
+        return index % 4 * 60
+
+    def _campaigns(self, rest: List[str], query: dict[str, List[str]]) -> tuple[int, Any]:
+        limit = min(int(query.get("limit", ["50"])[0]), 100)
+        after = query.get("after", [None])[0]
+        if not rest:
+            campaigns = [{"id": guid, "properties": campaign["properties"]} for guid, campaign in self.campaigns.items()]
+            page, body = self._page(campaigns, after, limit)
+            return 200, {"results": page, **body}
+        campaign = self.campaigns.get(rest[0])
+        if campaign is None:
+            return self._error(404, f"Campaign {rest[0]} does not exist.", "OBJECT_NOT_FOUND")
+        report = {
+            ("reports", "metrics"): "metrics",
+            ("reports", "revenue"): "revenue",
+            ("budget", "totals"): "budget",
+        }.get(tuple(rest[1:]))
+        if report is not None:
+            return 200, self.campaign_report(campaign["index"], report)
+        if rest[1:3] == ["reports", "contacts"] and len(rest) == 4:
+            contacts = [{"id": str(contact_id)} for contact_id in range(1, self.campaign_report(campaign["index"], "contacts") + 1)]
+            page, body = self._page(contacts, after, limit)
+            return 200, {"results": page, **body}
+        return self._error(404, "No campaign route.", "OBJECT_NOT_FOUND")
+
+    @staticmethod
+    def email_counters(email_id: int, hours: int) -> dict[str, int]:
+        """Deterministic counters of one email over ``hours`` hours."""
+        sent = (10 + email_id % 5) * hours
+        return {
+            "sent": sent,
+            "delivered": sent - hours,
+            "open": (5 + email_id % 3) * hours,
+            "click": (1 + email_id % 2) * hours,
+            "bounce": hours,
+            "unsubscribed": (email_id % 2) * hours,
+        }
+
+    def _email_statistics(self, route: str, query: dict[str, List[str]]) -> tuple[int, Any]:
+        try:
+            start = datetime.fromisoformat(query["startTimestamp"][0].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(query["endTimestamp"][0].replace("Z", "+00:00"))
+        except (KeyError, ValueError):
+            return self._error(400, "startTimestamp and endTimestamp are required ISO 8601 timestamps.")
+        email_ids = [int(email_id) for email_id in query.get("emailIds", [])] or list(DEFAULT_STATISTICS_EMAIL_IDS)
+
+        def counters(low: datetime, high: datetime) -> dict[str, int]:
+            hours = max(0, int((high - low).total_seconds()) // 3_600)
+            totals: Counter = Counter()
+            for email_id in email_ids:
+                totals.update(self.email_counters(email_id, hours))
+            return dict(totals)
+
+        if route == "list":
+            return 200, {"aggregate": {"counters": counters(start, end)}, "emails": email_ids}
+        if route != "histogram":
+            return self._error(404, f"No statistics route {route}.", "OBJECT_NOT_FOUND")
+        step = EMAIL_STATISTICS_INTERVALS.get(query.get("interval", ["DAY"])[0])
+        if step is None:
+            return self._error(400, f"Interval must be one of {', '.join(EMAIL_STATISTICS_INTERVALS)}.")
+        results = []
+        bucket = datetime.fromtimestamp(int(start.timestamp()) // step * step, tz=timezone.utc)
+        while bucket < end:
+            bucket_end = bucket + timedelta(seconds=step)
+            results.append(
+                {
+                    "interval": {"start": _iso(bucket), "end": _iso(bucket_end)},
+                    "aggregations": {"counters": counters(max(start, bucket), min(end, bucket_end))},
+                }
+            )
+            bucket = bucket_end
+        return 200, {"total": len(results), "results": results}
+
+    def _timeline(self, method: str, rest: List[str], payload: Any) -> tuple[int, Any]:
+        if len(rest) == 2 and rest[1] == "event-templates" and method == "GET":
+            return 200, {"results": self.timeline_templates.get(rest[0], [])}
+        if rest == ["events"] and method == "POST":
+            error = self._timeline_error(payload or {})
+            if error:
+                return self._error(400, error)
+            return 201, self._add_timeline_event(payload)
+        if rest == ["events", "batch", "create"] and method == "POST":
+            inputs = (payload or {}).get("inputs") or []
+            if len(inputs) > TIMELINE_BATCH_LIMIT:
+                return self._error(400, f"Batch size must be at most {TIMELINE_BATCH_LIMIT}, got {len(inputs)}.")
+            for event in inputs:
+                error = self._timeline_error(event)
+                if error:
+                    return self._error(400, error)
+            now = _iso(datetime.now(timezone.utc))
+            results = [self._add_timeline_event(event) for event in inputs]
+            return 201, {"status": "COMPLETE", "results": results, "startedAt": now, "completedAt": now}
+        return self._error(404, "No timeline route.", "OBJECT_NOT_FOUND")
+
+    def _timeline_error(self, event: dict[str, Any]) -> Optional[str]:
+        """Reject unknown templates and tokens, and non-numeric number tokens."""
+        templates = {template["id"]: template for templates in self.timeline_templates.values() for template in templates}
+        template = templates.get(str(event.get("eventTemplateId")))
+        if template is None:
+            return f"Event template {event.get('eventTemplateId')} does not exist."
+        tokens = {token["name"]: token for token in template["tokens"]}
+        for name, value in (event.get("tokens") or {}).items():
+            if name not in tokens:
+                return f"Token {name} is not defined by event template {template['id']}."
+            if tokens[name]["type"] == "number":
+                try:
+                    float(value)
+                except (TypeError, ValueError):
+                    return f"Token {name} must be a number."
+        return None
+
+    def _add_timeline_event(self, event: dict[str, Any]) -> dict[str, Any]:
+        stored = {**event, "id": event.get("id") or f"event-{len(self.timeline_events) + 1}"}
+        stored.setdefault("timestamp", _iso(datetime.now(timezone.utc)))
+        self.timeline_events.append(stored)
+        return stored
+
+    def _import_job(self, import_id: str) -> dict[str, Any]:
+        job = self.imports[import_id]
+        if job["state"] == "PROCESSING" and time.monotonic() >= job["_done_at"]:
+            job["state"] = "DONE"
+            job["updatedAt"] = _iso(datetime.now(timezone.utc))
+        return {key: value for key, value in job.items() if not key.startswith("_")}
+
+    def _imports(
+        self, method: str, rest: List[str], query: dict[str, List[str]], payload: Any
+    ) -> tuple[int, Any]:
+        if not rest and method == "POST":
+            return self._create_import(payload or {})
+        if not rest and method == "GET":
+            # Like HubSpot, the listing only returns imports that are still running
+            jobs = [self._import_job(import_id) for import_id in self.imports]
+            active = [job for job in jobs if job["state"] not in ("DONE", "FAILED", "CANCELED", "REVERTED")]
+            limit = min(int(query.get("limit", ["100"])[0]), 100)
+            page, body = self._page(active, query.get("after", [None])[0], limit)
+            return 200, {"results": page, **body}
+        if not rest or rest[0] not in self.imports:
+            return self._error(404, "Import not found.", "OBJECT_NOT_FOUND")
+        import_id = rest[0]
+        if rest[1:] == [] and method == "GET":
+            return 200, self._import_job(import_id)
+        if rest[1:] == ["cancel"] and method == "POST":
+            self.imports[import_id]["state"] = "CANCELED"
+            return 200, self._import_job(import_id)
+        if rest[1:] == ["errors"] and method == "GET":
+            limit = min(int(query.get("limit", ["100"])[0]), 100)
+            page, body = self._page(self.import_errors[import_id], query.get("after", [None])[0], limit)
+            return 200, {"results": page, **body}
+        return self._error(405, "Method not allowed")
+
+    def _create_import(self, fields: dict[str, Any]) -> tuple[int, Any]:
+        """Create the records of a CSV import right away; invalid emails are reported as import errors."""
+        try:
+            request = json.loads(fields["importRequest"])
+            page = request["files"][0]["fileImportPage"]
+            content = fields["files"].decode("utf-8")
+        except (KeyError, IndexError, ValueError, AttributeError):
+            return self._error(400, "Invalid import request.")
+        mappings = {mapping["columnName"]: mapping for mapping in page.get("columnMappings") or []}
+        import_id = str(len(self.imports) + 1)
+        errors, created, rows = [], 0, 0
+        for line_number, row in enumerate(csv.DictReader(io.StringIO(content)), start=2):
+            rows += 1
+            by_type: dict[str, dict[str, Any]] = {}
+            for column, value in row.items():
+                mapping = mappings.get(column)
+                if mapping is None:
+                    continue
+                by_type.setdefault(mapping["columnObjectTypeId"], {})[mapping["propertyName"]] = value
+            email = next((props.get("email") for props in by_type.values() if "email" in props), None)
+            if email is not None and "@" not in email:
+                errors.append(
+                    {
+                        "id": str(len(errors) + 1),
+                        "errorType": "INVALID_EMAIL",
+                        "invalidValue": email,
+                        "sourceData": {"lineNumber": line_number, "rowData": list(row.values())},
+                    }
+                )
+                continue
+            for type_id, properties in by_type.items():
+                self._add(IMPORT_OBJECT_TYPES.get(type_id, type_id), properties, seeded=False)
+                created += 1
+        now = _iso(datetime.now(timezone.utc))
+        self.imports[import_id] = {
+            "id": import_id,
+            "state": "PROCESSING" if self.import_duration > 0 else "DONE",
+            "importRequestJson": request,
+            "metadata": {"counters": {"TOTAL_ROWS": rows, "CREATED_OBJECTS": created, "ERRORS": len(errors)}},
+            "createdAt": now,
+            "updatedAt": now,
+            "_done_at": time.monotonic() + self.import_duration,
+        }
+        self.import_errors[import_id] = errors
+        return 200, self._import_job(import_id)
+
+    def _memberships(
+        self, method: str, list_id: str, rest: List[str], query: dict[str, List[str]], payload: Any
+    ) -> tuple[int, Any]:
+        members = self.lists.get(list_id)
+        if members is None:
+            return self._error(404, f"List {list_id} does not exist.", "OBJECT_NOT_FOUND")
+        if method == "GET" and not rest:
+            limit = min(int(query.get("limit", ["100"])[0]), 250)
+            page, body = self._page(members, query.get("after", [None])[0], limit)
+            results = [{"recordId": record_id, "membershipTimestamp": _iso(_EPOCH)} for record_id in page]
+            return 200, {"results": results, **body}
+        if method == "PUT" and rest in (["add"], ["remove"]):
+            requested = [str(record_id) for record_id in payload or []]
+            current = set(members)
+            if rest == ["add"]:
+                added = [record_id for record_id in requested if record_id not in current]
+                self.lists[list_id] = sorted(current | set(added), key=int)
+                return 200, {"recordIdsAdded": added, "recordIdsMissing": []}
+            removed = [record_id for record_id in requested if record_id in current]
+            self.lists[list_id] = [record_id for record_id in members if record_id not in set(removed)]
+            return 200, {
+                "recordIdsRemoved": removed,
+                "recordIdsMissing": [record_id for record_id in requested if record_id not in current],
+            }
+        return self._error(405, "Method not allowed")
+
+    @contextlib.contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """
+        Run the mock on a local socket with uvicorn for the duration of the ``with`` block.
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 for any free port
+
+        Returns:
+            Iterator[str]: Context manager yielding the base URL, e.g. ``http://127.0.0.1:54321``, to set as ``app.base_url``
+        """
+        import uvicorn
+
+        server = uvicorn.Server(uvicorn.Config(self, host=host, port=port, log_level="warning", lifespan="off"))
+        thread = threading.Thread(target=server.run, name="hubspot-mock-server", daemon=True)
+        thread.start()
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("Mock HubSpot server failed to start.")
+            time.sleep(0.01)
+        bound_port = server.servers[0].sockets[0].getsockname()[1]
+        try:
+            yield f"http://{host}:{bound_port}"
+        finally:
+            server.should_exit = True
+            thread.join()
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from mock_server import MockHubspot
+
+
+def post_count(mock, suffix):
+    return sum(count for (method, path), count in mock.requests.items() if method == "POST" and path.endswith(suffix))
+
+
+def test_traversal_takes_one_batched_round_per_hop(make_app):
+    mock = MockHubspot(contacts=300, companies=10, deals=250)
+    app = make_app(mock)
+    deal_ids = [str(record_id) for record_id in range(311, 561)]
+
+    hops = asyncio.run(
+        app.associations.atraverse("deals", deal_ids, ["companies", "contacts"], properties={"contacts": ["email"]})
+    )
+    companies, contacts = hops
+    assert len(companies.ids) == 10
+    assert companies.edges["311"] == ["301"]
+    assert len(contacts.ids) == 300
+    assert contacts.records["1"]["properties"]["email"] == "contact1@example.com"
+    # 250 deals and 10 companies fit into one association read each; 10 + 300 records into 1 + 3 object reads
+    assert post_count(mock, "/batch/read") == 2 + 4
+    types_reads = sum(count for (method, path), count in mock.requests.items() if path.endswith("/types"))
+    assert types_reads == 2
+
+    # Edges and association types are cached
+    asyncio.run(app.associations.atraverse("deals", deal_ids, ["companies", "contacts"], read_records=False))
+    assert post_count(mock, "/associations/deals/companies/batch/read") == 1
+    assert post_count(mock, "/associations/companies/contacts/batch/read") == 1
+    assert sum(count for (method, path), count in mock.requests.items() if path.endswith("/types")) == 2
+
+    # A write involving companies drops the cached edges of that type
+    asyncio.run(app.crm.apatch_company_by_id("301", {"name": "Renamed"}))
+    asyncio.run(app.associations.aneighbors("deals", deal_ids, "companies"))
+    assert post_count(mock, "/associations/deals/companies/batch/read") == 2
+
+
+def test_association_types_filter_and_validate(make_app):
+    mock = MockHubspot(contacts=3, companies=1, deals=2)
+    app = make_app(mock)
+    by_label = asyncio.run(app.associations.aneighbors("deals", ["5", "6"], "contacts", ["deal_to_contact"]))
+    assert by_label == {"5": ["1"], "6": ["2"]}
+    assert asyncio.run(app.associations.aneighbors("deals", ["5"], "contacts", [99])) == {"5": []}
+    with pytest.raises(ValueError):
+        asyncio.run(app.associations.aneighbors("deals", ["5"], "contacts", ["primary"]))
+    with pytest.raises(ValueError):
+        asyncio.run(app.associations.aneighbors("deals", ["5"], "tickets"))
+
+
+def test_records_with_more_than_one_page_of_associations_are_read_completely(make_app):
+    mock = MockHubspot(contacts=1_100, companies=1, deals=0)
+    app = make_app(mock)
+
+    edges = asyncio.run(app.associations.aneighbors("companies", ["1101"], "contacts"))
+    assert edges["1101"] == [str(record_id) for record_id in range(1, 1_101)]
+    # 500 associations per page: the first read and two follow-up pages
+    assert post_count(mock, "/associations/companies/contacts/batch/read") == 3
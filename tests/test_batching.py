@@ -0,0 +1,58 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from universal_mcp_hubspot.batching import arun_batch, chunked, imap_bounded, run_batch
+
+
+def batch_create(request: httpx.Request) -> httpx.Response:
+    inputs = json.loads(request.content)["inputs"]
+    if any(item["properties"].get("email") == "bad" for item in inputs):
+        return httpx.Response(400, json={"message": "invalid"})
+    results = [{"id": item["properties"]["email"]} for item in inputs]
+    return httpx.Response(201, json={"status": "COMPLETE", "results": results})
+
+
+@pytest.fixture
+def app_instance(make_app):
+    return make_app(handler=batch_create)
+
+
+def rows(count):
+    return ({"properties": {"email": str(i)}} for i in range(count))
+
+
+def test_chunked_is_lazy():
+    assert [len(chunk) for chunk in chunked(range(250), 100)] == [100, 100, 50]
+
+
+def test_run_batch_merges_chunks_in_order(app_instance):
+    result = run_batch(app_instance.crm.create_contacts_batch, rows(350))
+    assert [record["id"] for record in result["results"]] == [str(i) for i in range(350)]
+    assert result["numErrors"] == 0
+
+
+def test_run_batch_reports_failed_chunks(app_instance):
+    inputs = list(rows(150)) + [{"properties": {"email": "bad"}}]
+    result = run_batch(app_instance.crm.create_contacts_batch, inputs)
+    assert len(result["results"]) == 100
+    assert result["numErrors"] == 1
+    assert result["errors"][0]["statusCode"] == 400
+
+
+def test_arun_batch(app_instance):
+    result = asyncio.run(arun_batch(app_instance.crm.create_contacts_batch, rows(1000)))
+    assert len(result["results"]) == 1000
+
+
+def test_imap_bounded_refills_a_slot_as_soon_as_one_frees():
+    def work(delay):
+        time.sleep(delay)
+        return delay
+
+    # With fixed waves the slow call would hold back everything queued behind it
+    finished = list(imap_bounded(work, [0.2] + [0.01] * 6, max_concurrency=2))
+    assert finished[-1] == 0.2
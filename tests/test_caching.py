@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from universal_mcp_hubspot.caching import TTLCache
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def app_instance(make_app, requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={"results": [{"name": "email"}]})
+
+    return make_app(handler=handler)
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(ttl=0.05, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+    time.sleep(0.06)
+    assert cache.get("c") is None
+
+
+def test_property_reads_are_cached_across_sync_and_async(app_instance, requests):
+    app_instance.crm.get_properties_by_object_type("contacts")
+    app_instance.crm.get_properties_by_object_type("contacts")
+    asyncio.run(app_instance.crm.aget_properties_by_object_type("contacts"))
+    assert requests == [("GET", "/crm/v3/properties/contacts")]
+
+
+def test_writes_invalidate_matching_scope(app_instance, requests):
+    app_instance.crm.get_properties_by_object_type("contacts")
+    app_instance.crm.get_properties_by_object_type("deals")
+    app_instance.crm.patch_crm_property_by_name("contacts", "email", label="Email")
+    app_instance.crm.get_properties_by_object_type("contacts")
+    app_instance.crm.get_properties_by_object_type("deals")
+    assert requests.count(("GET", "/crm/v3/properties/contacts")) == 2
+    assert requests.count(("GET", "/crm/v3/properties/deals")) == 1
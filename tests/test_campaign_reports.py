@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import pytest
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.campaign_reports import acampaign_reports, campaign_reports
+from universal_mcp_hubspot.retry import RetryPolicy
+
+
+def test_reports_fan_out_over_streamed_campaigns(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0, campaigns=120, latency=0.01)
+    app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+
+    started = time.perf_counter()
+    table = asyncio.run(acampaign_reports(app, startDate="2024-10-01", endDate="2024-12-31", max_concurrency=16))
+    elapsed = time.perf_counter() - started
+
+    assert len(table) == 120 and table.errors == {}
+    assert table.requests == 360
+    # 360 serial requests would take at least 3.6 s at 10 ms each
+    assert elapsed < 1.5
+    first = table.to_records()[0]
+    assert first["name"] == "Campaign 0"
+    assert first["metrics.sessions"] == 100
+    assert first["budget.currencyCode"] == "USD"
+    assert table.totals()["revenue.revenueAmount"] == 1_000.0 * sum(range(120))
+    assert table.column("campaignGuid") == list(mock.campaigns)
+
+
+def test_reports_record_failures_per_campaign(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0, campaigns=3)
+    app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+    guids = list(mock.campaigns) + ["missing-guid"]
+
+    table = asyncio.run(acampaign_reports(app, guids, reports=("budget", "contacts"), contact_types=("influencedContacts",)))
+    assert table.column("contacts.influencedContacts") == [0, 60, 120, None]
+    assert list(table.errors) == ["missing-guid"]
+    assert table.errors["missing-guid"]["budget"]["statusCode"] == 404
+    # The contact report of 120 contacts takes two pages of 100
+    assert mock.requests[("GET", f"/marketing/v3/campaigns/{guids[2]}/reports/contacts/influencedContacts")] == 2
+
+    with pytest.raises(ValueError):
+        asyncio.run(acampaign_reports(app, guids, reports=("metrics", "roi")))
+
+
+def test_sync_reports_over_local_socket(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0, campaigns=30)
+    with mock.serve() as base_url:
+        app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+        app.base_url = base_url
+        table = campaign_reports(app, reports=("metrics", "budget"), max_concurrency=8)
+        missing = campaign_reports(app, ["missing-guid"], reports=("budget",))
+    assert len(table) == 30 and table.errors == {}
+    assert table.requests == 60
+    assert table.column("campaignGuid") == list(mock.campaigns)
+    assert table.column("metrics.sessions") == list(range(100, 130))
+    assert missing.errors["missing-guid"]["budget"]["statusCode"] == 404
@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import httpx
+
+
+def recording_handler(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/batch/read"):
+            ids = [item["id"] for item in json.loads(request.content)["inputs"]]
+            return httpx.Response(200, json={"results": [{"id": i} for i in ids if i != "404"]})
+        if request.url.path.endswith("/404"):
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "single": True})
+
+    return handler
+
+
+def test_concurrent_reads_share_one_batch_request(make_app):
+    requests = []
+    app = make_app(handler=recording_handler(requests), coalesce_reads=True)
+
+    async def read_all():
+        return await asyncio.gather(*(app.crm.aget_contact_by_id(str(i)) for i in range(30)))
+
+    records = asyncio.run(read_all())
+    assert [record["id"] for record in records] == [str(i) for i in range(30)]
+    assert requests == ["/crm/v3/objects/contacts/batch/read"]
+
+
+def test_missing_records_and_associations_use_single_getter(make_app):
+    requests = []
+    app = make_app(handler=recording_handler(requests), coalesce_reads=True)
+
+    async def read():
+        found = await app.crm.aget_deal_by_id("7", associations=["companies"])
+        try:
+            await app.crm.aget_deal_by_id("404")
+        except httpx.HTTPStatusError as exc:
+            return found, exc.response.status_code
+
+    found, status = asyncio.run(read())
+    assert found["single"] is True
+    assert status == 404
+    assert requests[-2:] == ["/crm/v3/objects/deals/batch/read", "/crm/v3/objects/deals/404"]
+
+
+def test_early_flush_cancels_the_window_timer(make_app):
+    requests = []
+    app = make_app(handler=recording_handler(requests), coalesce_reads=True)
+    app.coalescer.window = 0.05
+    app.coalescer.max_batch = 2
+
+    async def read():
+        first = await asyncio.gather(app.crm.aget_contact_by_id("1"), app.crm.aget_contact_by_id("2"))
+        await asyncio.sleep(0.03)
+        # Queued after the early flush, this read must wait out its own full window
+        started = asyncio.get_running_loop().time()
+        third = await app.crm.aget_contact_by_id("3")
+        return first, third, asyncio.get_running_loop().time() - started
+
+    first, third, waited = asyncio.run(read())
+    assert [record["id"] for record in first] == ["1", "2"] and third["id"] == "3"
+    assert waited >= 0.045
+    assert app.coalescer.batches_sent == 2
+
+
+def test_id_property_reads_match_the_requested_property_case_insensitively(make_app):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        payload = json.loads(request.content)
+        # HubSpot returns only the requested properties and stores domains in lower case
+        results = []
+        for n, item in enumerate(payload["inputs"]):
+            values = {"domain": item["id"].lower(), "name": f"Company {n}"}
+            results.append({"id": str(n), "properties": {name: values[name] for name in payload["properties"]}})
+        return httpx.Response(200, json={"results": results})
+
+    app = make_app(handler=handler, coalesce_reads=True)
+
+    async def read_all():
+        return await asyncio.gather(
+            app.crm.aget_company_by_id("Example.com", properties=["name"], idProperty="domain"),
+            app.crm.aget_company_by_id("hubspot.com", properties=["name"], idProperty="domain"),
+        )
+
+    records = asyncio.run(read_all())
+    assert [record["properties"] for record in records] == [{"name": "Company 0"}, {"name": "Company 1"}]
+    assert requests == ["/crm/v3/objects/companies/batch/read"]
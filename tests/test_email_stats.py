@@ -0,0 +1,93 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot import email_stats
+from universal_mcp_hubspot.email_stats import (
+    EmailStatsSeries,
+    aemail_statistics,
+    aemail_statistics_totals,
+    floor_time,
+    shard_ranges,
+)
+
+HISTOGRAM_PATH = "/marketing/v3/emails/statistics/histogram"
+DAY_MS = 86_400_000
+
+
+@pytest.fixture(params=["numpy", "pure_python"])
+def columns_backend(request, monkeypatch):
+    """Run a test once with the NumPy kernels and once with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(email_stats, "_numpy", lambda: None)
+    return request.param
+
+
+def daily_series(days):
+    # 2024-01-01 is a Monday
+    start = 1_704_067_200_000
+    starts = [start + index * DAY_MS for index in range(days)]
+    return EmailStatsSeries(
+        "DAY",
+        starts,
+        [moment + DAY_MS for moment in starts],
+        {"delivered": [100] * days, "open": [index * 10 for index in range(days)]},
+    )
+
+
+def test_buckets_shards_and_rollups(columns_backend):
+    assert floor_time("2024-01-10T15:30:00Z", "WEEK").isoformat() == "2024-01-08T00:00:00+00:00"
+    assert floor_time("2024-05-20T00:00:00Z", "QUARTER").isoformat() == "2024-04-01T00:00:00+00:00"
+    ranges = shard_ranges("2024-01-01T06:00:00Z", "2024-01-11T00:00:00Z", "DAY", 4)
+    assert len(ranges) == 4
+    assert all(low.hour == 0 for low, _ in ranges[1:])
+    assert all(high == low for (_, high), (low, _) in zip(ranges, ranges[1:]))
+
+    weekly = daily_series(14).rollup("WEEK")
+    assert len(weekly) == 2
+    assert list(weekly.column("open")) == [sum(range(7)) * 10, sum(range(7, 14)) * 10]
+    assert list(weekly.rate("open")) == [210 / 700, 700 / 700]
+    assert list(weekly.column("sent")) == [0, 0]
+    assert len(daily_series(14).between("2024-01-03T00:00:00Z", "2024-01-05T00:00:00Z")) == 2
+    assert list(daily_series(3).rate("open")) == [0.0, 0.1, 0.2]
+
+
+def test_rollup_rejects_finer_or_misaligned_intervals():
+    with pytest.raises(ValueError):
+        daily_series(3).rollup("HOUR")
+    with pytest.raises(ValueError):
+        daily_series(14).rollup("WEEK").rollup("MONTH")
+    with pytest.raises(ValueError):
+        daily_series(3).rollup("FORTNIGHT")
+    assert len(daily_series(3).rollup("DAY")) == 3
+
+
+def test_to_numpy_shares_the_columns():
+    numpy = pytest.importorskip("numpy")
+    columns = daily_series(3).to_numpy()
+    assert columns["open"].tolist() == [0, 10, 20]
+    assert columns["start"][0] == numpy.datetime64("2024-01-01T00:00:00", "ms")
+
+
+def test_statistics_fetch_in_shards_and_sum_email_groups(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock)
+    email_ids = list(range(1, 251))
+    start, end = "2024-03-01T00:00:00Z", "2024-03-11T00:00:00Z"
+
+    series = asyncio.run(aemail_statistics(app, start, end, "DAY", emailIds=email_ids, shards=4))
+    # 4 time shards for each of the 3 groups of at most 100 email IDs
+    assert mock.requests[("GET", HISTOGRAM_PATH)] == 12
+    assert len(series) == 10 and list(series.starts) == sorted(series.starts)
+
+    expected = Counter()
+    for email_id in email_ids:
+        expected.update(mock.email_counters(email_id, 24))
+    assert series.to_records()[0] == {"start": "2024-03-01T00:00:00.000Z", "end": "2024-03-02T00:00:00.000Z", **expected}
+
+    totals = asyncio.run(aemail_statistics_totals(app, start, end, emailIds=email_ids))
+    assert totals == series.totals()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from universal_mcp_hubspot.imports import ImportBuilder, ImportJob, ImportWatcher, PollSchedule
+from mock_server import MockHubspot
+
+
+def test_import_builder_streams_csv_and_maps_columns(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock)
+    rows = ({"Email": f"person{index}@example.com", "firstname": f"Person {index}"} for index in range(2_000))
+
+    with ImportBuilder(app, "contacts", operation="UPSERT", spool_max_size=4_096) as builder:
+        assert builder.extend(rows) == 2_000
+        assert builder._file._rolled  # spilled to disk past spool_max_size
+        request = asyncio.run(builder.aimport_request())
+        job = asyncio.run(builder.asubmit())
+
+    assert request["importOperations"] == {"0-1": "UPSERT"}
+    assert request["files"][0]["fileImportPage"]["columnMappings"] == [
+        {"columnObjectTypeId": "0-1", "columnName": "Email", "propertyName": "email", "idColumnType": "HUBSPOT_ALTERNATE_ID"},
+        {"columnObjectTypeId": "0-1", "columnName": "firstname", "propertyName": "firstname"},
+    ]
+    assert job["metadata"]["counters"]["CREATED_OBJECTS"] == 2_000
+    assert json.loads(json.dumps(job["importRequestJson"])) == request
+    assert mock.objects["contacts"]["2000"]["properties"]["firstname"] == "Person 1999"
+    # Property metadata is read once and then served from the metadata cache
+    assert mock.requests[("GET", "/crm/v3/properties/contacts")] == 1
+
+
+def test_import_builder_rejects_unknown_columns(make_app):
+    app = make_app(MockHubspot(contacts=0, companies=0, deals=0))
+    with ImportBuilder(app, "contacts") as builder:
+        builder.add({"email": "a@example.com", "favourite colour": "blue"})
+        with pytest.raises(ValueError):
+            asyncio.run(builder.aimport_request())
+        builder.ignore_unknown_columns = True
+        assert len(asyncio.run(builder.aimport_request())["files"][0]["fileImportPage"]["columnMappings"]) == 1
+
+
+def submit_import(app, emails):
+    with ImportBuilder(app, "contacts") as builder:
+        builder.extend({"email": email} for email in emails)
+        return asyncio.run(builder.asubmit())
+
+
+def test_poll_schedule_backs_off_until_progress():
+    schedule = PollSchedule(min_interval=1.0, max_interval=5.0, backoff=2.0)
+    assert [schedule.next(False) for _ in range(4)] == [2.0, 4.0, 5.0, 5.0]
+    assert schedule.next(True) == 1.0
+    assert schedule.next(True, queued=True) == 4.0
+
+
+def test_import_job_waits_and_streams_errors(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0, import_duration=0.05)
+    app = make_app(mock)
+    emails = [f"person{index}@example.com" if index % 3 else f"broken{index}" for index in range(300)]
+    job = ImportJob(app, submit_import(app, emails)["id"])
+
+    final = asyncio.run(job.aresult(timeout=5, schedule=PollSchedule(min_interval=0.01)))
+    assert final["state"] == "DONE" and job.done
+    assert job.counters["ERRORS"] == 100
+
+    async def collect():
+        return [error async for error in job.aerrors()]
+
+    errors = asyncio.run(collect())
+    assert len(errors) == 100
+    assert errors[0]["invalidValue"] == "broken0"
+    assert mock.requests[("GET", f"/crm/v3/imports/{job.id}/errors")] == 1
+
+
+def test_import_watcher_shares_one_listing_per_poll(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0, import_duration=0.1)
+    app = make_app(mock)
+    watcher = ImportWatcher(app, PollSchedule(min_interval=0.02, max_interval=0.05))
+    completed = []
+
+    async def on_complete(job):
+        completed.append(job.id)
+
+    for index in range(12):
+        watcher.watch(submit_import(app, [f"person{index}@example.com"])["id"], on_complete=on_complete)
+
+    jobs = asyncio.run(watcher.run(timeout=5))
+    assert all(job.state == "DONE" for job in jobs)
+    assert sorted(completed, key=int) == [job.id for job in jobs]
+    # One request per poll (a listing, or a single fetch once one job is left),
+    # plus at most one fetch per job after it leaves the listing
+    listings = mock.requests[("GET", "/crm/v3/imports")]
+    fetches = sum(mock.requests[("GET", f"/crm/v3/imports/{job.id}")] for job in jobs)
+    assert listings >= 1
+    assert listings + fetches <= watcher.polls + 12
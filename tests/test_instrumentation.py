@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import pytest
+
+from universal_mcp_hubspot.instrumentation import PrometheusExporter, RequestHook
+from universal_mcp_hubspot.retry import RetryPolicy
+
+RETRY = RetryPolicy(backoff_base=0, jitter=False)
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def on_response(self, event):
+        self.events.append(("response", event))
+
+    def on_error(self, event):
+        self.events.append(("error", event))
+
+
+def test_events_carry_tool_endpoint_template_and_retries(make_app):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"id": "101"})
+
+    hook = RecordingHook()
+    app = make_app(handler=handler, retry_policy=RETRY)
+    app.crm.add_request_hook(hook)
+    app.crm.get_contact_by_id("101")
+
+    kind, event = hook.events[0]
+    assert kind == "response"
+    assert event.tool == "get_contact_by_id"
+    assert event.method == "GET"
+    assert event.endpoint == "/crm/v3/objects/contacts/{contactId}"
+    assert event.status == 200
+    assert event.retries == 1
+    assert event.bytes_in == len(b'{"id":"101"}')
+    assert event.latency >= 0
+
+
+def test_async_twin_and_transport_error_are_reported(make_app):
+    def handler(request):
+        raise httpx.ConnectError("down", request=request)
+
+    hook = RecordingHook()
+    app = make_app(handler=handler, retry_policy=RETRY, request_hooks=[hook])
+    app.retry_policy.max_attempts = 1
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(app.crm.adelete_contact_by_id("7"))
+
+    kind, event = hook.events[0]
+    assert kind == "error"
+    assert event.tool == "delete_contact_by_id"
+    assert event.endpoint == "/crm/v3/objects/contacts/{contactId}"
+    assert isinstance(event.error, httpx.ConnectError)
+
+
+def test_prometheus_exporter_renders_counters_and_histogram(make_app):
+    exporter = PrometheusExporter(buckets=(0.5, 5))
+    app = make_app(handler=lambda request: httpx.Response(200, json={"results": []}), retry_policy=RETRY, request_hooks=[exporter])
+    app.crm.get_contact_by_id("1")
+    app.crm.get_contact_by_id("2")
+
+    text = exporter.render()
+    labels = 'tool="get_contact_by_id",method="GET",endpoint="/crm/v3/objects/contacts/{contactId}"'
+    assert f'hubspot_requests_total{{{labels},status="200"}} 2' in text
+    assert f'hubspot_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"hubspot_request_duration_seconds_count{{{labels}}} 2" in text
+    assert "# TYPE hubspot_retries_total counter" in text
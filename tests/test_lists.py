@@ -0,0 +1,42 @@
+import asyncio
+
+from universal_mcp_hubspot.lists import areconcile_list, compact_ids, diff_ids, reconcile_list
+from mock_server import MockHubspot
+
+
+def test_compact_ids_and_diff():
+    assert list(compact_ids(["5", 3, 5, "1"])) == [1, 3, 5]
+    to_add, to_remove = diff_ids(compact_ids([1, 2, 3, 7]), compact_ids([2, 3, 4, 9]))
+    assert (list(to_add), list(to_remove)) == ([4, 9], [1, 7])
+
+
+def test_reconcile_list_sends_only_the_delta(make_app):
+    mock = MockHubspot(contacts=1_500, companies=0, deals=0, list_size=1_000)
+    app = make_app(mock)
+    desired = [str(record_id) for record_id in range(1_500, 250, -1)]
+
+    dry = asyncio.run(areconcile_list(app, "1", desired, dry_run=True))
+    assert (len(dry.to_add), len(dry.to_remove), dry.unchanged) == (500, 250, 750)
+    assert not any(method == "PUT" for method, _ in mock.requests)
+
+    result = asyncio.run(areconcile_list(app, "1", desired, chunk_size=100, max_concurrency=3))
+    assert (result.added, result.removed, result.errors) == (500, 250, [])
+    assert mock.requests[("PUT", "/crm/v3/lists/1/memberships/add")] == 5
+    assert mock.requests[("PUT", "/crm/v3/lists/1/memberships/remove")] == 3
+    assert mock.lists["1"] == [str(record_id) for record_id in range(251, 1_501)]
+
+    again = asyncio.run(areconcile_list(app, "1", desired))
+    assert (len(again.to_add), len(again.to_remove), again.unchanged) == (0, 0, 1_250)
+
+
+def test_reconcile_list_over_local_socket(make_app):
+    mock = MockHubspot(contacts=300, companies=0, deals=0, list_size=200)
+    desired = [str(record_id) for record_id in range(101, 301)]
+    with mock.serve() as base_url:
+        app = make_app(mock)
+        app.base_url = base_url
+        result = reconcile_list(app, "1", desired, chunk_size=40, max_concurrency=2)
+    assert (result.added, result.removed, result.unchanged, result.errors) == (100, 100, 100, [])
+    assert mock.requests[("PUT", "/crm/v3/lists/1/memberships/add")] == 3
+    assert mock.requests[("PUT", "/crm/v3/lists/1/memberships/remove")] == 3
+    assert mock.lists["1"] == desired
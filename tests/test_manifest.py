@@ -0,0 +1,43 @@
+import asyncio
+
+import httpx
+from universal_mcp.tools.manager import ToolManager
+from universal_mcp.tools.tools import Tool
+
+from universal_mcp_hubspot.app import HubspotApp
+from universal_mcp_hubspot.manifest import LazyTool, ManifestToolManager, load_manifest
+
+
+def test_committed_manifest_is_up_to_date():
+    manifest = load_manifest()
+    assert manifest is not None, "Regenerate with: python -m universal_mcp_hubspot.manifest"
+    app = HubspotApp()
+    assert [entry["name"] for entry in manifest["tools"]] == [tool.__name__ for tool in app.list_tools()]
+    entry = next(entry for entry in manifest["tools"] if entry["name"] == "search_deals")
+    assert entry["segment"] == "crm"
+    assert entry["parameters"] == Tool.from_function(app.crm.search_deals).parameters
+
+
+def test_lazy_tools_bind_on_first_call(make_app):
+    app = make_app(handler=lambda request: httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]}), async_tools=True)
+    manager = ManifestToolManager()
+    manager.register_tools_from_app(app, tags=["all"])
+
+    tool = manager.get_tool("hubspot_get_contact_by_id")
+    assert isinstance(tool, LazyTool)
+    assert tool.fn_metadata is None
+    assert "hubspot" in tool.tags
+
+    result = asyncio.run(manager.call_tool("hubspot_get_contact_by_id", {"contactId": "101"}))
+    assert result == {"id": "101"}
+    assert tool.fn.__name__ == "get_contact_by_id"
+    assert tool.is_async
+
+
+def test_manifest_filtering_matches_the_eager_tool_manager():
+    app = HubspotApp()
+    for kwargs in ({}, {"tags": ["all"]}, {"tags": ["CRM", "nonexistent"]}, {"tool_names": ["Deal"]}):
+        lazy, eager = ManifestToolManager(), ToolManager()
+        lazy.register_tools_from_app(app, **kwargs)
+        eager.register_tools_from_app(app, **kwargs)
+        assert sorted(tool.name for tool in lazy.list_tools()) == sorted(tool.name for tool in eager.list_tools())
@@ -0,0 +1,97 @@
+import asyncio
+
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.mirror import CrmMirror
+
+
+def search(method, **kwargs):
+    arguments = {"limit": 100, "after": None, "sorts": [], "properties": [], "filterGroups": [], **kwargs}
+    return asyncio.run(method(**arguments))
+
+
+def search_requests(mock):
+    return sum(count for (method, path), count in mock.requests.items() if path.endswith("/search"))
+
+
+def test_mirror_answers_searches_like_hubspot(tmp_path, make_app):
+    mock = MockHubspot(contacts=30, companies=5, deals=40)
+    mirror = CrmMirror(str(tmp_path / "mirror.db"))
+    app = make_app(mock, mirror=mirror)
+    assert asyncio.run(mirror.arefresh()) == 75
+
+    queries = [
+        {"filterGroups": [{"filters": [{"propertyName": "dealstage", "operator": "EQ", "value": "closedwon"}]}]},
+        {
+            "filterGroups": [
+                {"filters": [{"propertyName": "amount", "operator": "GTE", "value": "50000"}]},
+                {"filters": [{"propertyName": "dealstage", "operator": "IN", "values": ["closedlost"]}]},
+            ],
+            "sorts": [{"propertyName": "amount", "direction": "DESCENDING"}],
+            "properties": ["amount", "dealstage"],
+        },
+        # Text matches regardless of case
+        {"filterGroups": [{"filters": [{"propertyName": "dealstage", "operator": "EQ", "value": "ClosedWon"}]}]},
+        {"filterGroups": [{"filters": [{"propertyName": "dealstage", "operator": "NOT_IN", "values": ["CLOSEDLOST", "closedWon"]}]}]},
+    ]
+    for query in queries:
+        local = search(app.crm.asearch_deals, **query)
+        mirror.max_age = -1
+        remote = search(app.crm.asearch_deals, **query)
+        mirror.max_age = 900
+        assert local["total"] == remote["total"]
+        assert [record["id"] for record in local["results"]] == [record["id"] for record in remote["results"]]
+    assert mirror.served == 4
+
+    contact = {"filterGroups": [{"filters": [{"propertyName": "email", "operator": "EQ", "value": "Contact7@Example.com"}]}]}
+    local = search(app.crm.asearch_contacts_post, **contact)
+    mirror.max_age = -1
+    remote = search(app.crm.asearch_contacts_post, **contact)
+    mirror.max_age = 900
+    assert [record["id"] for record in local["results"]] == [record["id"] for record in remote["results"]] == ["7"]
+    assert mirror.served == 5
+
+    # Free-text queries and unmirrored properties go to HubSpot
+    before = search_requests(mock)
+    search(app.crm.asearch_contacts_post, query="First3")
+    search(app.crm.asearch_deals, properties=["hs_forecast_amount"])
+    assert search_requests(mock) == before + 2
+
+
+def test_mirror_tracks_writes_and_reads_by_id(make_app):
+    mock = MockHubspot(contacts=3, companies=0, deals=0)
+    mirror = CrmMirror(":memory:", object_types=["contacts"])
+    app = make_app(mock, mirror=mirror)
+    asyncio.run(mirror.arefresh("contacts"))
+
+    asyncio.run(app.crm.aupdate_contact_by_id("2", {"firstname": "Changed"}))
+    asyncio.run(app.crm.adelete_contact_by_id("3"))
+    reads = mock.requests[("GET", "/crm/v3/objects/contacts/2")]
+    contact = asyncio.run(app.crm.aget_contact_by_id("2", properties=["firstname", "email"]))
+    assert contact["properties"]["firstname"] == "Changed"
+    assert contact["properties"]["email"] == "contact2@example.com"
+    assert mock.requests[("GET", "/crm/v3/objects/contacts/2")] == reads
+    found = search(app.crm.asearch_contacts_post)
+    assert [record["id"] for record in found["results"]] == ["1", "2"]
+
+
+def test_refresh_searches_bypass_the_mirror(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=20)
+    mirror = CrmMirror(":memory:", object_types=["deals"])
+    app = make_app(mock, mirror=mirror)
+    assert asyncio.run(mirror.arefresh()) == 20
+
+    # Changed on HubSpot's side, so the mirror only learns about it by refreshing
+    assert mock.handle("PATCH", "/crm/v3/objects/deals/5", {}, {"properties": {"amount": "1"}})[0] == 200
+    before = search_requests(mock)
+    assert asyncio.run(mirror.arefresh()) == 1
+    assert search_requests(mock) == before + 1
+    assert mirror.served == 0
+    deal = asyncio.run(app.crm.aget_deal_by_id("5", properties=["amount"]))
+    assert deal["properties"]["amount"] == "1"
+
+
+def test_mirror_defaults_to_the_user_cache(cache_home):
+    mirror = CrmMirror(object_types=["contacts"])
+    assert mirror.path == str(cache_home / "universal-mcp-hubspot" / "mirror.db")
+    assert (cache_home / "universal-mcp-hubspot" / "mirror.db").exists()
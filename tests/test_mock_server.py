@@ -0,0 +1,46 @@
+import asyncio
+
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.pagination import paginate
+from universal_mcp_hubspot.retry import RetryPolicy
+
+RETRY = RetryPolicy(backoff_base=0, jitter=False)
+
+
+def test_paginated_reads_over_local_socket(make_app):
+    mock = MockHubspot(contacts=250, list_size=30)
+    with mock.serve() as base_url:
+        app = make_app(mock, retry_policy=RETRY)
+        app.base_url = base_url
+        contacts = list(paginate(app.crm.get_contacts, properties=["email"]))
+        members = list(paginate(app.fetch_list_memberships, listId="1", limit=20))
+        app.close()
+    assert len(contacts) == 250
+    assert set(contacts[0]["properties"]) == {"email", "hs_object_id", "createdate", "lastmodifieddate"}
+    assert [member["recordId"] for member in members] == [str(i) for i in range(1, 31)]
+
+
+def test_search_filters_sorts_and_window(make_app):
+    mock = MockHubspot(contacts=0, deals=50)
+    app = make_app(mock, retry_policy=RETRY)
+    filters = [{"filters": [{"propertyName": "dealstage", "operator": "EQ", "value": "closedwon"}]}]
+    page = asyncio.run(app.crm.asearch_deals(5, "0", ["-amount"], ["amount"], filters))
+    amounts = [int(deal["properties"]["amount"]) for deal in page["results"]]
+    assert page["total"] == 10
+    assert amounts == sorted(amounts, reverse=True)
+    assert page["paging"]["next"]["after"] == "5"
+    assert mock.handle("POST", "/crm/v3/objects/deals/search", {}, {"after": "10000"})[0] == 400
+
+
+def test_batch_limit_writes_and_injected_throttling(make_app):
+    mock = MockHubspot(contacts=0, throttle_rate=0.5, seed=1)
+    app = make_app(mock, retry_policy=RETRY)
+    created = asyncio.run(
+        app.crm.acreate_contacts_batch([{"properties": {"email": f"{i}@example.com"}} for i in range(3)])
+    )
+    assert created["status"] == "COMPLETE"
+    assert mock.throttled == 2
+    assert len(mock.objects["contacts"]) == 3
+    status, _ = mock.handle("POST", "/crm/v3/objects/contacts/batch/create", {}, {"inputs": [{}] * 101})
+    assert status == 400
@@ -0,0 +1,65 @@
+import asyncio
+
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.notes import aadd_notes, add_notes, note_inputs
+from universal_mcp_hubspot.retry import RetryPolicy
+
+
+def test_note_inputs_share_one_default_timestamp():
+    association = [{"to": {"id": "101"}, "types": [{"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 202}]}]
+    inputs = list(note_inputs(["a", {"hs_note_body": "b", "hs_timestamp": "2024-01-01T00:00:00Z"}], association))
+    assert inputs[0]["properties"]["hs_timestamp"] != "2024-01-01T00:00:00Z"
+    assert inputs[1]["properties"]["hs_timestamp"] == "2024-01-01T00:00:00Z"
+    assert [item["objectWriteTraceId"] for item in inputs] == ["0", "1"]
+    assert inputs[1]["associations"] == association
+
+
+def test_bulk_notes_isolate_invalid_items(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+    notes = [f"Call {index}" for index in range(250)]
+    notes[137] = {"hs_note_body": "Broken", "hs_timestamp": ""}
+
+    result = asyncio.run(aadd_notes(app, notes, max_concurrency=2))
+    assert len(result.created) == 249
+    assert list(result.failed) == [137]
+    assert result.failed[137]["statusCode"] == 400
+    assert result.created[200]["properties"]["hs_note_body"] == "Call 200"
+    # 3 chunks, plus halving the failed chunk of 100 down to the single bad note
+    assert result.requests == 3 + 2 * 6
+    assert len(mock.objects["notes"]) == 249
+
+
+def test_bulk_notes_over_local_socket(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    notes = [f"Call {index}" for index in range(120)]
+    notes[7] = {"hs_note_body": "Broken", "hs_timestamp": ""}
+    with mock.serve() as base_url:
+        app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+        app.base_url = base_url
+        result = add_notes(app, notes, batch_size=20, max_concurrency=3)
+    assert (len(result.created), list(result.failed)) == (119, [7])
+    # 6 chunks, plus halving the chunk of 20 with the bad note: 20 -> 10 -> 5 -> 2 -> 1
+    assert result.requests == 6 + 2 * 4
+    assert len(mock.objects["notes"]) == 119
+
+
+def test_notes_without_a_body_fail_without_losing_earlier_chunks(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock)
+    notes = [f"Call {index}" for index in range(500)]
+    notes[450] = {"hs_timestamp": "2024-01-01T00:00:00Z"}
+
+    result = asyncio.run(aadd_notes(app, notes, max_concurrency=2))
+    assert (len(result.created), list(result.failed)) == (499, [450])
+    assert result.failed[450]["category"] == "VALIDATION_ERROR"
+    assert result.failed[450]["statusCode"] is None
+    assert result.created[499]["properties"]["hs_note_body"] == "Call 499"
+    assert result.requests == 5
+
+    with mock.serve() as base_url:
+        app.base_url = base_url
+        result = add_notes(app, notes, max_concurrency=2)
+    assert (len(result.created), list(result.failed)) == (499, [450])
+    assert len(mock.objects["notes"]) == 998
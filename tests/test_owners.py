@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_hubspot.app import HubspotApp
+
+
+def test_owner_directory_indexes_all_pages():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        if request.url.params["archived"] == "true":
+            return httpx.Response(200, json={"results": [{"id": "3", "email": "old@example.com"}]})
+        if "after" not in request.url.params:
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"id": "1", "email": "Ann@Example.com", "firstName": "Ann", "userId": 11}],
+                    "paging": {"next": {"after": "1"}},
+                },
+            )
+        return httpx.Response(200, json={"results": [{"id": "2", "email": "bob@example.com"}]})
+
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = HubspotApp(
+        integration=mock_integration,
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    deals = [{"properties": {"hubspot_owner_id": owner}} for owner in ("1", "2", "3", None)]
+    enriched = list(app.owners.enrich(deals))
+
+    assert [deal["owner"] and deal["owner"]["id"] for deal in enriched] == ["1", "2", "3", None]
+    assert app.owners.name(1) == "Ann"
+    assert app.owners.name("2") == "bob@example.com"
+    assert app.owners.by_email("ann@example.com")["id"] == "1"
+    assert app.owners.by_user_id(11)["id"] == "1"
+    assert len(requests) == 3
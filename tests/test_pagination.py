@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+import pytest
+
+from universal_mcp_hubspot.pagination import apaginate, paginate
+
+
+def contacts_pages(request: httpx.Request) -> httpx.Response:
+    after = int(request.url.params.get("after", 0))
+    limit = int(request.url.params["limit"])
+    ids = range(after, min(after + limit, 250))
+    body = {"results": [{"id": str(i)} for i in ids]}
+    if after + limit < 250:
+        body["paging"] = {"next": {"after": str(after + limit)}}
+    return httpx.Response(200, json=body)
+
+
+@pytest.fixture
+def app_instance(make_app):
+    return make_app(handler=contacts_pages)
+
+
+def test_paginate_follows_cursor(app_instance):
+    ids = [record["id"] for record in paginate(app_instance.crm.get_contacts)]
+    assert ids == [str(i) for i in range(250)]
+
+
+def test_paginate_honours_max_records(app_instance):
+    records = list(paginate(app_instance.crm.get_contacts, max_records=130))
+    assert len(records) == 130
+
+
+def test_apaginate_uses_async_twin(app_instance):
+    async def collect():
+        return [record async for record in apaginate(app_instance.crm.get_contacts, max_records=42)]
+
+    assert len(asyncio.run(collect())) == 42
@@ -0,0 +1,44 @@
+import httpx
+import pytest
+
+PIPELINES = {
+    "results": [
+        {
+            "id": "default",
+            "label": "Sales Pipeline",
+            "stages": [{"id": "closedwon", "label": "Closed Won"}],
+        }
+    ]
+}
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def app_instance(make_app, requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json=PIPELINES)
+
+    return make_app(handler=handler)
+
+
+def test_labels_resolve_from_one_load(app_instance, requests):
+    assert app_instance.pipelines.pipeline_label("deals", "default") == "Sales Pipeline"
+    assert app_instance.pipelines.stage_label("deals", "closedwon") == "Closed Won"
+    assert app_instance.pipelines.stage_label("deals", "closedwon", "default") == "Closed Won"
+    assert app_instance.pipelines.stage_label("deals", "missing") is None
+    assert requests == [("GET", "/crm/v3/pipelines/deals")]
+
+
+def test_pipeline_writes_invalidate_the_object_type(app_instance, requests):
+    app_instance.pipelines.load("deals")
+    app_instance.pipelines.load("tickets")
+    app_instance.crm.delete_pipeline_stage_by_id("deals", "default", "closedwon")
+    app_instance.pipelines.load("deals")
+    app_instance.pipelines.load("tickets")
+    assert requests.count(("GET", "/crm/v3/pipelines/deals")) == 2
+    assert requests.count(("GET", "/crm/v3/pipelines/tickets")) == 1
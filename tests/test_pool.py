@@ -0,0 +1,28 @@
+import pytest
+
+from universal_mcp_hubspot.pool import PoolConfig
+
+
+def test_pool_config_applies_to_both_clients(make_app):
+    pytest.importorskip("h2")
+    app = make_app(pool=PoolConfig(max_connections=7, keepalive_expiry=5, http2=True))
+    for client in (app.client, app.async_client):
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._keepalive_expiry == 5
+        assert pool._http2 is True
+
+
+def test_verb_timeouts_are_set_per_request(make_app):
+    app = make_app(pool=PoolConfig(timeout=60, verb_timeouts={"get": 5}))
+    get = app._build_request("GET", "https://api.hubapi.com/crm/v3/owners")
+    post = app._build_request("POST", "https://api.hubapi.com/crm/v3/objects/notes", data={})
+    assert get.extensions["timeout"]["read"] == 5
+    assert post.extensions["timeout"]["read"] == 60
+
+
+def test_pool_stats_before_and_after_client_creation(make_app):
+    app = make_app()
+    assert app.pool_stats["sync"]["connections"] == 0
+    app.client
+    assert app.pool_stats["async"] == {"connections": 0, "active": 0, "idle": 0, "http2": 0, "queued": 0}
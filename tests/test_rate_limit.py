@@ -0,0 +1,34 @@
+from universal_mcp_hubspot.rate_limit import RateLimiter, TokenBucket
+
+
+def test_bucket_reserves_until_empty():
+    bucket = TokenBucket(capacity=2, interval=10)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 4.9 < bucket.reserve() <= 5.0
+
+
+def test_limiter_adopts_hubspot_headers():
+    limiter = RateLimiter()
+    limiter.update(
+        200,
+        {
+            "X-HubSpot-RateLimit-Max": "190",
+            "X-HubSpot-RateLimit-Interval-Milliseconds": "10000",
+            "X-HubSpot-RateLimit-Remaining": "3",
+            "X-HubSpot-RateLimit-Daily": "1000000",
+            "X-HubSpot-RateLimit-Daily-Remaining": "999000",
+        },
+    )
+    budget = limiter.budget()
+    assert budget["max_requests"] == 190
+    assert budget["interval_remaining"] == 3
+    assert budget["available"] < 4
+    assert budget["daily_remaining"] == 999000
+
+
+def test_limiter_drains_on_429():
+    limiter = RateLimiter()
+    limiter.update(429, {})
+    assert limiter.budget()["throttled"] == 1
+    assert limiter.burst.reserve() > 0
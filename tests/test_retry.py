@@ -0,0 +1,50 @@
+import httpx
+import pytest
+
+from universal_mcp_hubspot.retry import RetryPolicy, parse_retry_after
+
+
+def flaky(statuses):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, headers={"Retry-After": "0"}, json={"attempt": len(calls)})
+
+    return handler, calls
+
+
+def test_get_is_retried_on_5xx(make_app):
+    handler, calls = flaky([503, 502, 200])
+    app = make_app(handler=handler, retry_policy=RetryPolicy(backoff_base=0))
+    assert app.crm.get_contact_by_id("1") == {"attempt": 3}
+    assert len(calls) == 3
+
+
+def test_create_is_not_replayed_on_5xx(make_app):
+    handler, calls = flaky([500, 200])
+    app = make_app(handler=handler, retry_policy=RetryPolicy(backoff_base=0))
+    with pytest.raises(httpx.HTTPStatusError):
+        app.crm.create_contact(associations=[], properties={"email": "me@example.com"})
+    assert len(calls) == 1
+
+
+def test_create_is_retried_when_throttled(make_app):
+    handler, calls = flaky([429, 200])
+    app = make_app(handler=handler, retry_policy=RetryPolicy(backoff_base=0))
+    assert app.crm.create_contact(associations=[], properties={"email": "me@example.com"}) == {"attempt": 2}
+
+
+def test_search_post_counts_as_idempotent(make_app):
+    handler, calls = flaky([504, 200])
+    app = make_app(handler=handler, retry_policy=RetryPolicy(backoff_base=0))
+    assert app.crm.search_deals(
+        limit=10, after="0", sorts=[], properties=[], filterGroups=[]
+    ) == {"attempt": 2}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.search import SearchPartitioner, asearch_all, search_all
+
+
+async def collect(iterator):
+    return [record async for record in iterator]
+
+
+def test_search_splits_windows_by_object_id(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=230, search_window=50)
+    app = make_app(mock)
+    filters = [{"filters": [{"propertyName": "pipeline", "operator": "EQ", "value": "default"}]}]
+    deals = asyncio.run(collect(asearch_all(app.crm.search_deals, filters, properties=["amount"], page_size=20, window=50)))
+    assert [deal["id"] for deal in deals] == [str(i) for i in range(1, 231)]
+    searches = mock.requests[("POST", "/crm/v3/objects/deals/search")]
+    # Two pages of 20 fit a 50-result window, so each of the 6 windows covers 40 deals
+    assert searches == 12
+
+
+def test_search_by_lastmodifieddate_deduplicates_ties(make_app):
+    mock = MockHubspot(contacts=90, deals=0, search_window=20)
+    for index, contact in enumerate(mock.objects["contacts"].values()):
+        contact["properties"]["lastmodifieddate"] = f"2024-02-01T00:00:{index // 4:02d}.000Z"
+    app = make_app(mock)
+    contacts = asyncio.run(
+        collect(asearch_all(app.crm.search_contacts_post, partition_by="lastmodifieddate", page_size=10, window=20))
+    )
+    assert sorted(int(contact["id"]) for contact in contacts) == list(range(1, 91))
+
+
+def test_partitioner_rejects_unsplittable_ties():
+    partitioner = SearchPartitioner(partition_by="lastmodifieddate", page_size=2, window=4)
+    page = {
+        "results": [{"id": str(i), "properties": {"lastmodifieddate": "1"}} for i in range(2)],
+        "paging": {"next": {"after": "2"}},
+    }
+    partitioner.advance(page)
+    assert partitioner.request_kwargs()["after"] == "2"
+    partitioner.advance({**page, "results": [{"id": str(i), "properties": {"lastmodifieddate": "1"}} for i in range(2, 4)]})
+    assert partitioner.request_kwargs()["filterGroups"] == [
+        {"filters": [{"propertyName": "lastmodifieddate", "operator": "GTE", "value": "1"}]}
+    ]
+    # The next window starts at the shared value again and fills up without making progress
+    partitioner.advance({**page, "results": [{"id": str(i), "properties": {"lastmodifieddate": "1"}} for i in range(2)]})
+    with pytest.raises(RuntimeError):
+        partitioner.advance({**page, "results": [{"id": str(i), "properties": {"lastmodifieddate": "1"}} for i in range(2, 4)]})
+
+
+def test_sync_search_respects_max_records():
+    mock = MockHubspot(contacts=0, deals=30)
+    pages = []
+
+    def method(**kwargs):
+        status, body = mock.handle("POST", "/crm/v3/objects/deals/search", {}, kwargs)
+        pages.append(kwargs)
+        return body
+
+    deals = list(search_all(method, page_size=10, max_records=15))
+    assert len(deals) == 15
+    assert len(pages) == 2
@@ -0,0 +1,86 @@
+import asyncio
+
+from mock_server import MockHubspot
+
+from universal_mcp_hubspot.search import to_filter_value
+from universal_mcp_hubspot.sync import IncrementalSync, SQLiteWatermarkStore
+
+
+async def collect(iterator):
+    return [change_set async for change_set in iterator]
+
+
+def test_incremental_sync_yields_only_changes(tmp_path, make_app):
+    mock = MockHubspot(contacts=25, companies=0, deals=5)
+    app = make_app(mock)
+    store = SQLiteWatermarkStore(str(tmp_path / "sync.db"))
+    sync = IncrementalSync(app, store=store, object_types=["contacts", "deals"], change_set_size=10)
+
+    initial = asyncio.run(collect(sync.arun()))
+    assert [(change.object_type, len(change)) for change in initial] == [
+        ("contacts", 10), ("contacts", 10), ("contacts", 5), ("deals", 5)
+    ]
+    assert sync.watermark("contacts") == initial[2].watermark
+    assert asyncio.run(collect(sync.arun())) == []
+
+    asyncio.run(app.crm.aupdate_contact_by_id("3", {"firstname": "Changed"}))
+    asyncio.run(app.crm.acreate_contact([], {"email": "new@example.com"}))
+    [change] = asyncio.run(collect(sync.achanges("contacts")))
+    assert [record["id"] for record in change.updated] == ["3"]
+    assert [record["properties"]["email"] for record in change.created] == ["new@example.com"]
+
+    # Watermarks survive a new store on the same file
+    reopened = IncrementalSync(app, store=SQLiteWatermarkStore(str(tmp_path / "sync.db")))
+    assert reopened.watermark("contacts") == sync.watermark("contacts")
+
+
+
+def test_default_store_keeps_watermarks_in_the_user_cache(cache_home, make_app):
+    app = make_app(MockHubspot(contacts=5, companies=0, deals=0))
+    sync = IncrementalSync(app, object_types=["contacts"])
+    assert sum(len(change) for change in asyncio.run(collect(sync.arun()))) == 5
+
+    assert isinstance(sync.store, SQLiteWatermarkStore)
+    assert sync.store.path == str(cache_home / "universal-mcp-hubspot" / "sync.db")
+    # A later process picks up where this one stopped
+    assert asyncio.run(collect(IncrementalSync(app, object_types=["contacts"]).arun())) == []
+
+def test_watermark_is_committed_only_after_consumption(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=6)
+    app = make_app(mock)
+    sync = IncrementalSync(app, store=SQLiteWatermarkStore(":memory:"), change_set_size=3)
+
+    async def first_change_set():
+        iterator = sync.achanges("deals")
+        change_set = await iterator.__anext__()
+        await iterator.aclose()
+        return change_set
+
+    asyncio.run(first_change_set())
+    assert sync.watermark("deals") is None
+    assert sum(len(change) for change in asyncio.run(collect(sync.achanges("deals")))) == 6
+
+
+def test_tied_timestamps_across_a_change_set_boundary_are_not_skipped(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=6)
+    for deal_id in ("2", "3", "4", "5"):
+        mock.objects["deals"][deal_id]["properties"]["hs_lastmodifieddate"] = "2024-01-01T00:03:00.000Z"
+    app = make_app(mock)
+    sync = IncrementalSync(app, change_set_size=3)
+
+    async def consume_first_change_set():
+        iterator = sync.achanges("deals")
+        first = await iterator.__anext__()
+        # Requesting the next change set commits the first one
+        second = await iterator.__anext__()
+        await iterator.aclose()
+        return first, second
+
+    first, second = asyncio.run(consume_first_change_set())
+    assert [record["id"] for record in first.records] == ["1", "2", "3"]
+    # Deal 4 shares the last timestamp of the first change set
+    assert sync.watermark("deals") == first.watermark == to_filter_value("2024-01-01T00:01:00.000Z")
+
+    resumed = asyncio.run(collect(sync.achanges("deals")))
+    assert [record["id"] for change in resumed for record in change.records] == ["2", "3", "4", "5", "6"]
+    assert sync.watermark("deals") == to_filter_value(mock.objects["deals"]["6"]["properties"]["hs_lastmodifieddate"])
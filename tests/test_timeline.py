@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import httpx
+from mock_server import TIMELINE_APP_ID, MockHubspot
+
+from universal_mcp_hubspot.retry import RetryPolicy
+from universal_mcp_hubspot.timeline import (
+    TimelineEventPipeline,
+    aingest_events,
+    ingest_events,
+)
+
+TEMPLATES_PATH = f"/crm/v3/timeline/{TIMELINE_APP_ID}/event-templates"
+
+
+def usage(index, **tokens):
+    return {
+        "eventTemplateId": "1001298",
+        "email": f"person{index}@example.com",
+        "tokens": {"feature": "export", "count": index, "plan": "pro", **tokens},
+    }
+
+
+def test_templates_validate_tokens_locally(make_app):
+    app = make_app(MockHubspot(contacts=0, companies=0, deals=0), retry_policy=RetryPolicy(max_attempts=1))
+    templates = app.timeline_templates
+    asyncio.run(templates.aload(TIMELINE_APP_ID))
+
+    assert templates.validate(TIMELINE_APP_ID, usage(1, usedAt="2024-05-01T10:00:00Z")) == []
+    problems = templates.validate(TIMELINE_APP_ID, usage(1, count="many", plan="gold", colour="red"))
+    assert len(problems) == 3
+    assert templates.validate(TIMELINE_APP_ID, {"eventTemplateId": "1001298", "tokens": {}}) == [
+        "The event needs one of email, utk, objectId."
+    ]
+    assert templates.validate(TIMELINE_APP_ID, {"eventTemplateId": "404"})[0].startswith("Unknown event template")
+    templates.invalidate_path(f"{TEMPLATES_PATH}/1001298/tokens")
+    assert templates.template(TIMELINE_APP_ID, "1001298") is None
+
+
+def test_ingest_sends_full_batches_and_isolates_rejected_events(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+    events = [usage(index) for index in range(1_234)]
+    events[10] = usage(10, plan="gold")
+
+    result = asyncio.run(aingest_events(app, TIMELINE_APP_ID, events, max_concurrency=2))
+    assert result.created == 1_233
+    assert list(result.rejected) == [10] and result.failed == {}
+    assert result.requests == 3
+    assert mock.requests[("GET", TEMPLATES_PATH)] == 1
+    assert len(mock.timeline_events) == 1_233
+
+    # Without local validation, HubSpot's rejection is narrowed down by splitting the batch
+    unchecked = asyncio.run(aingest_events(app, TIMELINE_APP_ID, [usage(0), usage(1, count="many")], validate=False))
+    assert (unchecked.created, list(unchecked.failed)) == (1, [1])
+    assert unchecked.failed[1]["statusCode"] == 400
+
+
+def test_pipeline_flushes_partial_batches_after_the_interval(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+
+    async def run():
+        pipeline = TimelineEventPipeline(app, TIMELINE_APP_ID, batch_size=100, flush_interval=0.02)
+        for index in range(3):
+            await pipeline.add(usage(index))
+        await asyncio.sleep(0.1)
+        sent_before_close = len(mock.timeline_events)
+        return sent_before_close, await pipeline.close()
+
+    sent_before_close, result = asyncio.run(run())
+    assert sent_before_close == 3
+    assert (result.created, result.requests) == (3, 1)
+
+
+def test_sync_ingest_over_local_socket(make_app):
+    mock = MockHubspot(contacts=0, companies=0, deals=0)
+    events = [usage(index) for index in range(1_100)]
+    events[3] = usage(3, colour="red")
+    with mock.serve() as base_url:
+        app = make_app(mock, retry_policy=RetryPolicy(max_attempts=1))
+        app.base_url = base_url
+        result = ingest_events(app, TIMELINE_APP_ID, events, max_concurrency=2)
+    assert (result.created, list(result.rejected), result.failed) == (1_099, [3], {})
+    assert result.requests == 3
+    assert len(mock.timeline_events) == 1_099
+
+
+def test_partial_batch_failures_are_not_blamed_on_single_events(make_app):
+    def handler(request):
+        inputs = json.loads(request.content)["inputs"]
+        results = [{"id": f"event-{index}"} for index in range(len(inputs) - 1)]
+        errors = [{"status": "error", "category": "VALIDATION_ERROR", "message": "One event was invalid."}]
+        return httpx.Response(207, json={"status": "COMPLETE", "results": results, "errors": errors, "numErrors": 1})
+
+    app = make_app(handler=handler)
+    result = ingest_events(app, TIMELINE_APP_ID, [usage(index) for index in range(5)], validate=False)
+    assert (result.created, result.failed, len(result)) == (4, {}, 5)
+    assert result.partial == [
+        {"indexes": [0, 1, 2, 3, 4], "created": 4, "errors": [{"status": "error", "category": "VALIDATION_ERROR", "message": "One event was invalid."}]}
+    ]
@@ -0,0 +1,33 @@
+from universal_mcp_hubspot.app import HubspotApp
+from universal_mcp_hubspot.manifest import ManifestToolManager
+from universal_mcp_hubspot.tool_filter import ToolFilter, docstring_tags
+
+
+def test_list_tools_by_tag_and_segment():
+    app = HubspotApp(tool_filter=ToolFilter(tags=["search", "Basic"], segments=["crm"]))
+    tools = app.list_tools()
+    names = {tool.__name__ for tool in tools}
+    assert "search_deals" in names and "get_contacts" in names
+    assert "create_contacts_batch" not in names
+    assert all(tool.__self__ is app.crm for tool in tools)
+    assert all({"search", "basic"} & {tag.lower() for tag in docstring_tags(tool)} for tool in tools)
+
+
+def test_exclude_rules_and_lazy_registration():
+    app = HubspotApp(tool_filter=ToolFilter(exclude_tags=["Batch"], exclude_segments=["marketing"]))
+    names = {tool.__name__ for tool in app.list_tools()}
+    assert "create_contacts_batch" not in names
+    assert "add_a_note" in names
+    assert "get_marketing_campaigns" not in names
+
+    manager = ManifestToolManager()
+    manager.register_tools_from_app(app, tags=["all"])
+    assert {tool.name for tool in manager.list_tools(format="mcp")} == {f"hubspot_{name}" for name in names}
+
+
+def test_filter_from_env(monkeypatch):
+    assert ToolFilter.from_env() is None
+    monkeypatch.setenv("HUBSPOT_TOOL_TAGS", "Search, Basic")
+    tool_filter = ToolFilter.from_env()
+    assert tool_filter.matches("crm", ["Search"])
+    assert not tool_filter.matches("crm", ["Batch"])
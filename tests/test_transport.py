@@ -0,0 +1,65 @@
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "method": request.method,
+            "path": request.url.path,
+            "contentType": request.headers.get("content-type"),
+        },
+    )
+
+
+@pytest.fixture
+def app_instance(make_app):
+    return make_app(handler=echo)
+
+
+def test_async_twins_are_generated(app_instance):
+    assert inspect.iscoroutinefunction(app_instance.crm.aget_contact_by_id)
+    assert inspect.iscoroutinefunction(app_instance.marketing.aget_marketing_campaigns)
+    assert inspect.iscoroutinefunction(app_instance.aadd_a_note)
+    assert app_instance.crm.aget_contact_by_id.__name__ == "get_contact_by_id"
+    assert not hasattr(app_instance.crm, "alist_tools")
+
+
+def test_async_twin_sends_on_async_client(app_instance):
+    result = asyncio.run(app_instance.crm.aget_contact_by_id("101"))
+    assert result["method"] == "GET"
+    assert result["path"] == "/crm/v3/objects/contacts/101"
+
+
+def test_async_twin_keeps_argument_validation(app_instance):
+    with pytest.raises(ValueError):
+        asyncio.run(app_instance.crm.aget_contact_by_id(None))
+
+
+def test_multipart_requests_get_boundary_content_type(app_instance):
+    result = app_instance.crm.create_crm_import(files=b"email\nme@example.com", importRequest="{}")
+    assert result["contentType"].startswith("multipart/form-data; boundary=")
+
+
+def test_multipart_boundary_survives_default_json_headers(app_instance):
+    # The real clients send the app's headers, including Content-Type: application/json, by default
+    headers = app_instance._get_headers()
+    assert headers.get("Content-Type") == "application/json"
+    app_instance._client = httpx.Client(transport=httpx.MockTransport(echo), headers=headers)
+    app_instance._async_client = httpx.AsyncClient(transport=httpx.MockTransport(echo), headers=headers)
+    files = b"email\nme@example.com"
+    result = app_instance.crm.create_crm_import(files=files, importRequest="{}")
+    assert result["contentType"].startswith("multipart/form-data; boundary=")
+    result = asyncio.run(app_instance.crm.acreate_crm_import(files=files, importRequest="{}"))
+    assert result["contentType"].startswith("multipart/form-data; boundary=")
+
+
+def test_async_tools_keep_tool_names(app_instance):
+    app_instance.async_tools = True
+    tools = app_instance.list_tools()
+    assert all(inspect.iscoroutinefunction(tool) for tool in tools)
+    assert "add_a_note" in {tool.__name__ for tool in tools}